@@ -1,84 +1,32 @@
 import streamlit as st 
 import pandas as pd
-import time
-import matplotlib.pyplot as plt
 import io
+import sys
+from pathlib import Path
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+# root repo supaya modul nike_analytics bisa di-import dari folder 3_tugas
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from nike_analytics.browser_pool import BrowserPool, scrape_pages_browser
+from nike_analytics.charts import histogram_png
 
 
 st.set_page_config(layout="wide")
 st.title("👟 Nike Advanced Scraping Dashboard")
 
 
-# =========================
-# Helper
-# =========================
-
-def clean_price(text):
-    num = ''.join(c for c in text if c.isdigit())
-    return int(num) if num else 0
-
-
-def auto_scroll(driver, times=4):
-    for _ in range(times):
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(2)
-
-
 # =========================
 # Scraper
 # =========================
 
-def scrape_nike(max_pages):
-
-    options = webdriver.ChromeOptions()
-    options.add_argument("--headless")
-    options.add_argument("--window-size=1920,1080")
-
-    driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()),
-        options=options
-    )
-
-    all_products = []
+# Pool Chrome headless hidup lintas rerun; tunggu berbasis kondisi (bukan sleep)
+# dan semua kartu diambil dengan satu eksekusi JavaScript per halaman
+@st.cache_resource
+def get_browser_pool():
+    return BrowserPool(size=2)
 
-    for page in range(max_pages):
 
-        url = f"https://www.nike.com/w/mens-shoes-nik1zy7ok?offset={page*24}"
-        driver.get(url)
-
-        time.sleep(4)
-        auto_scroll(driver)
-
-        cards = driver.find_elements(By.CSS_SELECTOR, "div.product-card")
-
-        for card in cards:
-            try:
-                name = card.find_element(By.CSS_SELECTOR, ".product-card__title").text
-                price_text = card.find_element(By.CSS_SELECTOR, ".product-price").text
-                price = clean_price(price_text)
-                link = card.find_element(By.TAG_NAME, "a").get_attribute("href")
-                img = card.find_element(By.TAG_NAME, "img").get_attribute("src")
-
-                all_products.append([name, price_text, price, link, img])
-
-            except:
-                pass
-
-        time.sleep(2)
-
-    driver.quit()
-
-    df = pd.DataFrame(
-        all_products,
-        columns=["Nama", "Harga Text", "Harga Angka", "Link", "Gambar"]
-    )
-
-    return df
+def scrape_nike(max_pages):
+    return scrape_pages_browser(get_browser_pool(), max_pages)
 
 
 # =========================
@@ -109,9 +57,7 @@ if st.button("🚀 Mulai Scraping"):
     # =========================
     st.subheader("📊 Grafik Distribusi Harga")
 
-    fig, ax = plt.subplots()
-    ax.hist(df["Harga Angka"], bins=10)
-    st.pyplot(fig)
+    st.image(histogram_png(df["Harga Angka"], bins=10))
 
 
     # =========================
@@ -122,7 +68,9 @@ if st.button("🚀 Mulai Scraping"):
     cols = st.columns(4)
     for i, row in df.head(8).iterrows():
         with cols[i % 4]:
-            st.image(row["Gambar"], width=150)
+            # kartu tanpa <img> punya URL gambar kosong
+            if row["Gambar"]:
+                st.image(row["Gambar"], width=150)
             st.write(row["Nama"])
             st.write(row["Harga Text"])
 
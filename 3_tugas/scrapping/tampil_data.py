@@ -9,31 +9,32 @@ import streamlit as st
 import warnings
 warnings.simplefilter(action='ignore', category=FutureWarning)
 
-# Membaca file excel
-df = pd.read_csv("dataset keggle/data_hasil_scrapping.csv")
+import sys
+from pathlib import Path
 
-# pengecekan apakah ada list yang duplikat
-sama = df[df.duplicated()]
+# root repo supaya modul nike_analytics bisa di-import dari folder 3_tugas
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from nike_analytics import KURS, enrich, load_sales_data
+from nike_analytics.data_loader import BASE_COLUMNS, DERIVED_COLUMNS, footprint, row_count
+from nike_analytics.table_view import paged_dataframe
+
+# Membaca file CSV (cached lintas rerun, frame ringkas tanpa kolom turunan;
+# kolom IDR & kategori dihitung per halaman yang tampil)
+df = load_sales_data(columns=BASE_COLUMNS)
 
-# Data Cleaning (Mengecek apakah ada data yang sama atau kosong)
-df = df.drop_duplicates()
-df.columns = df.columns.str.strip()
-df['State'] = df['State'].str.strip().str.title()
+# pengecekan apakah ada list yang duplikat
+duplikat = df.duplicated().to_numpy()
+sama = df[duplikat]
 
-# Perhitungan Kolom IDR
-kurs = 16900
-df["Total Sales IDR"] = df["Total Sales"] * kurs
-df["price per unit IDR"] = df["Price per Unit"] * kurs
+# Data Cleaning (Mengecek apakah ada data yang sama atau kosong):
+# baris unik dipilih lewat posisi, frame cache tidak disalin
+posisi_unik = np.flatnonzero(~duplikat)
 
-# Membuat kolom kategori berdasarkan Units Sold
-df["kategori"] = df["Units Sold"].apply(
-    lambda x: "Kurang Laku" if x < 50
-    else "Laku" if x <= 80
-    else "Sangat Laku" 
-)
 
-# perbaikan jika ada spasi 
-df.columns = df.columns.str.strip()
+def rapikan_halaman(halaman):
+    # State dirapikan (strip + Title Case) hanya untuk halaman yang tampil
+    halaman['State'] = halaman['State'].astype(str).str.strip().str.title()
+    return enrich(halaman, KURS)
 
 # membuat judul
 st.set_page_config(layout="wide")
@@ -43,13 +44,15 @@ st.title("isi list dan kolom dari dataset Nike")
 st.subheader("Data Product Nike")
 
 # dimensi dataset
-row, columns = df.shape
+row, columns = len(posisi_unik), df.shape[1] + len(DERIVED_COLUMNS)
 st.write(f'Listings terdiri atas {row} baris dan {columns} kolom')
+mem_total, mem_baris = footprint(df)
+st.caption(f"Memori frame: {mem_total / 1e6:,.2f} MB ({mem_baris:.0f} byte/baris)")
 
-# menampilkan dataframe
-st.dataframe(df, column_config={
+# menampilkan dataframe per halaman (hanya halaman aktif yang dikirim ke browser)
+paged_dataframe(df, posisi_unik, key="tampil_data", column_config={
     "Waktu Transaksi": st.column_config.DateColumn(format="DD/MM/YYYY") #Membuat  tanggal sesuai urutan
-})
+}, total_rows=row_count(), derive=rapikan_halaman, derived_columns=DERIVED_COLUMNS)
 
 # cek jumlah data unik pada State
 state_unique = df['Region'].nunique()
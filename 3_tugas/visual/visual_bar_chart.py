@@ -1,50 +1,40 @@
 # import library yang dibutuhkan
 import pandas as pd
 import numpy as np
-import seaborn as sns
-import matplotlib.pyplot as plt
 import streamlit as st
 
 # import library untuk ignore future warning
 import warnings
 warnings.simplefilter(action='ignore', category=FutureWarning)
 
-# Membaca file CSV yang baru
-df = pd.read_csv("dataset keggle/data_hasil_scrapping.csv")
+import sys
+from pathlib import Path
 
-# pengecekan apakah ada list yang duplikat dan menghapusnya
-df = df.drop_duplicates()
+# root repo supaya modul nike_analytics bisa di-import dari folder 3_tugas
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from nike_analytics import load_sales_data
+from nike_analytics.charts import regional_bar_png
+from nike_analytics.data_loader import BASE_COLUMNS
 
-# perbaikan jika ada spasi pada nama kolom
-df.columns = df.columns.str.strip()
+# Membaca file CSV yang baru (cached lintas rerun, nama kolom sudah di-strip)
+df = load_sales_data(columns=BASE_COLUMNS)
+
+# pengecekan apakah ada list yang duplikat (baris unik dipilih lewat mask, tanpa salin frame)
+unik = ~df.duplicated().to_numpy()
 
 # Mengambil data kolom redion dan Total Sales
-regional_performance = df.groupby('Region')['Total Sales'].sum().sort_values(ascending=True)
+regional_performance = (
+    df['Total Sales'][unik]
+    .groupby(df['Region'][unik], observed=True).sum()
+    .sort_values(ascending=True)
+)
 
 # menambahkan judul
 st.header("Analisis Performa Penjualan Berdasarkan Wilayah")
 
-# Membuat visualisasi menggumanak mathlotib
-fig, ax = plt.subplots(figsize=(10, 6))
-
-# Membuat horizontal bar chart
-colors = sns.color_palette("viridis", len(regional_performance))
-regional_performance.plot(kind='barh', color=colors, ax=ax)
-
-# Menambahkan label dan judul
-ax.set_title('Total Sales per Region', fontsize=14, pad=15)
-ax.set_xlabel('Total Sales (USD)', fontsize=12)
-ax.set_ylabel('Region', fontsize=12)
-
-# Menambahkan anotasi nilai di ujung bar
-for i, v in enumerate(regional_performance):
-    ax.text(v, i, f' {v:,.0f}', va='center', fontsize=10)
-
-# Menyesuaikan tata letak agar tidak terpotong
-plt.tight_layout()
-
-# Tampilkan di Streamlit
-st.pyplot(fig)
+# Membuat horizontal bar chart (judul, label & anotasi nilai di ujung bar).
+# PNG di-cache per data agregat dan figure langsung dilepas setelah dirender
+st.image(regional_bar_png(regional_performance, "visual"), use_container_width=True)
 
 # Tampilkan data ringkasan dalam bentuk metrik
 col1, col2 = st.columns(2)
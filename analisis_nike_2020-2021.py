@@ -1,89 +1,96 @@
 # ==========================================
 # 1. IMPORT LIBRARY
 # ==========================================
+# Hanya modul ringan yang diimpor di sini supaya shell dashboard langsung
+# tampil. Subsistem berat diimpor saat pertama dipakai:
+#   - scraper (requests / parser HTML) -> saat tombol "Mulai Scraping"
+#   - grafik (matplotlib)              -> saat PNG pertama dirender (charts.py)
+#   - GIS (folium / streamlit_folium)  -> saat tab Peta dibuka
+#   - data historis (CSV / DuckDB)     -> setelah shell dirender, di bagian 2
+# Durasi tiap tahap tercatat di nike_analytics/startup.py (sidebar); detail
+# per rerun (baris, memori, file trace) lewat nike_analytics/instrumentasi.py
+# saat mode debug di sidebar dinyalakan.
 import pandas as pd
 import numpy as np
-import seaborn as sns
-import matplotlib.pyplot as plt
 import streamlit as st
-import folium
-from streamlit_folium import st_folium
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 import warnings
 import time
 import io
-import requests
-from bs4 import BeautifulSoup
+
+from nike_analytics import KURS
+from nike_analytics.data_loader import ROOT_DIR
+from nike_analytics.instrumentasi import instrumen, mulai_rerun, tahap, trace_json
+from nike_analytics.instrumentasi import tabel as tabel_tahap
+from nike_analytics.startup import tabel_profil
+from nike_analytics.table_view import paged_table
+# charts sendiri ringan: matplotlib baru diimpor saat PNG pertama dirender
+from nike_analytics.charts import BACKENDS as CHART_BACKENDS
 
 # Ignore future warnings
 warnings.simplefilter(action='ignore', category=FutureWarning)
 
+# Folder hasil scraping (JSONL append-only per sesi scraping)
+SCRAPE_DIR = ROOT_DIR / ".cache" / "scrape_runs"
+
+# Jumlah rerun terakhir yang ikut diekspor ke file trace
+RIWAYAT_TRACE = 20
+
 # ==========================================
 # FUNGSI HELPER SCRAPING
 # ==========================================
-def clean_price(text):
-    num = ''.join(c for c in text if c.isdigit())
-    return int(num) if num else 0
-
 def auto_scroll(driver, times=4):
     for _ in range(times):
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
         time.sleep(2)
 
-def scrape_nike(max_pages):
-    headers = {
-        "User-Agent": "Mozilla/5.0"
-    }
+@instrumen("scrape_nike", rows=len)
+def scrape_nike(max_pages, incremental=True):
+    # Halaman diambil paralel (lihat nike_analytics/scraper.py) dan tiap
+    # halaman yang selesai langsung tampil di tabel + ditulis ke file JSONL.
+    # incremental: conditional request + cache lokal produk per Link
+    with tahap("impor scraper"):
+        from nike_analytics.scraper import JsonlSink, iter_scrape_batches
+        from nike_analytics.scrape_cache import ScrapeCache
 
-    all_products = []
     progress_bar = st.progress(0)
     status_text = st.empty()
-
-    for page in range(max_pages):
-
-        status_text.caption(f"Sedang memproses halaman {page + 1} dari {max_pages}...")
-
-        offset = page * 24
-        url = f"https://www.nike.com/w/mens-shoes-nik1zy7ok?offset={offset}"
-
-        try:
-            res = requests.get(url, headers=headers, timeout=10)
-            soup = BeautifulSoup(res.text, "html.parser")
-
-            cards = soup.select("div.product-card")
-
-            for card in cards:
-                try:
-                    name = card.select_one(".product-card__title").get_text(strip=True)
-                    price_text = card.select_one(".product-price").get_text(strip=True)
-                    price = clean_price(price_text)
-
-                    link = card.select_one("a")["href"]
-                    if not link.startswith("http"):
-                        link = "https://www.nike.com" + link
-
-                    img_tag = card.select_one("img")
-                    img = img_tag["src"] if img_tag else ""
-
-                    all_products.append([name, price_text, price, link, img])
-
-                except:
-                    pass
-
-        except:
-            st.warning(f"Gagal ambil halaman {page+1}")
-
-        progress_bar.progress((page + 1) / max_pages)
-        time.sleep(1)
+    table_slot = st.empty()
+    # Tiap batch baru ditambahkan sebagai tabel sendiri di bawah batch
+    # sebelumnya: kerja per halaman sebanding ukuran batch itu saja, hasil
+    # lengkap dibaca ulang dari file JSONL setelah selesai
+    live = table_slot.container(height=400)
+
+    cache = ScrapeCache() if incremental else None
+    sink = JsonlSink(SCRAPE_DIR / f"nike_live_{time.strftime('%Y%m%d-%H%M%S')}.jsonl")
+    try:
+        stream = iter_scrape_batches(max_pages, cache=cache)
+        for done, (page, batch, error) in enumerate(stream, start=1):
+            if error:
+                st.warning(f"Gagal ambil halaman {page+1}: {error}")
+            elif not batch.empty:
+                sink.write(batch, page)
+                with tahap("render tabel scraping", rows=len(batch)):
+                    live.caption(f"Halaman {page+1}: {len(batch)} produk")
+                    live.dataframe(batch, use_container_width=True, hide_index=True)
+            status_text.caption(f"Sedang memproses halaman {done} dari {max_pages}...")
+            progress_bar.progress(done / max_pages)
+    finally:
+        if cache is not None:
+            cache.close()
+
+    if cache is not None:
+        stats = cache.stats
+        st.caption(
+            f"Halaman tidak berubah (304): {stats['halaman_304']} · "
+            f"produk baru: {stats['produk_baru']} · produk berubah: {stats['produk_berubah']}"
+        )
 
     progress_bar.empty()
     status_text.empty()
+    table_slot.empty()
 
-    df_res = pd.DataFrame(
-        all_products,
-        columns=["Nama", "Harga Text", "Harga Angka", "Link", "Gambar"]
-    )
-
-    return df_res
+    return sink.baca()
 
 # ==========================================
 # KONFIGURASI HALAMAN & DATA LOAD
@@ -91,37 +98,25 @@ def scrape_nike(max_pages):
 st.set_page_config(layout="wide", page_title="Nike Analytics Suite")
 st.title("Dashboard Analisis Product Nike")
 
-# Load Data Historis
-try:
-    df = pd.read_csv("data_hasil_scrapping.csv")
-except:
-    try:
-        df = pd.read_csv("dataset keggle/data_hasil_scrapping.csv")
-    except:
-        st.error("File CSV tidak ditemukan.")
-        df = pd.DataFrame()
-
-# Data Cleaning
-
-if not df.empty:
-    df["Invoice Date"] = pd.to_datetime(
-        df["Invoice Date"],
-        format="%d-%m-%Y",
-        errors="coerce"
-    )
-
-    # Hitung Kurs
-    kurs = 16900
-    if "Total Sales" in df.columns:
-        df["Total Sales IDR"] = df["Total Sales"] * kurs
-    if "Price per Unit" in df.columns:
-        df["price per unit IDR"] = df["Price per Unit"] * kurs
-
-    # Kategori
-    if "Units Sold" in df.columns:
-        df["kategori"] = df["Units Sold"].apply(
-            lambda x: "Kurang Laku" if x < 50 else "Laku" if x <= 80 else "Sangat Laku" 
-        )
+# Mode debug (toggle di panel debug, bawah sidebar): catat tiap tahap rerun ini
+# (tracemalloc dibagi semua sesi -> permintaan memori dicatat per id sesi)
+debug = st.session_state.get("debug_instrumentasi", False)
+ctx = get_script_run_ctx()
+run_tahap = mulai_rerun(
+    debug, memori=st.session_state.get("debug_memori", False), sesi=ctx.session_id if ctx else None,
+)
+
+# Kurs USD -> IDR untuk kolom "Total Sales IDR" & "price per unit IDR"
+kurs = st.sidebar.number_input("Kurs USD → IDR", min_value=1.0, value=float(KURS), step=100.0)
+
+# matplotlib = PNG di-render server (cached), vega-lite = dirender di browser
+backend_grafik = st.sidebar.selectbox("Backend grafik", CHART_BACKENDS)
+
+# pandas = frame penuh di memori, duckdb = query dijalankan di database lokal
+with tahap("impor backend query"):
+    from nike_analytics.backends import available_backends, get_backend
+backend_query = st.sidebar.selectbox("Backend query", available_backends())
+memori_slot = st.sidebar.empty()
 
 # ==========================================
 # BAGIAN 1: LIVE SCRAPER PANEL
@@ -141,9 +136,25 @@ with st.expander("Buka Panel Scrapping", expanded=False):
         st.write("")
         btn_start = st.button("🚀 Mulai Scraping", use_container_width=True)
 
+    incremental_in = st.checkbox("♻️ Mode incremental (pakai cache lokal)", value=True)
+
     if btn_start:
         with st.spinner("Sedang scraping..."):
-            df_s = scrape_nike(pages_in)
+            df_s = scrape_nike(pages_in, incremental_in)
+
+        # Gambar produk langsung diunduh paralel + diperkecil ke cache
+        # thumbnail di disk; tab Preview hanya memakai file thumbnail lokal
+        from nike_analytics.thumbnails import ThumbnailCache
+        thumbs = ThumbnailCache()
+        if not df_s.empty:
+            with st.spinner("Menyiapkan thumbnail..."), tahap("prefetch thumbnail") as t:
+                stats_thumb = thumbs.prefetch(df_s["Gambar"])
+                t.rows = stats_thumb["unduh"]
+            st.caption(
+                f"Thumbnail: {stats_thumb['hit']} dari cache · {stats_thumb['unduh']} diunduh "
+                f"({stats_thumb['byte_asli'] / 1e6:,.1f} MB → {stats_thumb['byte_thumb'] / 1e6:,.2f} MB) · "
+                f"{stats_thumb['gagal']} gagal · {stats_thumb['detik']:.1f} s"
+            )
         
         if not df_s.empty:
             if key_in:
@@ -158,16 +169,21 @@ with st.expander("Buka Panel Scrapping", expanded=False):
                 csv = df_s.to_csv(index=False).encode("utf-8")
                 st.download_button("Download CSV", csv, "nike_live.csv", "text/csv")
             
-            with t2:
-                fig, ax = plt.subplots()
-                ax.hist(df_s["Harga Angka"], color="orange")
-                st.pyplot(fig)
+            with t2, tahap("grafik harga", rows=len(df_s)):
+                from nike_analytics.charts import histogram_png, histogram_spec
+                if backend_grafik == "vega-lite":
+                    st.vega_lite_chart(histogram_spec(df_s["Harga Angka"], color="orange"), use_container_width=True)
+                else:
+                    st.image(histogram_png(df_s["Harga Angka"], color="orange"))
             
-            with t3:
+            with t3, tahap("preview thumbnail", rows=min(8, len(df_s))):
                 cols = st.columns(4)
                 for i, r in df_s.head(8).iterrows():
                     with cols[i%4]:
-                        if r["Gambar"]: st.image(r["Gambar"])
+                        # gambar yang gagal diunduh tetap tampil dari URL asli
+                        thumb = thumbs.get(r["Gambar"])
+                        if thumb: st.image(str(thumb))
+                        elif r["Gambar"]: st.image(r["Gambar"])
                         st.caption(f"{r['Nama']} - {r['Harga Text']}")
 
 # ==========================================
@@ -193,198 +209,233 @@ with st.expander("Panel Cari Produk", expanded=False):
         st.write("") 
         btn_search_hist = st.button("🔍 Cari Produk", use_container_width=True)
 
-    # Inisialisasi DataFrame untuk ditampilkan
-# Inisialisasi DataFrame untuk ditampilkan
-if not df.empty:
-
-    df_display = df.copy()
+# Load Data Historis setelah shell (judul, sidebar, panel scraping) tampil.
+# Cached: rerun tidak membaca ulang CSV kalau file tidak berubah.
+try:
+    with st.spinner("Memuat data historis..."), tahap("data historis") as t:
+        backend = get_backend(backend_query)
+        t.rows = backend.total_rows
+except FileNotFoundError:
+    st.error("File CSV tidak ditemukan.")
+    backend = None
+
+if backend is not None:
+    memori_slot.caption(f"Memori data ({backend.name}): {backend.footprint() / 1e6:,.2f} MB")
+
+    # Semua tab menjawab lewat backend query (pandas: cube + index nama produk,
+    # duckdb: query SQL); kata kunci pencarian jadi filter untuk semua tab.
+    # Tabel Overview hanya mengambil potongan halaman aktif.
+    filter_produk = query_historis or None
+    with tahap("cari produk") as t:
+        n_display = backend.count(filter_produk)
+        t.rows = n_display
 
     # filter kalau ada keyword
-    if query_historis:
-        mask = (
-            df["Product"]
-            .astype(str)
-            .str.lower()
-            .str.contains(query_historis.lower(), na=False)
-        )
-        df_display = df[mask]
-
-        st.info(f"Ditemukan **{len(df_display)}** data untuk kata kunci: '{query_historis}'")
+    if filter_produk:
+        st.info(f"Ditemukan **{n_display}** data untuk kata kunci: '{query_historis}'")
 
     # =========================
     # TABS SELALU TAMPIL (LUAR IF)
     # =========================
-    tab_overview, tab_top, tab_region, tab_map = st.tabs([
+    # on_change="rerun": hanya isi tab yang sedang dibuka yang dijalankan
+    # (tab.open), jadi GIS / tren / agregat tidak dihitung sebelum dibuka
+    tab_overview, tab_top, tab_region, tab_map, tab_tren = st.tabs([
         "📊 Overview Data",
         "🏆 Top Produk",
         "🌎 Analisis Wilayah",
-        "📍 Peta Sebaran (GIS)"
-    ])
+        "📍 Peta Sebaran (GIS)",
+        "📈 Tren Waktu"
+    ], key="tab_historis", on_change="rerun")
 
 
     # 1. Overview
-    with tab_overview:
-            st.write(f"Menampilkan **{df_display.shape[0]}** baris data.")
-            st.dataframe(
-                df_display, 
-                use_container_width=True,
-                column_config={"Invoice Date": st.column_config.DateColumn(format="DD/MM/YYYY")}
+    if tab_overview.open:
+        with tab_overview, tahap("tab Overview"):
+            st.write(f"Menampilkan **{n_display}** baris data.")
+            paged_table(
+                lambda sort_by, ascending, offset, limit: backend.page(filter_produk, sort_by, ascending, offset, limit, kurs),
+                n_display,
+                backend.columns,
+                key="overview",
+                column_config={"Invoice Date": st.column_config.DateColumn(format="DD/MM/YYYY")},
+                total_rows=backend.total_rows,
             )
 
         # 2. Top Produk
-    with tab_top:
+    if tab_top.open:
+        with tab_top, tahap("tab Top Produk"):
             st.markdown("#### Top Produk Berdasarkan Kategori")
-            produk_total = (
-                df_display.groupby("Product")["Units Sold"]
-                .sum().sort_values(ascending=False).reset_index()
-            )
+            with tahap("query top produk") as t:
+                produk_total = backend.top_products(filter_produk)
+                t.rows = len(produk_total)
             if not produk_total.empty:
                 n = len(produk_total)
                 bagi = max(1, n // 3)
-                c_top1, c_top2, c_top3 = st.columns(3)
-                with c_top1:
-                    st.success("🔥 **Sangat Laku**")
-                    st.dataframe(produk_total.iloc[:bagi], use_container_width=True, hide_index=True)
-                with c_top2:
-                    st.warning("👍 **Laku**")
-                    st.dataframe(produk_total.iloc[bagi:bagi*2], use_container_width=True, hide_index=True)
-                with c_top3:
-                    st.error("❄️ **Kurang Laku**")
-                    st.dataframe(produk_total.iloc[bagi*2:], use_container_width=True, hide_index=True)
+                with tahap("render top produk", rows=n):
+                    c_top1, c_top2, c_top3 = st.columns(3)
+                    with c_top1:
+                        st.success("🔥 **Sangat Laku**")
+                        st.dataframe(produk_total.iloc[:bagi], use_container_width=True, hide_index=True)
+                    with c_top2:
+                        st.warning("👍 **Laku**")
+                        st.dataframe(produk_total.iloc[bagi:bagi*2], use_container_width=True, hide_index=True)
+                    with c_top3:
+                        st.error("❄️ **Kurang Laku**")
+                        st.dataframe(produk_total.iloc[bagi*2:], use_container_width=True, hide_index=True)
 
         # 3. Analisis Wilayah
-    with tab_region:
+    if tab_region.open:
+        with tab_region, tahap("tab Analisis Wilayah"):
             st.markdown("#### Performa Penjualan Regional")
-            if not df_display.empty:
-                regional_perf = df_display.groupby('Region')['Total Sales'].sum().sort_values(ascending=True)
+            from nike_analytics.charts import regional_bar_png, regional_bar_spec
+            with tahap("query wilayah") as t:
+                regional_stats = backend.regional(filter_produk)
+                t.rows = len(regional_stats)
+            if not regional_stats.empty:
+                regional_perf = regional_stats['Total Sales'].sort_values(ascending=True)
                 rc1, rc2 = st.columns([2, 1])
-                with rc1:
-                    fig_reg, ax_reg = plt.subplots(figsize=(8, 4))
-                    colors = sns.color_palette("viridis", len(regional_perf))
-                    regional_perf.plot(kind='barh', color=colors, ax=ax_reg)
-                    st.pyplot(fig_reg)
+                with rc1, tahap("grafik wilayah", rows=len(regional_perf)):
+                    # PNG di-cache per data agregat; vega-lite dirender di browser
+                    if backend_grafik == "vega-lite":
+                        st.vega_lite_chart(regional_bar_spec(regional_perf), use_container_width=True)
+                    else:
+                        st.image(regional_bar_png(regional_perf), use_container_width=True)
                 with rc2:
-                    st.metric("Total Sales (USD)", f"${df_display['Total Sales'].sum():,.0f}")
-                    st.metric("Total Sales (IDR)", f"Rp {df_display['Total Sales IDR'].sum():,.0f}")
+                    st.metric("Total Sales (USD)", f"${regional_perf.sum():,.0f}")
+                    st.metric("Total Sales (IDR)", f"Rp {regional_perf.sum() * kurs:,.0f}")
 
             show_table = st.checkbox("📋 Tampilkan tabel detail per wilayah")
 
             if show_table:
                 regional_table = (
-                df_display
-                .groupby("Region")
-                .agg({
-                    "Units Sold": "sum",
-                    "Total Sales": "sum",
-                    "Total Sales IDR": "sum"
-                })
+                regional_stats
+                .assign(**{"Total Sales IDR": regional_stats["Total Sales"] * kurs})
                 .reset_index()
                 .sort_values("Total Sales", ascending=False)
             )
 
-                st.dataframe(regional_table, use_container_width=True)
+                with tahap("render tabel wilayah", rows=len(regional_table)):
+                    st.dataframe(regional_table, use_container_width=True)
 
         
 
         # 4. Peta GIS
 
-    with tab_map:
+    if tab_map.open:
+        with tab_map, tahap("tab Peta GIS"):
+
+            st.markdown("#### 📍 Peta Sebaran Penjualan USA")
+
+            # folium + streamlit_folium (paling berat) baru diimpor di sini
+            with tahap("impor GIS"):
+                from streamlit_folium import st_folium
+                from nike_analytics.peta import ZOOM_START, base_map, state_points
+                from nike_analytics.geo_layers import choropleth_layer, cluster_layer
+
+            with tahap("query state") as t:
+                state_stats = backend.state_stats(filter_produk)
+                t.rows = len(state_stats)
+
+            if not state_stats.empty:
+
+                # Base map di-cache; layer dinamis = choropleth batas state
+                # (geometri disederhanakan sesuai zoom) + marker cluster per state
+                with tahap("layer peta", rows=len(state_stats)):
+                    m = base_map("dashboard", regions=False)
+                    zoom = st.session_state.get("peta_zoom", ZOOM_START)
+                    layers = [
+                        choropleth_layer(state_stats, zoom),
+                        cluster_layer(state_points(state_stats, "dashboard")),
+                    ]
+
+                with tahap("st_folium"):
+                    peta_state = st_folium(
+                        m,
+                        feature_group_to_add=layers,
+                        width="100%",
+                        height=650,
+                        key="peta_dashboard",
+                        returned_objects=["zoom"],
+                    )
+                if peta_state and peta_state.get("zoom"):
+                    st.session_state["peta_zoom"] = peta_state["zoom"]
+
+            else:
+                st.info("Tidak ada data untuk ditampilkan.")
+
+    # 5. Tren Waktu (dari bucket harian yang sudah dihitung, bukan frame invoice)
+    if tab_tren.open:
+        with tab_tren, tahap("tab Tren Waktu"):
+
+            st.markdown("#### 📈 Tren Penjualan")
+            from nike_analytics.timeseries import FREKUENSI, TANGGAL, filter_buckets, produk_cocok, rolling_mean, tren, yoy
+
+            with tahap("bucket harian") as t:
+                buckets = backend.time_buckets()
+                t.rows = len(buckets)
+
+            if not buckets.empty:
+                tgl_min = buckets[TANGGAL].iloc[0].date()
+                tgl_max = buckets[TANGGAL].iloc[-1].date()
+
+                tc1, tc2, tc3, tc4 = st.columns(4)
+                with tc1:
+                    periode = st.selectbox("Periode", list(FREKUENSI), index=1, key="tren_periode")
+                with tc2:
+                    ukuran = st.selectbox("Ukuran", ["Total Sales", "Units Sold", "Transaksi"], key="tren_ukuran")
+                with tc3:
+                    pecah = st.selectbox("Pecah per", ["(total)", "Product", "Region"], key="tren_pecah")
+                with tc4:
+                    window = st.number_input("Rolling average (periode)", 1, 52, 1, key="tren_window")
+
+                rentang = st.date_input(
+                    "Rentang tanggal", (tgl_min, tgl_max), min_value=tgl_min, max_value=tgl_max, key="tren_rentang"
+                )
+                # selama user baru memilih tanggal awal, rentang berisi 1 tanggal
+                start, end = rentang if len(rentang) == 2 else (rentang[0], tgl_max)
+
+                with tahap("agregasi tren") as t:
+                    produk_tren = produk_cocok(buckets, filter_produk) if filter_produk else None
+                    data_tren = filter_buckets(buckets, start, end, produk_tren)
+                    hasil_tren = tren(data_tren, FREKUENSI[periode], None if pecah == "(total)" else pecah, ukuran)
+                    if window > 1:
+                        hasil_tren = rolling_mean(hasil_tren, window)
+                    t.rows = len(data_tren)
+                with tahap("grafik tren", rows=len(hasil_tren)):
+                    st.line_chart(hasil_tren)
+
+                st.markdown("##### Perbandingan Year-over-Year (2020 vs 2021)")
+                with tahap("agregasi yoy"):
+                    hasil_yoy = yoy(filter_buckets(buckets, products=produk_tren), measure=ukuran)
+                yc1, yc2 = st.columns([2, 1])
+                with yc1:
+                    st.bar_chart(hasil_yoy.drop(columns="YoY %").rename(columns=str), stack=False)
+                with yc2:
+                    st.dataframe(hasil_yoy.rename(columns=str), use_container_width=True)
+            else:
+                st.info("Tidak ada data tanggal untuk ditampilkan.")
 
-        st.markdown("#### 📍 Peta Sebaran Penjualan USA")
-
-        if not df_display.empty:
-
-            state_stats = df_display.groupby('State').agg({
-                'Units Sold': 'sum',
-                'Total Sales': 'sum'
-            }).reset_index()
-
-            # ===============================
-            # MAP BASE
-            # ===============================
-            center_lat, center_lon = 37.0902, -95.7129
-
-            m = folium.Map(
-                location=[center_lat, center_lon],
-                zoom_start=4,
-                tiles="cartodbpositron"   # lebih clean & modern
-            )
-
-            # ===============================
-            # REGION POLYGON (rapih + soft color)
-            # ===============================
-            regions = [
-                {"name": "West", "coords": [[49,-125],[49,-111],[31,-111],[31,-125]], "color":"#2ecc71"},
-                {"name": "Midwest", "coords": [[49,-111],[49,-82],[37,-82],[37,-111]], "color":"#3498db"},
-                {"name": "Northeast", "coords": [[47.5,-82],[47.5,-67],[38,-67],[38,-82]], "color":"#9b59b6"},
-                {"name": "Southwest", "coords": [[42,-111],[42,-94],[25.5,-94],[31,-111]], "color":"#f39c12"},
-                {"name": "Southeast", "coords": [[37,-94],[38,-75],[24,-80],[24,-94]], "color":"#e74c3c"},
-            ]
-
-            for reg in regions:
-                folium.Polygon(
-                    locations=reg["coords"],
-                    color=reg["color"],
-                    weight=3,            # garis lebih tebal
-                    fill=True,
-                    fill_color=reg["color"],
-                    fill_opacity=0.15,   # lembut transparan
-                    tooltip=f"Region: {reg['name']}"
-                ).add_to(m)
-
-            # ===============================
-            # KOORDINAT STATE
-            # ===============================
-            selected_State_Coords = {
-                "California":[36.77,-119.41],"Texas":[31.96,-99.90],"New York":[43.29,-74.21],
-                "Illinois":[40.63,-89.39],"Pennsylvania":[41.20,-77.19],"Nevada":[38.80,-116.41],
-                "Colorado":[39.55,-105.78],"Washington":[47.75,-120.74],"Florida":[27.99,-81.76],
-                "Minnesota":[46.72,-94.68],"Montana":[46.87,-110.36],"Tennessee":[35.51,-86.58],
-                "Louisiana":[30.98,-91.96],"Virginia":[37.43,-78.65],"Oregon":[43.80,-120.55],
-                "Utah":[39.32,-111.09],"Iowa":[41.87,-93.09],"Michigan":[44.18,-84.50],
-                "Missouri":[38.57,-92.60],"Ohio":[40.41,-82.90],"Georgia":[32.16,-82.90],
-                "Arizona":[34.04,-111.09],"Kansas":[39.01,-98.48]
-            }
-
-            # ===============================
-            # MARKER (card popup seperti gambar 2)
-            # ===============================
-            for _, row in state_stats.iterrows():
-
-                s_name = row["State"]
-
-                if s_name in selected_State_Coords:
-
-                    units = row["Units Sold"]
-                    sales = row["Total Sales"]
-
-                    popup_html = f"""
-                    <div style="
-                        font-family: Arial;
-                        width: 190px;
-                        font-size: 13px;
-                    ">
-                        <h4 style="margin-bottom:6px;color:#e74c3c;">
-                            {s_name}
-                        </h4>
-                        <b>Units Sold:</b> {units:,.0f}<br>
-                        <b>Revenue:</b> ${sales:,.0f}
-                    </div>
-                    """
-
-                    folium.Marker(
-                        location=selected_State_Coords[s_name],
-                        popup=folium.Popup(popup_html, max_width=250),
-                        tooltip=s_name,
-                        icon=folium.Icon(
-                            color="red",
-                            icon="shopping-cart",
-                            prefix="fa"
-                        )
-                    ).add_to(m)
-
-            st_folium(m, width="100%", height=650)
-
-        else:
-            st.info("Tidak ada data untuk ditampilkan.")
+# ==========================================
+# PROFIL STARTUP
+# ==========================================
+# "Pertama" = cold start proses ini (impor + load data), "Terakhir" = rerun ini
+with st.sidebar.expander("⏱️ Profil startup", expanded=False):
+    st.dataframe(tabel_profil(), use_container_width=True, hide_index=True)
+    st.caption("Waktu impor per subsistem: python -m nike_analytics.startup")
 
+# ==========================================
+# PANEL DEBUG (INSTRUMENTASI PER TAHAP)
+# ==========================================
+# Saat mati, tahap() hanya mengukur durasi untuk profil startup di atas
+with st.sidebar.expander("🐞 Debug: instrumentasi per tahap", expanded=debug):
+    st.toggle("Catat tiap tahap (waktu, baris)", key="debug_instrumentasi")
+    st.checkbox("Ukur puncak memori (tracemalloc, lebih lambat)", key="debug_memori", disabled=not debug)
+    if run_tahap is not None:
+        riwayat = st.session_state.setdefault("debug_riwayat", [])
+        riwayat.append(run_tahap)
+        del riwayat[:-RIWAYAT_TRACE]
+        st.dataframe(tabel_tahap(run_tahap), use_container_width=True, hide_index=True)
+        st.download_button(
+            "⬇️ Export trace (JSON)", trace_json(riwayat), "nike_dashboard_trace.json", "application/json",
+            help=f"{len(riwayat)} rerun terakhir; buka di chrome://tracing atau ui.perfetto.dev",
+        )
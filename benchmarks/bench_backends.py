@@ -0,0 +1,68 @@
+# ==========================================
+# BENCHMARK: backend query dashboard historis, pandas vs DuckDB
+# ==========================================
+# Dataset sintetis Parquet N baris dari nike_analytics.synthetic (default 1M,
+# 10M, 50M; disimpan di .cache/bench/ dan dipakai ulang). Untuk tiap ukuran
+# diukur waktu load backend lalu query yang dipakai dashboard: pencarian
+# (count), Top Produk, Analisis Wilayah, agregat State dan satu halaman tabel
+# yang di-sort. Untuk duckdb, "load" di
+# run pertama termasuk impor ke file database; run berikutnya hanya membuka file.
+# Jalankan dari root repo:
+#   python benchmarks/bench_backends.py --rows 1000000 10000000 50000000
+#   python benchmarks/bench_backends.py --rows 50000000 --backend duckdb
+import argparse
+import resource
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from nike_analytics.backends import available_backends, get_backend
+from nike_analytics.synthetic import dataset_sintetis
+
+
+def ukur(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def bench_backend(name, path, query):
+    hasil = {}
+    start = time.perf_counter()
+    backend = get_backend(name, path)
+    hasil["load"] = time.perf_counter() - start
+    hasil["cari"] = ukur(lambda: backend.count(query))
+    hasil["top produk"] = ukur(lambda: backend.top_products(query))
+    hasil["wilayah"] = ukur(lambda: backend.regional(query))
+    hasil["state"] = ukur(lambda: backend.state_stats(query))
+    hasil["halaman"] = ukur(lambda: backend.page(query, "Total Sales", False, 1000, 100))
+    return hasil
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000, 10_000_000, 50_000_000])
+    parser.add_argument("--backend", nargs="+", default=list(available_backends()))
+    parser.add_argument("--query", default="street", help="kata kunci Cari Nama Produk")
+    args = parser.parse_args()
+
+    for n_rows in args.rows:
+        start = time.perf_counter()
+        path = dataset_sintetis(n_rows, "parquet")
+        print(f"\nbaris: {n_rows:,}  (dataset {path.stat().st_size / 1e6:,.0f} MB, "
+              f"siap dalam {time.perf_counter() - start:.1f} s)")
+        for name in args.backend:
+            try:
+                hasil = bench_backend(name, path, args.query)
+            except MemoryError:
+                print(f"{name:<7}: gagal (MemoryError)")
+                continue
+            detail = "  ".join(f"{k} {v:7.3f} s" for k, v in hasil.items())
+            print(f"{name:<7}: {detail}")
+        # maxrss Linux dalam KB; puncak untuk seluruh proses sejauh ini
+        print(f"puncak RSS proses: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3:,.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# ==========================================
+# BENCHMARK: pd.read_csv satu thread vs pembaca chunk paralel
+# ==========================================
+# CSV sintetis N baris (nike_analytics.synthetic, disimpan di .cache/bench/)
+# dibaca lalu direduksi ke rollup cube:
+#   - baseline : pd.read_csv seluruh file (dtype tetap) + build_cube
+#   - paralel  : chunked_reader.baca_paralel dengan 1, 2, 4, ... worker
+# Sebelumnya dicek dulu bahwa pembersihan jalur cepat (parse_chunk) sama
+# dengan ingest.validasi pada potongan kecil berisi nilai kotor / kosong.
+# Jalankan dari root repo:
+#   python benchmarks/bench_chunked_reader.py --rows 5000000 --workers 1 2 4 8
+import argparse
+import io
+import os
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from nike_analytics.chunked_reader import CHUNK_BYTES, baca_paralel, parse_chunk
+from nike_analytics.cube import build_cube
+from nike_analytics.data_loader import _parse_csv
+from nike_analytics.ingest import validasi
+from nike_analytics.synthetic import dataset_sintetis
+
+
+# State kotor: spasi, huruf kecil, kosong, dan hanya spasi (dua terakhir harus ditolak)
+CEK_HEADER = b"Invoice Date,Product,Region,Retailer,Sales Method,State,Price per Unit,Total Sales,Units Sold\n"
+CEK_CHUNK = b"".join(
+    b"01-01-2020,Men's Street Footwear,Northeast,Foot Locker,In-store," + state + b",50,6000,120\n"
+    for state in (b"new york ", b"", b"New York", b" ", b"Texas")
+)
+
+
+def cek_pembersihan():
+    cepat, ditolak_cepat = parse_chunk(CEK_HEADER, CEK_CHUNK)
+    lambat, ditolak_lambat = validasi(pd.read_csv(io.BytesIO(CEK_HEADER + CEK_CHUNK), dtype=str))
+    assert ditolak_cepat == ditolak_lambat == 2, (ditolak_cepat, ditolak_lambat)
+    state = cepat["State"].astype(str).tolist()
+    assert state == lambat["State"].astype(str).tolist() == ["New York", "New York", "Texas"], state
+    print(f"cek pembersihan: ok (ditolak {ditolak_cepat})")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    parser.add_argument("--chunk-mb", type=int, default=CHUNK_BYTES // (1024 * 1024))
+    args = parser.parse_args()
+
+    cek_pembersihan()
+    path = dataset_sintetis(args.rows)
+    size_mb = path.stat().st_size / 1e6
+    print(f"baris: {args.rows:,}  file: {size_mb:,.0f} MB  core: {os.cpu_count()}")
+
+    start = time.perf_counter()
+    cube = build_cube(_parse_csv(path))
+    baseline = time.perf_counter() - start
+    print(f"{'baseline':<12}: {baseline:7.2f} s  {size_mb / baseline:6.0f} MB/s  sel cube {len(cube):,}")
+
+    for workers in args.workers:
+        start = time.perf_counter()
+        hasil = baca_paralel(path, workers, args.chunk_mb * 1024 * 1024)
+        durasi = time.perf_counter() - start
+        print(f"{f'{workers} worker':<12}: {durasi:7.2f} s  {size_mb / durasi:6.0f} MB/s  "
+              f"sel cube {len(hasil['cube']):,}  ({baseline / durasi:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# ==========================================
+# BENCHMARK: kategori + IDR, apply() vs vektorisasi
+# ==========================================
+# Jalankan dari root repo:
+#   python benchmarks/bench_enrichment.py --rows 10000000
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from nike_analytics.enrichment import KURS, hitung_idr, kategori_apply, kategori_units
+
+
+def timeit(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    units = pd.Series(rng.integers(0, 1300, args.rows, dtype=np.int32))
+    sales = pd.Series(rng.uniform(0, 80000, args.rows).astype(np.float32))
+
+    t_apply, lama = timeit(kategori_apply, units)
+    t_vec, baru = timeit(kategori_units, units)
+    assert (lama.to_numpy() == np.asarray(baru).astype(str)).all()
+
+    t_idr_lama, _ = timeit(lambda s: s * 16900, sales)
+    t_idr_baru, _ = timeit(hitung_idr, sales, KURS)
+
+    print(f"rows                 : {args.rows:,}")
+    print(f"kategori apply()     : {t_apply:8.3f} s")
+    print(f"kategori vektorisasi : {t_vec:8.3f} s  ({t_apply / t_vec:,.0f}x lebih cepat)")
+    print(f"memori kategori      : {lama.memory_usage(deep=True) / 1e6:,.1f} MB -> "
+          f"{baru.memory_usage(deep=True) / 1e6:,.1f} MB")
+    print(f"IDR (Series * kurs)  : {t_idr_lama:8.3f} s")
+    print(f"IDR (numpy)          : {t_idr_baru:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# ==========================================
+# BENCHMARK: marker GIS, iterrows + folium.Marker vs layer GeoJSON vektor
+# ==========================================
+# Membandingkan waktu build dan serialisasi HTML untuk N titik (default 10k).
+# Jalankan dari root repo:
+#   python benchmarks/bench_gis_markers.py --points 10000
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import folium
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from nike_analytics.peta import STATE_COORDS, STYLES, format_columns, marker_layer, points_layer
+
+
+def make_points(n, seed=0):
+    # Titik sintetis di sekitar koordinat state (seperti data level kota/ZIP)
+    rng = np.random.default_rng(seed)
+    names = list(STATE_COORDS)
+    pick = rng.integers(0, len(names), n)
+    base = np.array([STATE_COORDS[names[i]] for i in pick])
+    return pd.DataFrame({
+        "State": [names[i] for i in pick],
+        "lat": base[:, 0] + rng.normal(0, 0.8, n),
+        "lon": base[:, 1] + rng.normal(0, 0.8, n),
+        "Units Sold": rng.integers(10, 5000, n),
+        "Total Sales": rng.uniform(1e3, 5e5, n),
+    })
+
+
+def build_lama(points, template):
+    m = folium.Map(location=[37.09, -95.71], zoom_start=4)
+    for _, row in points.iterrows():
+        popup_html = template.format(state=row["State"], units=row["Units Sold"], sales=row["Total Sales"])
+        folium.Marker(
+            location=[row["lat"], row["lon"]],
+            popup=folium.Popup(popup_html, max_width=250),
+            tooltip=row["State"],
+            icon=folium.Icon(color="red", icon="shopping-cart", prefix="fa")
+        ).add_to(m)
+    return m
+
+
+def build_baru(points, template):
+    m = folium.Map(location=[37.09, -95.71], zoom_start=4)
+    points = points.assign(
+        popup=format_columns(template, state=points["State"], units=points["Units Sold"],
+                             sales=points["Total Sales"]),
+        tooltip=points["State"],
+    )
+    points_layer(points).add_to(m)
+    return m
+
+
+def ukur(build, points, template):
+    start = time.perf_counter()
+    m = build(points, template)
+    t_build = time.perf_counter() - start
+    start = time.perf_counter()
+    html = m.get_root().render()
+    t_render = time.perf_counter() - start
+    return t_build, t_render, len(html)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--points", type=int, default=10_000)
+    args = parser.parse_args()
+
+    points = make_points(args.points)
+    template = STYLES["dashboard"]["popup"]
+
+    # pastikan API layer yang dipakai dashboard tetap jalan
+    marker_layer(points.head(10)[["State", "Units Sold", "Total Sales"]])
+
+    print(f"titik: {args.points:,}")
+    hasil = {}
+    for nama, build in (("iterrows + Marker", build_lama), ("GeoJSON vektor", build_baru)):
+        t_build, t_render, size = ukur(build, points, template)
+        hasil[nama] = t_build + t_render
+        print(f"{nama:<18}: build {t_build:7.3f} s  render {t_render:7.3f} s  "
+              f"html {size / 1e6:6.2f} MB")
+    lama, baru = hasil.values()
+    print(f"total {lama / baru:,.1f}x lebih cepat")
+
+
+if __name__ == "__main__":
+    main()
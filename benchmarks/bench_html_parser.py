@@ -0,0 +1,44 @@
+# ==========================================
+# BENCHMARK: backend parser kartu produk (bs4 vs lxml vs selectolax)
+# ==========================================
+# Memakai file HTML tersimpan di benchmarks/fixtures/*.html.
+# Jalankan dari root repo:
+#   python benchmarks/bench_html_parser.py --repeat 50
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from nike_analytics.html_parser import BACKENDS, parse_cards
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures"
+PAGE_URL = "https://www.nike.com/w/mens-shoes-nik1zy7ok?offset=0"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    fixtures = sorted(FIXTURE_DIR.glob("*.html"))
+    pages = [path.read_text(encoding="utf-8") for path in fixtures]
+    print(f"{len(pages)} fixture, {sum(map(len, pages)) / 1e3:,.0f} KB, repeat {args.repeat}x")
+
+    baseline = None
+    for backend in BACKENDS:
+        cards = [parse_cards(html, PAGE_URL, backend) for html in pages]
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for html in pages:
+                parse_cards(html, PAGE_URL, backend)
+        per_page = (time.perf_counter() - start) / (args.repeat * len(pages))
+
+        baseline = baseline or per_page
+        n_cards = sum(map(len, cards))
+        print(f"{backend:<11}: {per_page * 1e3:8.2f} ms/halaman  {n_cards} kartu  "
+              f"({baseline / per_page:,.1f}x vs bs4)")
+
+
+if __name__ == "__main__":
+    main()
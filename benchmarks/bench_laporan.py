@@ -0,0 +1,45 @@
+# ==========================================
+# BENCHMARK: LAPORAN BATCH (nike_analytics/laporan.py) VS JUMLAH WORKER
+# ==========================================
+# Membuat laporan semua state (default) dengan 1, 2, 4, ... worker dan
+# mencetak waktu total + speedup terhadap run pertama (default 1 worker).
+# Speedup hanya bisa mendekati jumlah worker kalau mesin punya core
+# sebanyak itu; di mesin 1 core semua baris akan kurang lebih sama.
+# Jalankan dari root repo:
+#   python benchmarks/bench_laporan.py --workers 1 2 4 8
+import argparse
+import os
+import shutil
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from nike_analytics import laporan
+from nike_analytics.data_loader import ROOT_DIR
+
+OUT_DIR = ROOT_DIR / ".cache" / "bench" / "laporan"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--level", nargs="+", choices=laporan.LEVELS, default=["state"])
+    args = parser.parse_args()
+
+    print(f"core tersedia: {os.cpu_count()}")
+    # import & file Arrow bersama disiapkan dulu supaya tidak masuk hitungan run pertama
+    laporan._impor_berat()
+    laporan.siapkan_data(laporan.cari_file_data())
+
+    acuan = None
+    for workers in args.workers:
+        shutil.rmtree(OUT_DIR, ignore_errors=True)
+        hasil, detik = laporan.jalankan(out_dir=OUT_DIR, levels=args.level, workers=workers)
+        acuan = acuan or detik
+        print(f"  {workers:>3} worker: {len(hasil)} laporan {detik:7.2f} s  "
+              f"({detik / max(1, len(hasil)) * 1000:6.1f} ms / laporan, speedup {acuan / detik:.2f}x)")
+    shutil.rmtree(OUT_DIR, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# ==========================================
+# BENCHMARK: memori per baris, frame lama vs frame ringkas
+# ==========================================
+# - lama    : pd.read_csv tanpa dtype (string object, float64/int64), kolom
+#             IDR + kategori disimpan penuh, lalu df_display = df.copy()
+#             (seperti dashboard sebelum loader bersama)
+# - ringkas : load_sales_data(columns=BASE_COLUMNS) -> category + float32 +
+#             int downcast; IDR & kategori dihitung per halaman tampil
+# Jalankan dari root repo:
+#   python benchmarks/bench_memory.py --rows 1000000
+import argparse
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from nike_analytics.data_loader import BASE_COLUMNS, DATE_FORMAT, cari_file_data, footprint, load_sales_data
+from nike_analytics.enrichment import KURS, kategori_apply
+from nike_analytics.synthetic import dataset_sintetis
+
+
+def frame_lama(path):
+    df = pd.read_csv(path, encoding="utf-8-sig")
+    df.columns = df.columns.str.strip()
+    df["Invoice Date"] = pd.to_datetime(df["Invoice Date"], format=DATE_FORMAT, errors="coerce")
+    df["Total Sales IDR"] = df["Total Sales"] * KURS
+    df["price per unit IDR"] = df["Price per Unit"] * KURS
+    df["kategori"] = kategori_apply(df["Units Sold"])
+    df_display = df.copy()
+    return df, df_display
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=None, help="default: file data asli")
+    args = parser.parse_args()
+
+    path = dataset_sintetis(args.rows) if args.rows else cari_file_data()
+    df, df_display = frame_lama(path)
+    lama = footprint(df)[0] + footprint(df_display)[0]
+    n = len(df)
+    del df, df_display
+
+    ringkas = footprint(load_sales_data(path, columns=BASE_COLUMNS))[0]
+    print(f"baris: {n:,}")
+    print(f"lama    : {lama / 1e6:9.1f} MB  {lama / n:6.1f} byte/baris (frame + df.copy())")
+    print(f"ringkas : {ringkas / 1e6:9.1f} MB  {ringkas / n:6.1f} byte/baris")
+    print(f"{lama / ringkas:.1f}x lebih hemat")
+
+
+if __name__ == "__main__":
+    main()
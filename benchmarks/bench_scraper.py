@@ -0,0 +1,193 @@
+# ==========================================
+# BENCHMARK: ENGINE SCRAPING (nike_analytics/scraper.py) VS SERVER LOKAL
+# ==========================================
+# Server HTTP lokal (pengganti nike.com) melayani fixture HTML tersimpan
+# (benchmarks/fixtures/*.html) untuk tiap ?offset=, dengan Link produk dibuat
+# unik per halaman. Sebagian halaman sengaja:
+#   - lambat  : dijawab setelah --slow detik (sisanya --delay detik)
+#   - 5xx     : dijawab 503 (atau fail_status lain, mis. 429) sebanyak
+#               --fail-times kali sebelum berhasil
+#   - 304     : dijawab 304 Not Modified kalau If-None-Match cocok dengan ETag
+# Yang diukur:
+#   - serial vs paralel : waktu total (paralel harus dekat halaman terlama
+#                         termasuk retry-nya, bukan jumlah semua latensi)
+#   - retry / backoff   : jumlah 503 yang di-retry + jeda antar percobaan
+#   - rate limit        : request per detik yang sampai di server (token bucket)
+#   - incremental       : scraping ulang dengan ScrapeCache -> semua halaman 304
+# Jalankan dari root repo:
+#   python benchmarks/bench_scraper.py --pages 16 --rate 8
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from nike_analytics.scrape_cache import ScrapeCache
+from nike_analytics.scraper import CONCURRENCY, PAGE_SIZE, iter_scrape_batches
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+class StandIn:
+    # Konfigurasi + log request server (dibagi semua thread handler)
+
+    def __init__(self, pages, delay, slow_pages, slow, fail_pages, fail_times, fail_status=503, link_unik=True):
+        self.pages = [path.read_bytes() for path in sorted(FIXTURE_DIR.glob("*.html"))]
+        self.delay = delay
+        self.slow_pages = set(slow_pages)
+        self.slow = slow
+        self.fail_pages = set(fail_pages)
+        self.fail_times = fail_times
+        self.fail_status = fail_status
+        self.link_unik = link_unik
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.log = []
+            self.sisa_gagal = {page: self.fail_times for page in self.fail_pages}
+
+    def jawab(self, page, if_none_match):
+        # Return (status, body, header tambahan)
+        etag = f'"halaman-{page}-v1"'
+        with self.lock:
+            gagal = self.sisa_gagal.get(page, 0) > 0
+            if gagal:
+                self.sisa_gagal[page] -= 1
+        time.sleep(self.slow if page in self.slow_pages else self.delay)
+        if gagal:
+            return self.fail_status, b"coba lagi", {}
+        if if_none_match == etag:
+            return 304, b"", {"ETag": etag}
+        body = self.pages[page % len(self.pages)]
+        # Link unik per halaman supaya produk tidak dianggap duplikat
+        if self.link_unik:
+            body = body.replace(b'href="/t/', f'href="/t/h{page}-'.encode())
+        return 200, body, {"ETag": etag, "Content-Type": "text/html; charset=utf-8"}
+
+
+def serve(standin):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            mulai = time.perf_counter()
+            offset = int(parse_qs(urlsplit(self.path).query).get("offset", ["0"])[0])
+            page = offset // PAGE_SIZE
+            status, body, headers = standin.jawab(page, self.headers.get("If-None-Match"))
+            self.send_response(status)
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            with standin.lock:
+                standin.log.append((mulai, time.perf_counter(), page, status))
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def scrape(base_url, pages, **kwargs):
+    start = time.perf_counter()
+    produk, errors = 0, []
+    for page, batch, error in iter_scrape_batches(pages, base_url, **kwargs):
+        produk += len(batch)
+        if error:
+            errors.append(page)
+    return time.perf_counter() - start, produk, errors
+
+
+def maks_per_detik(waktu):
+    # Jumlah request terbanyak dalam jendela 1 detik mana pun
+    waktu = sorted(waktu)
+    maks, kiri = 0, 0
+    for kanan, t in enumerate(waktu):
+        while t - waktu[kiri] >= 1.0:
+            kiri += 1
+        maks = max(maks, kanan - kiri + 1)
+    return maks
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=16)
+    parser.add_argument("--delay", type=float, default=0.1, help="latensi halaman biasa (detik)")
+    parser.add_argument("--slow", type=float, default=1.0, help="latensi halaman lambat (detik)")
+    parser.add_argument("--fail-times", type=int, default=2, help="berapa kali halaman 5xx menjawab 503")
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY)
+    parser.add_argument("--rate", type=float, default=8.0, help="batas request per detik (token bucket)")
+    parser.add_argument("--rate-pages", type=int, default=48, help="halaman untuk uji rate limit")
+    args = parser.parse_args()
+
+    slow_pages = [args.pages // 2]
+    fail_pages = [1, args.pages - 1]
+    standin = StandIn(args.pages, args.delay, slow_pages, args.slow, fail_pages, args.fail_times)
+    server = serve(standin)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/w/mens-shoes"
+    print(f"{args.pages} halaman: latensi {args.delay}s, halaman lambat {slow_pages} {args.slow}s, "
+          f"halaman 5xx {fail_pages} ({args.fail_times}x 503 dulu)")
+
+    try:
+        # serial vs paralel (tanpa rate limit supaya yang terlihat efek paralelnya)
+        standin.reset()
+        t_serial, produk, errors = scrape(base_url, args.pages, concurrency=1, rate=None)
+        standin.reset()
+        t_paralel, produk, errors = scrape(base_url, args.pages, concurrency=args.concurrency, rate=None)
+        log = list(standin.log)
+        terlama = max(akhir - mulai for mulai, akhir, _, _ in log)
+        # halaman terlama termasuk retry: percobaan pertama s/d jawaban terakhir
+        rentang = {}
+        for mulai, akhir, page, _ in log:
+            awal, ujung = rentang.get(page, (mulai, akhir))
+            rentang[page] = (min(awal, mulai), max(ujung, akhir))
+        halaman_terlama = max(akhir - mulai for mulai, akhir in rentang.values())
+        print(f"serial      : {t_serial:6.2f} s")
+        print(f"paralel {args.concurrency:<3} : {t_paralel:6.2f} s  (request terlama {terlama:.2f} s, halaman terlama "
+              f"termasuk retry {halaman_terlama:.2f} s, {produk} produk, error {errors or '-'})")
+
+        # retry / backoff: percobaan per halaman 5xx dan jeda antar percobaan
+        for page in fail_pages:
+            percobaan = sorted((mulai, status) for mulai, _, p, status in log if p == page)
+            jeda = [b[0] - a[0] for a, b in zip(percobaan, percobaan[1:])]
+            print(f"retry hal {page:<2}: status {[s for _, s in percobaan]}  "
+                  f"jeda antar percobaan {', '.join(f'{j:.2f}s' for j in jeda) or '-'}")
+
+        # rate limit: semua halaman cepat, batas --rate request/detik (burst = concurrency)
+        standin.slow_pages, standin.fail_pages = set(), set()
+        standin.reset()
+        t_rate, produk, errors = scrape(base_url, args.rate_pages, concurrency=args.concurrency, rate=args.rate)
+        waktu = sorted(mulai for mulai, _, _, _ in standin.log)
+        stabil = waktu[args.concurrency:]
+        laju = (len(stabil) - 1) / (stabil[-1] - stabil[0]) if len(stabil) > 1 else float("nan")
+        print(f"rate limit  : {args.rate_pages} halaman {t_rate:6.2f} s  maks {maks_per_detik(waktu)} request "
+              f"per 1 s (batas {args.rate:g} + burst {args.concurrency}), laju setelah burst {laju:.1f}/s")
+
+        # incremental: run kedua dengan cache yang sama -> 304
+        with tempfile.TemporaryDirectory() as tmp:
+            for run in ("pertama", "kedua"):
+                cache = ScrapeCache(Path(tmp) / "cache.sqlite")
+                standin.reset()
+                try:
+                    t_inc, produk, errors = scrape(base_url, args.pages, cache=cache, rate=None)
+                    stats = cache.stats
+                finally:
+                    cache.close()
+                status = [s for _, _, _, s in standin.log]
+                print(f"incremental {run:<7}: {t_inc:6.2f} s  200: {status.count(200)}  304: {status.count(304)}  "
+                      f"produk {produk} (baru {stats['produk_baru']}, dari cache {stats['halaman_304']} halaman)")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+# ==========================================
+# BENCHMARK SUITE: SEMUA JALUR PANAS DASHBOARD -> JSON
+# ==========================================
+# Dataset sintetis (nike_analytics/synthetic.py) di tiap ukuran, lalu diukur
+# waktu (min / median dari --repeat kali) dan puncak memori (tracemalloc,
+# satu run terpisah supaya tidak mengganggu waktu) untuk:
+#   - load_csv        : _parse_csv (read_csv dtype tetap + parsing tanggal)
+#   - parse_tanggal   : pd.to_datetime kolom Invoice Date saja
+#   - kategori        : kategori_units (kolom "kategori")
+#   - enrich          : enrich() penuh (IDR + kategori)
+#   - index_produk    : bangun ProductIndex
+#   - cari_produk     : ProductIndex.search (tanpa cache hasil)
+#   - cube            : build_cube (rollup yang dipakai Top Produk / Wilayah / GIS)
+#   - top_produk, wilayah, state : query_cube dengan filter kata kunci
+# Tidak tergantung ukuran data (sekali per suite):
+#   - peta_folium     : base map + choropleth + cluster, render HTML (cache dikosongkan)
+#   - parse_html_<backend> : parse_cards pada fixture HTML (jalur scrape_nike)
+# Hasil ditulis sebagai JSON; --banding membandingkan dengan JSON versi lain
+# dan exit code 1 kalau ada kasus yang lebih lambat dari --ambang.
+#
+# Jalankan dari root repo:
+#   python benchmarks/bench_suite.py --rows 100000 1000000 --out hasil_baru.json
+#   python benchmarks/bench_suite.py --rows 100000 --banding hasil_lama.json
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from nike_analytics.cube import build_cube, query_cube
+from nike_analytics.data_loader import BASE_COLUMNS, DATE_COLUMN, DATE_FORMAT, ROOT_DIR, _parse_csv, load_sales_data
+from nike_analytics.enrichment import KURS, enrich, kategori_units
+from nike_analytics.search_index import ProductIndex
+from nike_analytics.synthetic import UKURAN, dataset_sintetis
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures"
+PAGE_URL = "https://www.nike.com/w/mens-shoes-nik1zy7ok?offset=0"
+HASIL_DIR = ROOT_DIR / ".cache" / "bench"
+
+# peringatan tile CartoDB dari folium muncul di setiap build peta
+warnings.filterwarnings("ignore", category=UserWarning, module="folium")
+
+
+def ukur(fn, repeat, memori=True):
+    waktu = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        waktu.append(time.perf_counter() - start)
+    hasil = {"detik": waktu, "min": min(waktu), "median": statistics.median(waktu)}
+    if memori:
+        tracemalloc.start()
+        try:
+            fn()
+            hasil["puncak_mb"] = tracemalloc.get_traced_memory()[1] / 1e6
+        finally:
+            tracemalloc.stop()
+    return hasil
+
+
+def kasus_data(path, query):
+    # Return [(nama, fn)] untuk satu dataset; fn dipanggil berulang kali
+    df = _parse_csv(path)
+    raw = pd.read_csv(path, usecols=[DATE_COLUMN], dtype=str, encoding="utf-8-sig")[DATE_COLUMN]
+    frame = df[["Total Sales", "Price per Unit", "Units Sold"]].copy()
+    index = ProductIndex(df["Product"])
+    cube = build_cube(df)
+    filters = {"Product": index.match_names(query)}
+
+    def cari():
+        index._hasil.clear()
+        return index.search(query)
+
+    return [
+        ("load_csv", lambda: _parse_csv(path)),
+        ("parse_tanggal", lambda: pd.to_datetime(raw, format=DATE_FORMAT, errors="coerce")),
+        ("kategori", lambda: kategori_units(df["Units Sold"])),
+        ("enrich", lambda: enrich(frame, KURS)),
+        ("index_produk", lambda: ProductIndex(df["Product"])),
+        ("cari_produk", cari),
+        ("cube", lambda: build_cube(df)),
+        ("top_produk", lambda: query_cube(cube, "Product", filters, ["Units Sold"])["Units Sold"].sort_values()),
+        ("wilayah", lambda: query_cube(cube, "Region", filters, ["Units Sold", "Total Sales"])),
+        ("state", lambda: query_cube(cube, "State", filters, ["Units Sold", "Total Sales"])),
+    ]
+
+
+def kasus_tetap():
+    # Kasus yang tidak tergantung ukuran data
+    from nike_analytics import geo_layers, peta
+    from nike_analytics.html_parser import BACKENDS, parse_cards
+
+    cube = build_cube(load_sales_data(columns=BASE_COLUMNS))
+    state_stats = query_cube(cube, "State", None, ["Units Sold", "Total Sales"]).reset_index()
+
+    def peta_folium():
+        for fn in (peta._base_map_cached, peta._coords_frame, geo_layers.load_state_geojson, geo_layers.state_geojson):
+            fn.cache_clear()
+        m = peta.base_map("dashboard", regions=False)
+        geo_layers.choropleth_layer(state_stats, peta.ZOOM_START).add_to(m)
+        geo_layers.cluster_layer(peta.state_points(state_stats, "dashboard")).add_to(m)
+        return m.get_root().render()
+
+    kasus = [("peta_folium", peta_folium)]
+    pages = [path.read_text(encoding="utf-8") for path in sorted(FIXTURE_DIR.glob("*.html"))]
+    for backend in BACKENDS:
+        kasus.append((f"parse_html_{backend}", lambda b=backend: [parse_cards(html, PAGE_URL, b) for html in pages]))
+    return kasus
+
+
+def meta():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "waktu": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpu": os.cpu_count(),
+    }
+
+
+def banding(hasil, lama, ambang):
+    # Return jumlah kasus yang lebih lambat dari ambang x versi lama. Dibanding
+    # lewat waktu min (paling tidak terpengaruh noise mesin), bukan median.
+    acuan_per_kasus = {(h["kasus"], h["rows"]): h for h in lama["hasil"] if "min" in h}
+    regresi = 0
+    print(f"\nbanding dengan commit {lama['meta'].get('commit')} ({lama['meta'].get('waktu')}):")
+    for h in hasil["hasil"]:
+        acuan = acuan_per_kasus.get((h["kasus"], h["rows"]))
+        if acuan is None or "min" not in h:
+            continue
+        rasio = h["min"] / acuan["min"]
+        tanda = "  <-- REGRESI" if rasio > ambang else ""
+        regresi += rasio > ambang
+        print(f"  {h['kasus']:<22} {h['rows'] or '-':>12}  {acuan['min'] * 1e3:10.2f} -> "
+              f"{h['min'] * 1e3:10.2f} ms  ({rasio:.2f}x){tanda}")
+    return regresi
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=list(UKURAN[:2]),
+                        help=f"ukuran dataset (disarankan: {' '.join(map(str, UKURAN))})")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--query", default="street", help="kata kunci Cari Nama Produk")
+    parser.add_argument("--tanpa-memori", action="store_true", help="lewati run tracemalloc")
+    parser.add_argument("--out", default=None, help="file JSON hasil (default .cache/bench/suite_<waktu>.json)")
+    parser.add_argument("--banding", default=None, help="JSON hasil versi lain untuk dibandingkan")
+    parser.add_argument("--ambang", type=float, default=1.2, help="rasio waktu min yang dianggap regresi")
+    args = parser.parse_args()
+
+    hasil = {"meta": meta(), "hasil": []}
+    hasil["meta"].update(repeat=args.repeat, query=args.query)
+    memori = not args.tanpa_memori
+
+    def catat(nama, rows, fn):
+        try:
+            item = ukur(fn, args.repeat, memori)
+        except MemoryError:
+            item = {"error": "MemoryError"}
+        hasil["hasil"].append({"kasus": nama, "rows": rows, **item})
+        if "error" in item:
+            print(f"  {nama:<22}: gagal ({item['error']})")
+        else:
+            puncak = f"  puncak {item['puncak_mb']:9.1f} MB" if memori else ""
+            print(f"  {nama:<22}: median {item['median'] * 1e3:10.2f} ms  min {item['min'] * 1e3:10.2f} ms{puncak}")
+
+    print("tanpa dataset:")
+    for nama, fn in kasus_tetap():
+        catat(nama, None, fn)
+
+    for n_rows in args.rows:
+        path = dataset_sintetis(n_rows)
+        print(f"\nbaris: {n_rows:,}  ({path.stat().st_size / 1e6:,.0f} MB CSV)")
+        try:
+            kasus = kasus_data(path, args.query)
+        except MemoryError:
+            hasil["hasil"].append({"kasus": "load_csv", "rows": n_rows, "error": "MemoryError"})
+            print("  gagal dimuat (MemoryError)")
+            continue
+        for nama, fn in kasus:
+            catat(nama, n_rows, fn)
+        del kasus
+
+    # maxrss Linux dalam KB
+    hasil["meta"]["puncak_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+    out = Path(args.out) if args.out else HASIL_DIR / f"suite_{time.strftime('%Y%m%d-%H%M%S')}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(hasil, indent=1), encoding="utf-8")
+    print(f"\nhasil: {out}  (puncak RSS {hasil['meta']['puncak_rss_mb']:,.0f} MB)")
+
+    if args.banding:
+        lama = json.loads(Path(args.banding).read_text(encoding="utf-8"))
+        if banding(hasil, lama, args.ambang):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# ==========================================
+# BENCHMARK: gambar Preview ukuran penuh vs cache thumbnail
+# ==========================================
+# Server HTTP lokal (pengganti CDN gambar Nike) melayani N gambar produk
+# sintetis berukuran besar. Dibandingkan:
+#   - lama    : tiap rerun Preview mengambil gambar asli satu per satu
+#   - dingin  : ThumbnailCache.prefetch pertama (unduh paralel + resize)
+#   - hangat  : prefetch berikutnya (semua dari cache di disk)
+# plus byte yang dikirim ke browser per rerun, dan cek batas ukuran cache LRU.
+# Jalankan dari root repo:
+#   python benchmarks/bench_thumbnails.py --images 24 --px 2400
+import argparse
+import functools
+import shutil
+import sys
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from nike_analytics.data_loader import ROOT_DIR
+from nike_analytics.scraper import buat_session
+from nike_analytics.thumbnails import ThumbnailCache
+
+BENCH_DIR = ROOT_DIR / ".cache" / "bench" / "thumbnails"
+
+
+def make_images(n, px, seed=0):
+    # Gambar JPEG besar (gradien + noise, seperti foto produk resolusi penuh)
+    folder = BENCH_DIR / f"asli_{px}"
+    folder.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    grad = np.linspace(0, 255, px, dtype=np.float32)
+    for i in range(n):
+        path = folder / f"produk_{i:03d}.jpg"
+        if path.is_file():
+            continue
+        base = (grad[None, :, None] * rng.uniform(0.3, 1.0, 3)).repeat(px, axis=0)
+        noise = rng.normal(0, 12, (px, px, 3))
+        Image.fromarray(np.clip(base + noise, 0, 255).astype(np.uint8)).save(path, quality=92)
+    return folder
+
+
+class _Diam(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+def serve(folder):
+    handler = functools.partial(_Diam, directory=str(folder))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--images", type=int, default=24)
+    parser.add_argument("--px", type=int, default=2400, help="sisi gambar asli (piksel)")
+    parser.add_argument("--preview", type=int, default=8, help="gambar yang tampil di Preview per rerun")
+    args = parser.parse_args()
+
+    folder = make_images(args.images, args.px)
+    server = serve(folder)
+    host, port = server.server_address
+    urls = [f"http://{host}:{port}/produk_{i:03d}.jpg" for i in range(args.images)]
+    cache_dir = BENCH_DIR / "cache"
+    shutil.rmtree(cache_dir, ignore_errors=True)
+
+    try:
+        # lama: Preview mengambil gambar asli di setiap rerun
+        session = buat_session()
+        start = time.perf_counter()
+        byte_lama = sum(len(session.get(url).content) for url in urls[:args.preview])
+        t_lama = time.perf_counter() - start
+        session.close()
+
+        cache = ThumbnailCache(cache_dir)
+        dingin = cache.prefetch(urls)
+        hangat = cache.prefetch(urls)
+        byte_baru = sum(cache.get(url).stat().st_size for url in urls[:args.preview])
+
+        print(f"{args.images} gambar {args.px}x{args.px}, Preview {args.preview} gambar per rerun")
+        print(f"lama   : {t_lama:6.2f} s per rerun   {byte_lama / 1e6:8.2f} MB ke browser per rerun")
+        print(f"dingin : {dingin['detik']:6.2f} s (sekali)    unduh {dingin['unduh']}, "
+              f"{dingin['byte_asli'] / 1e6:.1f} MB -> {dingin['byte_thumb'] / 1e6:.2f} MB")
+        print(f"hangat : {hangat['detik']:6.3f} s per rerun   {byte_baru / 1e6:8.3f} MB ke browser per rerun "
+              f"(hit {hangat['hit']})")
+
+        # batas LRU: cache kecil harus tetap di bawah batas, gambar terbaru tetap ada
+        kecil = ThumbnailCache(BENCH_DIR / "cache_kecil", max_bytes=dingin["byte_thumb"] // 2)
+        kecil.prefetch(urls, concurrency=1)
+        ukuran = sum(f.stat().st_size for f in kecil.path.iterdir())
+        print(f"LRU    : batas {kecil.max_bytes / 1e3:,.0f} KB, isi {ukuran / 1e3:,.0f} KB, "
+              f"gambar terakhir ada: {kecil.get(urls[-1]) is not None}")
+        shutil.rmtree(kecil.path, ignore_errors=True)
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
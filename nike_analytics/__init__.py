@@ -0,0 +1,7 @@
+# ==========================================
+# NIKE ANALYTICS - modul bersama untuk semua dashboard
+# ==========================================
+from .data_loader import load_sales_data, cari_file_data
+from .enrichment import KURS, enrich
+
+__all__ = ["load_sales_data", "cari_file_data", "KURS", "enrich"]
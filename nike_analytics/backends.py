@@ -0,0 +1,354 @@
+# ==========================================
+# BACKEND QUERY DASHBOARD HISTORIS: PANDAS vs DUCKDB
+# ==========================================
+# Dashboard historis (pencarian, Top Produk, Analisis Wilayah, GIS, tabel
+# Overview) memakai interface yang sama:
+#   count(query), page(query, sort_by, ascending, offset, limit),
+#   top_products(query), regional(query), state_stats(query), time_buckets()
+# query = kata kunci "Cari Nama Produk" (None / "" = semua baris).
+#
+# - PandasBackend: frame ringkas di memori (category + numerik downcast, tanpa
+#   kolom turunan) + rollup cube + index nama produk. Kolom IDR & kategori
+#   hanya dihitung untuk halaman yang ditampilkan.
+# - DuckDBBackend: data dimuat sekali ke file database DuckDB lokal
+#   (.cache/duckdb/), lalu filter, agregasi, sort dan LIMIT/OFFSET dijalankan
+#   di dalam engine. Yang masuk ke memori Python hanya hasil agregat dan satu
+#   halaman tabel, jadi dataset yang lebih besar dari RAM tetap bisa dilayani.
+import hashlib
+import importlib.util
+import threading
+from collections import OrderedDict
+from functools import cached_property, lru_cache
+from pathlib import Path
+
+import pandas as pd
+
+from . import columnar, store
+from .cube import load_cube, query_cube
+from .data_loader import (
+    BASE_COLUMNS, DERIVED_COLUMNS, ROOT_DIR, _parse_csv, _signature, cari_file_data, ensure_columnar, footprint,
+    load_sales_data, row_count,
+)
+from .enrichment import BATAS_LAKU, BATAS_SANGAT_LAKU, KATEGORI_LABELS, KURS, enrich
+from .search_index import load_product_index
+from .table_view import paginate
+from .timeseries import BUCKET_DIMENSIONS, TANGGAL, load_time_buckets
+
+BACKENDS = ("pandas", "duckdb")
+DUCKDB_DIR = ROOT_DIR / ".cache" / "duckdb"
+
+# Kolom nomor baris asli di tabel DuckDB (urutan file, untuk sort yang stabil)
+_ROW_COLUMN = "_baris"
+
+# Jumlah hasil agregat (per kata kunci) yang disimpan per objek DuckDBBackend
+HASIL_CACHE_SIZE = 64
+
+# Satu lock per file database: dua thread (sesi) yang membangun versi yang
+# sama tidak menulis ke file .tmp yang sama bersamaan
+_BUILD_LOCKS = {}
+_BUILD_LOCKS_LOCK = threading.Lock()
+
+
+def available_backends():
+    # duckdb opsional -> hanya backend pandas; modulnya baru diimpor saat dipakai
+    ada_duckdb = importlib.util.find_spec("duckdb") is not None
+    return tuple(name for name in BACKENDS if name != "duckdb" or ada_duckdb)
+
+
+# =========================
+# PANDAS
+# =========================
+class PandasBackend:
+
+    name = "pandas"
+
+    def __init__(self, path):
+        self.path = path
+        self.df = load_sales_data(path, columns=BASE_COLUMNS)
+        self.columns = list(self.df.columns) + list(DERIVED_COLUMNS)
+        self.total_rows = row_count(path)
+
+    # cube & index nama produk baru dibangun saat dipakai (pencarian / agregat),
+    # bukan saat halaman pertama tabel Overview ditampilkan
+    @cached_property
+    def cube(self):
+        return load_cube(self.path)
+
+    @cached_property
+    def index(self):
+        return load_product_index(self.path)
+
+    def footprint(self):
+        # byte memori frame invoice yang dimuat
+        return footprint(self.df)[0]
+
+    def _positions(self, query):
+        return self.index.search(query) if query else None
+
+    def _cube_filter(self, query):
+        return {"Product": self.index.match_names(query)} if query else None
+
+    def count(self, query=None):
+        positions = self._positions(query)
+        return len(self.df) if positions is None else len(positions)
+
+    def page(self, query=None, sort_by=None, ascending=True, offset=0, limit=100, kurs=KURS):
+        # sort kolom turunan = sort kolom dasarnya (monoton terhadap kolom dasar)
+        sort_by = DERIVED_COLUMNS.get(sort_by, sort_by)
+        halaman = paginate(self.df, self._positions(query), sort_by, ascending, offset, limit)[0]
+        return enrich(halaman, float(kurs))
+
+    def top_products(self, query=None):
+        units = query_cube(self.cube, "Product", self._cube_filter(query), ["Units Sold"])["Units Sold"]
+        return units.sort_values(ascending=False).reset_index()
+
+    def regional(self, query=None):
+        return query_cube(self.cube, "Region", self._cube_filter(query), ["Units Sold", "Total Sales"])
+
+    def state_stats(self, query=None):
+        return query_cube(self.cube, "State", self._cube_filter(query), ["Units Sold", "Total Sales"]).reset_index()
+
+    def time_buckets(self):
+        return load_time_buckets(self.path)
+
+
+# =========================
+# DUCKDB
+# =========================
+def _q(name):
+    # quote identifier SQL (nama kolom mengandung spasi)
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _path_tag(path):
+    # Tag per path sumber: file lain dengan nama sama tidak saling menimpa
+    return hashlib.blake2b(str(path).encode(), digest_size=6).hexdigest()
+
+
+def _db_path(path, mtime_ns, size):
+    tag = hashlib.blake2b(f"{path}|{mtime_ns}|{size}".encode(), digest_size=8).hexdigest()
+    return DUCKDB_DIR / f"{Path(path).stem}-{_path_tag(path)}-{tag}.duckdb"
+
+
+def _build_lock(db):
+    with _BUILD_LOCKS_LOCK:
+        return _BUILD_LOCKS.setdefault(db, threading.Lock())
+
+
+def build_database(path, mtime_ns, size):
+    # Muat data ke file DuckDB (sekali per versi file sumber); return path database
+    db = _db_path(path, mtime_ns, size)
+    if db.is_file():
+        return db
+    with _build_lock(db):
+        # thread lain mungkin sudah selesai membangun selama kita menunggu lock
+        if db.is_file():
+            return db
+        _build(path, mtime_ns, size, db)
+    # database sudah ada -> lock tidak diperlukan lagi (yang masih menunggu
+    # akan melihat db.is_file() di atas)
+    with _BUILD_LOCKS_LOCK:
+        _BUILD_LOCKS.pop(db, None)
+
+    # Hapus database dari versi lama file yang sama (path sama, versi beda)
+    for old in DUCKDB_DIR.glob(f"{Path(path).stem}-{_path_tag(path)}-*.duckdb"):
+        if old != db:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+    return db
+
+
+def _build(path, mtime_ns, size, db):
+    DUCKDB_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = db.with_suffix(".tmp")
+    tmp.unlink(missing_ok=True)
+    import duckdb
+
+    con = duckdb.connect(str(tmp))
+    try:
+        if store.is_store(path):
+            # Semua file part store; urutan baris = urutan partisi lalu file part
+            files = ", ".join("'" + str(f).replace("'", "''") + "'" for f in store.sales_files(path))
+            con.execute(
+                f"CREATE TABLE sales AS SELECT * EXCLUDE (filename, file_row_number), "
+                f"row_number() OVER (ORDER BY filename, file_row_number) - 1 AS {_ROW_COLUMN} "
+                f"FROM read_parquet([{files}], filename = true, file_row_number = true, hive_partitioning = false)"
+            )
+        elif ensure_columnar(path, mtime_ns, size):
+            # Parquet dibaca streaming oleh DuckDB, tidak lewat pandas
+            source = str(columnar.sidecar_path(path)).replace("'", "''")
+            con.execute(
+                f"CREATE TABLE sales AS SELECT * EXCLUDE (file_row_number), "
+                f"file_row_number AS {_ROW_COLUMN} "
+                f"FROM read_parquet('{source}', file_row_number = true)"
+            )
+        else:
+            csv_df = _parse_csv(path)
+            con.register("csv_df", csv_df)
+            con.execute(f"CREATE TABLE sales AS SELECT *, row_number() OVER () - 1 AS {_ROW_COLUMN} FROM csv_df")
+        con.execute("CHECKPOINT")
+    finally:
+        con.close()
+    tmp.replace(db)
+
+
+class DuckDBBackend:
+
+    name = "duckdb"
+
+    def __init__(self, path, mtime_ns, size):
+        import duckdb
+
+        self.con = duckdb.connect(str(build_database(path, mtime_ns, size)), read_only=True)
+        info = self.con.execute("DESCRIBE sales").fetchall()
+        self.base_columns = [row[0] for row in info if row[0] != _ROW_COLUMN]
+        self.columns = self.base_columns + [name for name, _ in self._derived()]
+        self.total_rows = self.con.execute("SELECT count(*) FROM sales").fetchone()[0]
+        # Cache hasil milik objek ini (bukan lru_cache di method, yang
+        # menahan self) -> ikut dilepas bersama koneksinya saat backend
+        # dibuang dari _backend_cached
+        self._hasil = OrderedDict()
+        self._hasil_lock = threading.Lock()
+
+    def _memo(self, key, fn):
+        with self._hasil_lock:
+            if key in self._hasil:
+                self._hasil.move_to_end(key)
+                return self._hasil[key]
+        hasil = fn()
+        with self._hasil_lock:
+            self._hasil[key] = hasil
+            while len(self._hasil) > HASIL_CACHE_SIZE:
+                self._hasil.popitem(last=False)
+        return hasil
+
+    def footprint(self):
+        # byte memori yang sedang dipakai DuckDB (data tetap di file database)
+        cur = self.con.cursor()
+        try:
+            return int(cur.execute("SELECT sum(memory_usage_bytes) FROM duckdb_memory()").fetchone()[0] or 0)
+        finally:
+            cur.close()
+
+    def _derived(self, kurs=KURS):
+        # Kolom turunan (sama dengan enrichment.enrich) dihitung di SQL
+        kurs = float(kurs)
+        derived = []
+        if "Total Sales" in self.base_columns:
+            derived.append(("Total Sales IDR", f'CAST("Total Sales" AS DOUBLE) * {kurs!r}'))
+        if "Price per Unit" in self.base_columns:
+            derived.append(("price per unit IDR", f'CAST("Price per Unit" AS DOUBLE) * {kurs!r}'))
+        if "Units Sold" in self.base_columns:
+            derived.append(("kategori", (
+                f'CASE WHEN "Units Sold" > {BATAS_SANGAT_LAKU} THEN \'{KATEGORI_LABELS[2]}\' '
+                f'WHEN "Units Sold" >= {BATAS_LAKU} THEN \'{KATEGORI_LABELS[1]}\' '
+                f'ELSE \'{KATEGORI_LABELS[0]}\' END'
+            )))
+        return derived
+
+    def _sql(self, sql, params=()):
+        # cursor per query -> aman dipakai bersama oleh banyak sesi Streamlit
+        cur = self.con.cursor()
+        try:
+            return cur.execute(sql, list(params)).df()
+        finally:
+            cur.close()
+
+    @staticmethod
+    def _where(query):
+        # Semantik sama dengan ProductIndex.search (substring, case-insensitive)
+        if not query:
+            return "", ()
+        return "WHERE contains(lower(Product), ?)", (query.lower(),)
+
+    def count(self, query=None):
+        return self._memo(("count", query), lambda: self._count(query))
+
+    def _count(self, query):
+        where, params = self._where(query)
+        return int(self._sql(f"SELECT count(*) AS n FROM sales {where}", params)["n"].iloc[0])
+
+    def page(self, query=None, sort_by=None, ascending=True, offset=0, limit=100, kurs=KURS):
+        where, params = self._where(query)
+        select = [_q(col) for col in self.base_columns]
+        select += [f"{expr} AS {_q(name)}" for name, expr in self._derived(kurs)]
+
+        order = _ROW_COLUMN
+        if sort_by:
+            if sort_by not in self.columns:
+                raise ValueError(f"Kolom sort tidak dikenal: {sort_by}")
+            # sama dengan PandasBackend: kolom turunan di-sort lewat kolom dasarnya
+            sort_by = DERIVED_COLUMNS.get(sort_by, sort_by)
+            arah = "ASC" if ascending else "DESC"
+            order = f"{_q(sort_by)} {arah} NULLS LAST, {_ROW_COLUMN}"
+
+        halaman = self._sql(
+            f"SELECT {', '.join(select)} FROM sales {where} "
+            f"ORDER BY {order} LIMIT {int(limit)} OFFSET {max(0, int(offset))}",
+            params,
+        )
+        if "kategori" in halaman.columns:
+            halaman["kategori"] = pd.Categorical(halaman["kategori"], categories=KATEGORI_LABELS, ordered=True)
+        return halaman
+
+    def top_products(self, query=None):
+        return self._memo(("top_products", query), lambda: self._top_products(query))
+
+    def _top_products(self, query):
+        where, params = self._where(query)
+        return self._sql(
+            f'SELECT Product, CAST(sum("Units Sold") AS BIGINT) AS "Units Sold" '
+            f'FROM sales {where} GROUP BY Product ORDER BY "Units Sold" DESC',
+            params,
+        )
+
+    def _sum_by(self, by, query):
+        where, params = self._where(query)
+        return self._sql(
+            f'SELECT {_q(by)}, CAST(sum("Units Sold") AS BIGINT) AS "Units Sold", '
+            f'sum(CAST("Total Sales" AS DOUBLE)) AS "Total Sales" '
+            f'FROM sales {where} GROUP BY {_q(by)} ORDER BY {_q(by)}',
+            params,
+        )
+
+    def regional(self, query=None):
+        return self._memo(("regional", query), lambda: self._sum_by("Region", query).set_index("Region"))
+
+    def state_stats(self, query=None):
+        return self._memo(("state_stats", query), lambda: self._sum_by("State", query))
+
+    @cached_property
+    def _time_buckets(self):
+        # Bucket harian (lihat timeseries.py) langsung dari GROUP BY di database
+        buckets = self._sql(
+            f'SELECT CAST(date_trunc(\'day\', "Invoice Date") AS TIMESTAMP) AS {TANGGAL}, Product, Region, '
+            f'CAST(sum("Units Sold") AS BIGINT) AS "Units Sold", '
+            f'sum(CAST("Total Sales" AS DOUBLE)) AS "Total Sales", count(*) AS Transaksi '
+            f'FROM sales WHERE "Invoice Date" IS NOT NULL '
+            f'GROUP BY ALL ORDER BY {TANGGAL}, Product, Region'
+        )
+        for col in BUCKET_DIMENSIONS:
+            buckets[col] = buckets[col].astype("category")
+        return buckets
+
+    def time_buckets(self):
+        return self._time_buckets
+
+
+@lru_cache(maxsize=4)
+def _backend_cached(name, path, mtime_ns, size):
+    if name == "duckdb":
+        return DuckDBBackend(path, mtime_ns, size)
+    return PandasBackend(path)
+
+
+def get_backend(name="pandas", path=None):
+    # Objek backend di-cache per (backend, versi file); hasil query-nya read-only.
+    # Kurs tidak masuk key: ganti kurs tidak membangun ulang backend, kurs
+    # diteruskan ke page() tiap query
+    if name not in available_backends():
+        raise ValueError(f"Backend query tidak tersedia: {name}")
+    path = Path(path) if path else cari_file_data()
+    return _backend_cached(name, *_signature(path.resolve()))
@@ -0,0 +1,186 @@
+# ==========================================
+# POOL BROWSER HEADLESS UNTUK SCRAPER SELENIUM
+# ==========================================
+# Chrome headless dibuat sekali lalu dipakai ulang (simpan pool-nya dengan
+# st.cache_resource supaya hidup lintas rerun Streamlit). Tidak ada lagi
+# time.sleep tetap:
+#   - tunggu sampai div.product-card muncul (WebDriverWait)
+#   - scroll terus selama jumlah kartu masih bertambah, berhenti begitu
+#     jumlahnya tidak berubah dalam SCROLL_TIMEOUT detik
+#   - semua kartu diambil dengan satu execute_script (bukan find_element
+#     per kartu)
+import atexit
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import pandas as pd
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.ui import WebDriverWait
+
+from .html_parser import clean_price
+from .scraper import BASE_URL, COLUMNS, page_url
+
+CARD_SELECTOR = "div.product-card"
+LOAD_TIMEOUT = 15
+SCROLL_TIMEOUT = 3
+MAX_SCROLLS = 30
+
+_EXTRACT_JS = """
+return Array.from(document.querySelectorAll(arguments[0])).map(function (card) {
+    var title = card.querySelector('.product-card__title');
+    var price = card.querySelector('.product-price');
+    var link = card.querySelector('a');
+    var img = card.querySelector('img');
+    if (!title || !price || !link) { return null; }
+    return [title.innerText, price.innerText, link.href, img ? img.src : ''];
+}).filter(function (row) { return row !== null; });
+"""
+
+_COUNT_JS = "return document.querySelectorAll(arguments[0]).length;"
+_SCROLL_JS = "window.scrollTo(0, document.body.scrollHeight);"
+
+
+def _chrome_options():
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    return options
+
+
+class BrowserPool:
+
+    def __init__(self, size=2):
+        self.size = size
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._driver_path = None
+        self._all = []
+        atexit.register(self.close)
+
+    def _new_driver(self):
+        # ChromeDriverManager().install() cukup sekali per pool
+        if self._driver_path is None:
+            from webdriver_manager.chrome import ChromeDriverManager
+            self._driver_path = ChromeDriverManager().install()
+        driver = webdriver.Chrome(service=Service(self._driver_path), options=_chrome_options())
+        self._all.append(driver)
+        return driver
+
+    def _alive(self, driver):
+        try:
+            driver.execute_script("return 1;")
+            return True
+        except WebDriverException:
+            return False
+
+    def _discard(self, driver):
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+        with self._lock:
+            self._created -= 1
+            if driver in self._all:
+                self._all.remove(driver)
+
+    def _acquire(self):
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    buat_baru = self._created < self.size
+                    if buat_baru:
+                        self._created += 1
+                if buat_baru:
+                    try:
+                        return self._new_driver()
+                    except Exception:
+                        with self._lock:
+                            self._created -= 1
+                        raise
+                try:
+                    # timeout supaya slot dari browser yang di-discard bisa dipakai lagi
+                    driver = self._idle.get(timeout=1)
+                except queue.Empty:
+                    continue
+            if self._alive(driver):
+                return driver
+            self._discard(driver)
+
+    @contextmanager
+    def driver(self):
+        driver = self._acquire()
+        try:
+            yield driver
+        except BaseException:
+            # Error apa pun (bukan hanya WebDriverException): browser tidak
+            # dikembalikan ke pool tapi slot-nya dilepas, supaya _acquire
+            # tidak menunggu selamanya
+            self._discard(driver)
+            raise
+        else:
+            self._idle.put(driver)
+
+    def close(self):
+        for driver in list(self._all):
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+        self._all.clear()
+        self._created = 0
+        self._idle = queue.LifoQueue()
+
+
+def _card_count(driver):
+    return driver.execute_script(_COUNT_JS, CARD_SELECTOR)
+
+
+def scroll_sampai_habis(driver, timeout=SCROLL_TIMEOUT, max_scrolls=MAX_SCROLLS):
+    # Scroll selama jumlah kartu masih bertambah
+    count = _card_count(driver)
+    for _ in range(max_scrolls):
+        driver.execute_script(_SCROLL_JS)
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=0.2).until(
+                lambda d: _card_count(d) > count
+            )
+        except TimeoutException:
+            break
+        count = _card_count(driver)
+    return count
+
+
+def scrape_page(driver, url):
+    driver.get(url)
+    try:
+        WebDriverWait(driver, LOAD_TIMEOUT, poll_frequency=0.2).until(
+            lambda d: _card_count(d) > 0
+        )
+    except TimeoutException:
+        return []
+    scroll_sampai_habis(driver)
+    rows = driver.execute_script(_EXTRACT_JS, CARD_SELECTOR)
+    return [[name, price_text, clean_price(price_text), link, img]
+            for name, price_text, link, img in rows]
+
+
+def scrape_pages_browser(pool, max_pages, base_url=BASE_URL):
+    # Halaman dibagi ke semua browser di pool (paralel sebanyak pool.size)
+    def kerja(page):
+        with pool.driver() as driver:
+            return scrape_page(driver, page_url(page, base_url))
+
+    with ThreadPoolExecutor(max_workers=pool.size) as executor:
+        hasil = list(executor.map(kerja, range(max_pages)))
+
+    rows = [row for page_rows in hasil for row in page_rows]
+    return pd.DataFrame(rows, columns=COLUMNS)
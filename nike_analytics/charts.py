@@ -0,0 +1,137 @@
+# ==========================================
+# LAYER GRAFIK: CACHE HASIL RENDER + BACKEND VEGA-LITE
+# ==========================================
+# Grafik bar regional dan histogram harga sebelumnya dibuat ulang dengan
+# plt.subplots di setiap rerun dan figure-nya tidak pernah ditutup.
+# Di sini:
+#   - backend "matplotlib": figure dibuat lewat matplotlib.figure.Figure
+#     (tidak terdaftar di pyplot), dirender ke PNG lalu langsung dilepas.
+#     Hasil PNG di-memoize berdasarkan data agregat + gaya.
+#   - backend "vega-lite": hanya spesifikasi JSON, dirender di browser
+#     (tanpa rasterisasi di server).
+import hashlib
+import io
+from collections import OrderedDict
+from functools import lru_cache
+
+import numpy as np
+
+BACKENDS = ("matplotlib", "vega-lite")
+
+REGIONAL_STYLES = {
+    # Tab "Analisis Wilayah" di dashboard utama
+    "dashboard": {"figsize": (8, 4), "title": None, "xlabel": None, "ylabel": None,
+                  "annotate": False},
+    # 3_tugas/visual/visual_bar_chart.py
+    "visual": {"figsize": (10, 6), "title": "Total Sales per Region",
+               "xlabel": "Total Sales (USD)", "ylabel": "Region", "annotate": True},
+    # nike_analytics/laporan.py: bar per state (laporan region) / per retailer (laporan state)
+    "laporan_region": {"figsize": (10, 6), "title": "Total Sales per State",
+                       "xlabel": "Total Sales (USD)", "ylabel": "State", "annotate": True},
+    "laporan_state": {"figsize": (10, 4), "title": "Total Sales per Retailer",
+                      "xlabel": "Total Sales (USD)", "ylabel": "Retailer", "annotate": True},
+}
+
+DPI = 150
+
+
+def _figure(figsize):
+    from matplotlib.figure import Figure
+
+    return Figure(figsize=figsize)
+
+
+def _png(fig):
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=DPI, bbox_inches="tight")
+    # Lepas semua referensi artist supaya memori figure langsung bisa dibebaskan
+    fig.clear()
+    return buf.getvalue()
+
+
+@lru_cache(maxsize=32)
+def _regional_bar_png(labels, values, style):
+    import seaborn as sns
+
+    cfg = REGIONAL_STYLES[style]
+    fig = _figure(cfg["figsize"])
+    ax = fig.subplots()
+    colors = sns.color_palette("viridis", len(values))
+    ax.barh(range(len(values)), values, color=colors)
+    ax.set_yticks(range(len(labels)), labels)
+    if cfg["title"]:
+        ax.set_title(cfg["title"], fontsize=14, pad=15)
+    ax.set_xlabel(cfg["xlabel"] or "", fontsize=12)
+    ax.set_ylabel(cfg["ylabel"] or "Region", fontsize=12)
+    if cfg["annotate"]:
+        # Anotasi nilai di ujung bar
+        for i, v in enumerate(values):
+            ax.text(v, i, f' {v:,.0f}', va='center', fontsize=10)
+    fig.tight_layout()
+    return _png(fig)
+
+
+def regional_bar_png(regional_perf, style="dashboard"):
+    # regional_perf: Series Region -> Total Sales (urutan = urutan bar dari bawah)
+    labels = tuple(str(i) for i in regional_perf.index)
+    values = tuple(float(v) for v in regional_perf.to_numpy())
+    return _regional_bar_png(labels, values, style)
+
+
+def regional_bar_spec(regional_perf, style="dashboard"):
+    cfg = REGIONAL_STYLES[style]
+    data = [{"Region": str(k), "Total Sales": float(v)} for k, v in regional_perf.items()]
+    order = [row["Region"] for row in reversed(data)]
+    spec = {
+        "data": {"values": data},
+        "mark": {"type": "bar"},
+        "encoding": {
+            "y": {"field": "Region", "type": "nominal", "sort": order,
+                  "title": cfg["ylabel"] or "Region"},
+            "x": {"field": "Total Sales", "type": "quantitative",
+                  "title": cfg["xlabel"] or "Total Sales"},
+            "color": {"field": "Total Sales", "type": "quantitative",
+                      "scale": {"scheme": "viridis"}, "legend": None},
+            "tooltip": [{"field": "Region"},
+                        {"field": "Total Sales", "format": ",.0f"}],
+        },
+    }
+    if cfg["title"]:
+        spec["title"] = cfg["title"]
+    return spec
+
+
+def _histogram_render(values, bins, color):
+    fig = _figure((6.4, 4.8))
+    ax = fig.subplots()
+    ax.hist(values, bins=bins, color=color)
+    return _png(fig)
+
+
+# Cache LRU kecil untuk histogram, key = hash isi data (bukan datanya)
+_HIST_CACHE = OrderedDict()
+_HIST_CACHE_SIZE = 32
+
+
+def histogram_png(values, bins=10, color=None):
+    values = np.asarray(values, dtype=np.float64)
+    key = (hashlib.blake2b(values.tobytes(), digest_size=16).hexdigest(), bins, color)
+    png = _HIST_CACHE.pop(key, None)
+    if png is None:
+        png = _histogram_render(values, bins, color)
+    _HIST_CACHE[key] = png
+    while len(_HIST_CACHE) > _HIST_CACHE_SIZE:
+        _HIST_CACHE.popitem(last=False)
+    return png
+
+
+def histogram_spec(values, field="Harga Angka", bins=10, color=None):
+    data = [{field: float(v)} for v in np.asarray(values, dtype=np.float64)]
+    return {
+        "data": {"values": data},
+        "mark": {"type": "bar", "color": color or "#1f77b4"},
+        "encoding": {
+            "x": {"field": field, "type": "quantitative", "bin": {"maxbins": bins}},
+            "y": {"aggregate": "count", "type": "quantitative"},
+        },
+    }
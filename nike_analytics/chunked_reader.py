@@ -0,0 +1,170 @@
+# ==========================================
+# PEMBACA CSV BESAR: CHUNK PER BARIS + PROCESS POOL
+# ==========================================
+# Untuk backfill export multi-GB (skema sama dengan data_hasil_scrapping.csv).
+# File dipecah menjadi potongan byte yang berakhir di batas baris, lalu tiap
+# potongan di-parse di proses terpisah dengan dtype tetap (category / float32
+# / int32) + parsing tanggal dan pembersihan yang sama dengan ingest.py.
+# Tiap worker langsung mereduksi potongannya menjadi agregat kecil (potongan
+# cube + bucket harian) dan, kalau diminta, menulis potongan itu ke file
+# Parquet di folder sink. Proses utama hanya menggabungkan agregat; frame
+# invoice utuh tidak pernah dibentuk.
+#
+# Catatan: pemecahan per baris mengasumsikan tidak ada newline di dalam
+# field ber-quote (benar untuk skema invoice ini).
+#
+# Jalankan dari root repo:
+#   python -m nike_analytics.chunked_reader export_besar.csv --workers 8 --sink .cache/backfill
+import argparse
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from . import columnar
+from .cube import build_cube, gabung_cube
+from .data_loader import CATEGORY_COLUMNS, DATE_COLUMN, _parse_csv
+from .ingest import NUMERIC_COLUMNS, validasi
+from .timeseries import _rapikan, bucket_harian
+
+CHUNK_BYTES = 64 * 1024 * 1024
+
+
+def chunk_offsets(path, chunk_bytes=CHUNK_BYTES):
+    # Return (baris header, [(start, end), ...]); tiap potongan berakhir di akhir baris
+    size = os.path.getsize(path)
+    offsets = []
+    with open(path, "rb") as f:
+        header = f.readline()
+        start = f.tell()
+        while start < size:
+            f.seek(min(start + chunk_bytes, size))
+            f.readline()
+            end = f.tell()
+            offsets.append((start, end))
+            start = end
+    return header, offsets
+
+
+def _bersihkan_kategori(values, fn):
+    # Terapkan fn ke daftar kategori saja (bukan ke tiap baris)
+    cats = values.cat.categories
+    bersih = fn(cats)
+    if bersih.equals(cats):
+        return values
+    # Kategori yang jadi sama setelah dibersihkan digabung; kode -1 (nilai
+    # kosong) tetap -1, dan kategori yang jadi "" ikut dianggap kosong
+    # (sama seperti ingest.validasi) supaya barisnya ditolak
+    unik = pd.Index(bersih.unique())
+    unik = unik[unik != ""]
+    peta = np.append(unik.get_indexer(bersih), -1)
+    codes = peta[values.cat.codes.to_numpy()]
+    return pd.Series(pd.Categorical.from_codes(codes, unik), index=values.index)
+
+
+def parse_chunk(header, data):
+    # Return (frame bersih dengan dtype loader, jumlah baris yang ditolak)
+    try:
+        df = _parse_csv(io.BytesIO(header + data))
+    except ValueError:
+        # Ada nilai numerik yang tidak valid -> jalur lambat (teks) dari ingest
+        df = pd.read_csv(io.BytesIO(header + data), dtype=str, encoding="utf-8-sig")
+        df.columns = df.columns.str.strip()
+        return validasi(df)
+
+    for col in CATEGORY_COLUMNS:
+        df[col] = _bersihkan_kategori(df[col], lambda cats: cats.str.strip())
+    df["State"] = _bersihkan_kategori(df["State"], lambda cats: cats.str.title())
+
+    valid = df[DATE_COLUMN].notna()
+    for col in CATEGORY_COLUMNS:
+        valid &= df[col].notna()
+    for col in NUMERIC_COLUMNS:
+        valid &= df[col].notna() & (df[col] >= 0)
+    valid = valid.to_numpy(dtype=bool)
+    if valid.all():
+        return df, 0
+    return df[valid].reset_index(drop=True), int((~valid).sum())
+
+
+def _proses_chunk(tugas):
+    # Dijalankan di worker: parse satu potongan lalu reduksi ke agregat (+ sink)
+    path, header, start, end, sink_dir, idx = tugas
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    df, ditolak = parse_chunk(header, data)
+
+    file = None
+    if sink_dir is not None and len(df):
+        file = Path(sink_dir) / f"part-{idx:05d}.parquet"
+        columnar.tulis_parquet(df, file, {"sumber": str(path), "start": start, "end": end})
+    return {
+        "rows": len(df),
+        "ditolak": ditolak,
+        "cube": build_cube(df),
+        "harian": bucket_harian(df),
+        "file": file,
+    }
+
+
+def baca_paralel(path, workers=None, chunk_bytes=CHUNK_BYTES, sink_dir=None):
+    # Return ringkasan: rows, ditolak, cube, harian, files (part Parquet di sink_dir)
+    header, offsets = chunk_offsets(path, chunk_bytes)
+    if sink_dir is not None:
+        if not columnar.tersedia():
+            raise RuntimeError("pyarrow belum terpasang; sink Parquet butuh pyarrow.")
+        Path(sink_dir).mkdir(parents=True, exist_ok=True)
+    tugas = [(str(path), header, start, end, sink_dir, idx) for idx, (start, end) in enumerate(offsets)]
+
+    workers = workers or os.cpu_count() or 1
+    hasil = {"rows": 0, "ditolak": 0, "files": []}
+    cubes, harian = [], []
+
+    def kumpulkan(results):
+        for res in results:
+            hasil["rows"] += res["rows"]
+            hasil["ditolak"] += res["ditolak"]
+            cubes.append(res["cube"])
+            harian.append(res["harian"])
+            if res["file"] is not None:
+                hasil["files"].append(res["file"])
+
+    if workers == 1 or len(tugas) <= 1:
+        kumpulkan(map(_proses_chunk, tugas))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            kumpulkan(pool.map(_proses_chunk, tugas))
+
+    # File kosong (hanya header) -> tidak ada agregat
+    hasil["cube"] = gabung_cube(cubes) if cubes else None
+    hasil["harian"] = _rapikan(pd.concat(harian, ignore_index=True)) if harian else None
+    return hasil
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Baca CSV invoice besar secara paralel per potongan.")
+    parser.add_argument("file")
+    parser.add_argument("--workers", type=int, default=None, help="jumlah proses (default: semua core)")
+    parser.add_argument("--chunk-mb", type=int, default=CHUNK_BYTES // (1024 * 1024))
+    parser.add_argument("--sink", default=None, help="folder tujuan potongan Parquet (opsional)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    hasil = baca_paralel(args.file, args.workers, args.chunk_mb * 1024 * 1024, args.sink)
+    durasi = time.perf_counter() - start
+    size_mb = os.path.getsize(args.file) / 1e6
+    print(f"baris valid {hasil['rows']:,} · ditolak {hasil['ditolak']:,} · "
+          f"{durasi:.2f} s ({size_mb / durasi:,.0f} MB/s)")
+    if hasil["cube"] is not None:
+        print(f"sel cube {len(hasil['cube']):,} · bucket harian {len(hasil['harian']):,}")
+    if args.sink:
+        print(f"file Parquet di {args.sink}: {len(hasil['files'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# ==========================================
+# CACHE KOLOMNAR (PARQUET) UNTUK CSV PENJUALAN
+# ==========================================
+# Pertama kali sebuah CSV dibaca, isinya disimpan sebagai file Parquet
+# "sidecar" di sebelah CSV (data_hasil_scrapping.csv -> .parquet) dengan
+# dtype yang sudah benar. Load berikutnya langsung dari Parquet dan hanya
+# membaca kolom yang diminta (column projection), jadi tidak ada lagi parsing
+# teks, BOM di header, maupun parsing tanggal %d-%m-%Y.
+#
+# Sidecar menyimpan mtime + ukuran CSV sumbernya di metadata; kalau CSV
+# berubah, sidecar otomatis ditulis ulang.
+import json
+from pathlib import Path
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow opsional -> fallback baca CSV langsung
+    pa = None
+    pq = None
+
+SIDECAR_SUFFIX = ".parquet"
+_META_KEY = b"nike_source"
+
+
+def tersedia():
+    return pq is not None
+
+
+def is_parquet(path):
+    return Path(path).suffix == SIDECAR_SUFFIX
+
+
+def sidecar_path(csv_path):
+    # File Parquet adalah sidecar untuk dirinya sendiri
+    return Path(csv_path).with_suffix(SIDECAR_SUFFIX)
+
+
+def baca_meta(path):
+    # Metadata sumber (dict) yang disimpan di file Parquet, None kalau tidak ada / rusak
+    path = Path(path)
+    if not tersedia() or not path.is_file():
+        return None
+    try:
+        meta = pq.read_schema(path).metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return None
+    raw = meta.get(_META_KEY)
+    return json.loads(raw) if raw else None
+
+
+def tulis_parquet(df, path, meta):
+    # Tulis ke file sementara lalu rename supaya pembaca lain tidak melihat file setengah jadi
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    schema_meta = dict(table.schema.metadata or {})
+    schema_meta[_META_KEY] = json.dumps(meta).encode()
+    table = table.replace_schema_metadata(schema_meta)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(table, tmp, compression="zstd")
+        tmp.replace(path)
+    except OSError:
+        # Folder read-only: tetap jalan tanpa file cache
+        tmp.unlink(missing_ok=True)
+        return None
+    return path
+
+
+def sidecar_valid(csv_path, mtime_ns, size):
+    return baca_meta(sidecar_path(csv_path)) == {"mtime_ns": mtime_ns, "size": size}
+
+
+def tulis_sidecar(df, csv_path, mtime_ns, size):
+    return tulis_parquet(df, sidecar_path(csv_path), {"mtime_ns": mtime_ns, "size": size})
+
+
+def baca_sidecar(csv_path, columns=None):
+    table = pq.read_table(sidecar_path(csv_path), columns=list(columns) if columns else None)
+    return table.to_pandas()
+
+
+def jumlah_baris(csv_path):
+    return pq.read_metadata(sidecar_path(csv_path)).num_rows
@@ -0,0 +1,75 @@
+# ==========================================
+# ROLLUP CUBE: Product x Region x State x Retailer x Sales Method x Bulan
+# ==========================================
+# Cube dibangun sekali per versi file data (cache sama seperti loader).
+# Semua tab dashboard (Top Produk, Analisis Wilayah, GIS) menjawab dari
+# cube ini, jadi biaya query sebanding dengan jumlah sel cube, bukan jumlah
+# baris invoice.
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from . import store
+from .data_loader import DATE_COLUMN, _signature, cari_file_data, load_sales_data
+
+BULAN = "Bulan"
+CUBE_DIMENSIONS = ["Product", "Region", "State", "Retailer", "Sales Method", BULAN]
+CUBE_MEASURES = ["Units Sold", "Total Sales", "Transaksi"]
+
+
+def build_cube(df):
+    data = df[["Product", "Region", "State", "Retailer", "Sales Method"]].copy()
+    # datetime64[M] -> 1 nilai per bulan; NaT (tanggal gagal di-parse) tetap ikut
+    data[BULAN] = df[DATE_COLUMN].to_numpy().astype("datetime64[M]")
+    # Total Sales dijumlah dalam float64 supaya tidak kehilangan presisi
+    data["Units Sold"] = df["Units Sold"].astype("int64")
+    data["Total Sales"] = df["Total Sales"].astype("float64")
+    data["Transaksi"] = np.ones(len(df), dtype="int64")
+
+    cube = (
+        data.groupby(CUBE_DIMENSIONS, observed=True, dropna=False, sort=False)
+        [CUBE_MEASURES].sum()
+        .reset_index()
+    )
+    return cube
+
+
+def gabung_cube(cubes):
+    # Satukan beberapa cube parsial (mis. per chunk file) menjadi satu cube
+    data = pd.concat(cubes, ignore_index=True)
+    cube = (
+        data.groupby(CUBE_DIMENSIONS, observed=True, dropna=False, sort=False)
+        [CUBE_MEASURES].sum()
+        .reset_index()
+    )
+    for col in CUBE_DIMENSIONS[:-1]:
+        cube[col] = cube[col].astype("category")
+    return cube
+
+
+@lru_cache(maxsize=4)
+def _cube_cached(path, mtime_ns, size):
+    if store.is_store(path):
+        # Potongan cube per partisi bulan sudah dihitung saat ingest
+        return store.baca_agg(path, "cube")
+    columns = CUBE_DIMENSIONS[:-1] + [DATE_COLUMN, "Units Sold", "Total Sales"]
+    return build_cube(load_sales_data(path, columns=columns))
+
+
+def load_cube(path=None):
+    path = Path(path) if path else cari_file_data()
+    return _cube_cached(*_signature(path.resolve()))
+
+
+def query_cube(cube, by, filters=None, measures=None):
+    # filters: {kolom: daftar nilai yang diizinkan}, mis. {"Product": [...]}
+    measures = list(measures or CUBE_MEASURES)
+    data = cube
+    if filters:
+        mask = np.ones(len(cube), dtype=bool)
+        for col, values in filters.items():
+            mask &= cube[col].isin(values).to_numpy()
+        data = cube[mask]
+    return data.groupby(by, observed=True)[measures].sum()
@@ -0,0 +1,173 @@
+# ==========================================
+# LOADER DATA PENJUALAN NIKE (CACHED + TYPED)
+# ==========================================
+# Semua dashboard (analisis utama, GIS, visual, tampil_data) membaca CSV
+# yang sama. Modul ini membaca file sekali saja dengan dtype eksplisit,
+# lalu menyimpan hasilnya di memori berdasarkan path + mtime + ukuran file.
+# Rerun Streamlit cukup memakai frame yang sudah ada; file baru dibaca ulang
+# hanya kalau isinya berubah.
+#
+# CSV hanya di-parse sekali: hasilnya disimpan sebagai sidecar Parquet
+# (lihat columnar.py) dan load berikutnya cukup membaca kolom yang dipakai.
+# Kalau store terpartisi hasil ingest (nike_store/, lihat ingest.py) sudah
+# ada, store itu yang dipakai sebagai sumber data.
+import os
+from functools import lru_cache
+from pathlib import Path
+
+import pandas as pd
+
+from . import columnar, store
+from .enrichment import KURS, enrich
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Store terpartisi hasil ingest (lihat ingest.py / store.py)
+STORE_DIR = ROOT_DIR / "nike_store"
+
+# Urutan pencarian data: store hasil ingest dulu (kalau sudah ada), lalu file
+# CSV (sama seperti fallback di masing-masing dashboard)
+DATA_CANDIDATES = (
+    "nike_store",
+    "data_hasil_scrapping.csv",
+    "nike_dataset_scrapping.csv",
+    "dataset keggle/data_hasil_scrapping.csv",
+    "nike_dataset/Nike Dataset.csv",
+)
+
+DATE_COLUMN = "Invoice Date"
+DATE_FORMAT = "%d-%m-%Y"
+
+CATEGORY_COLUMNS = ["Product", "Region", "Retailer", "Sales Method", "State"]
+
+DTYPES = {
+    "Product": "category",
+    "Region": "category",
+    "Retailer": "category",
+    "Sales Method": "category",
+    "State": "category",
+    "Price per Unit": "float32",
+    "Total Sales": "float32",
+    "Units Sold": "int32",
+}
+
+BASE_COLUMNS = [DATE_COLUMN] + list(DTYPES)
+
+# Kolom turunan -> kolom dasar yang dibutuhkan untuk menghitungnya
+DERIVED_COLUMNS = {
+    "Total Sales IDR": "Total Sales",
+    "price per unit IDR": "Price per Unit",
+    "kategori": "Units Sold",
+}
+
+# Proyeksi kolom per tab dashboard
+GIS_COLUMNS = ["State", "Units Sold", "Total Sales"]
+
+
+def cari_file_data(*kandidat):
+    # Cari file CSV (atau store) pertama yang ada, relatif ke working dir lalu ke root repo
+    for nama in kandidat or DATA_CANDIDATES:
+        for base in (Path.cwd(), ROOT_DIR):
+            path = base / nama
+            if path.is_file() or store.is_store(path):
+                return path.resolve()
+    raise FileNotFoundError("File CSV data penjualan tidak ditemukan.")
+
+
+def _signature(path):
+    # Versi store = versi manifest-nya (ditulis ulang di setiap ingest)
+    stat = os.stat(store.manifest_path(path) if store.is_store(path) else path)
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+def _parse_csv(path, usecols=None):
+    df = pd.read_csv(
+        path,
+        dtype=DTYPES,
+        encoding="utf-8-sig",
+        usecols=(lambda c: c.strip() in usecols) if usecols else None,
+    )
+    df.columns = df.columns.str.strip()
+    if DATE_COLUMN in df.columns:
+        df[DATE_COLUMN] = pd.to_datetime(df[DATE_COLUMN], format=DATE_FORMAT, errors="coerce")
+    return df
+
+
+def _base_columns(columns):
+    # Terjemahkan kolom yang diminta (boleh kolom turunan) ke kolom yang ada di file
+    base = []
+    for col in columns:
+        col = DERIVED_COLUMNS.get(col, col)
+        if col not in base:
+            base.append(col)
+    return base
+
+
+def ensure_columnar(path, mtime_ns, size):
+    # Konversi CSV -> Parquet kalau sidecar belum ada / sudah basi
+    if not columnar.tersedia():
+        return False
+    if columnar.is_parquet(path):
+        # path sudah file Parquet (mis. data benchmark) -> dibaca langsung
+        return True
+    if columnar.sidecar_valid(path, mtime_ns, size):
+        return True
+    df = _parse_csv(path)
+    return columnar.tulis_sidecar(df, path, mtime_ns, size) is not None
+
+
+def compact(df):
+    # Downcast numerik: Units Sold ke int terkecil yang muat (biasanya int16).
+    # Kolom string sudah category (kode 1 byte), harga & total float32.
+    if "Units Sold" in df.columns and len(df):
+        df["Units Sold"] = pd.to_numeric(df["Units Sold"], downcast="integer")
+    return df
+
+
+def footprint(df):
+    # Memori frame (deep, termasuk kamus category) -> (total byte, byte per baris)
+    total = int(df.memory_usage(deep=True).sum())
+    return total, total / max(1, len(df))
+
+
+@lru_cache(maxsize=2)
+def _load_cached(path, mtime_ns, size, base):
+    # Hanya kolom dasar yang di-cache (tanpa kolom turunan / kurs);
+    # mtime_ns & size hanya dipakai sebagai kunci cache
+    if store.is_store(path):
+        return compact(store.baca_sales(path, base or BASE_COLUMNS))
+    if ensure_columnar(path, mtime_ns, size):
+        return compact(columnar.baca_sidecar(path, base))
+    return compact(_parse_csv(path, base))
+
+
+def row_count(path=None):
+    # Jumlah baris dari metadata sidecar Parquet (tanpa membaca data)
+    path = Path(path) if path else cari_file_data()
+    sig = _signature(path.resolve())
+    if store.is_store(sig[0]):
+        return store.jumlah_baris(sig[0])
+    if ensure_columnar(*sig):
+        return columnar.jumlah_baris(sig[0])
+    return len(load_sales_data(path, columns=[DATE_COLUMN]))
+
+
+def load_sales_data(path=None, columns=None, kurs=KURS):
+    # Frame hasil cache dipakai bersama antar rerun -> perlakukan sebagai read-only
+    # (pakai .copy() / drop_duplicates() dulu kalau mau mengubah isinya).
+    # columns=None -> semua kolom; atau daftar kolom (mis. GIS_COLUMNS).
+    # kurs dipakai untuk kolom "Total Sales IDR" & "price per unit IDR"; kolom
+    # turunan dihitung di luar cache, jadi ganti kurs tidak memuat ulang data.
+    # Frame ringkas tanpa kolom turunan: columns=BASE_COLUMNS, lalu hitung
+    # kolom IDR / kategori per potongan yang ditampilkan (enrichment.enrich).
+    path = Path(path) if path else cari_file_data()
+    base = tuple(_base_columns(columns)) if columns else None
+    df = _load_cached(*_signature(path.resolve()), base)
+
+    derived = [col for col in (columns or DERIVED_COLUMNS) if col in DERIVED_COLUMNS]
+    if derived:
+        # shallow copy: kolom baru tidak ikut masuk ke frame yang di-cache
+        df = enrich(df.copy(deep=False), float(kurs), derived)
+    if columns and list(df.columns) != list(columns):
+        df = df[list(columns)]
+    return df
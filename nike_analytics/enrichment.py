@@ -0,0 +1,54 @@
+# ==========================================
+# ENRICHMENT: KOLOM IDR + KATEGORI (VEKTORISASI)
+# ==========================================
+# Pengganti .apply(lambda ...) per baris. Kategori dihitung dengan operasi
+# numpy lalu dikemas sebagai Categorical (3 label, 1 byte per baris), kolom
+# IDR dihitung dari kurs yang bisa diatur (default KURS).
+import os
+
+import numpy as np
+import pandas as pd
+
+# Kurs default USD -> IDR, bisa di-override lewat env NIKE_KURS
+KURS = float(os.environ.get("NIKE_KURS", 16900))
+
+# Batas kategori: < 50 Kurang Laku, 50-80 Laku, > 80 Sangat Laku
+BATAS_LAKU = 50
+BATAS_SANGAT_LAKU = 80
+KATEGORI_LABELS = ["Kurang Laku", "Laku", "Sangat Laku"]
+
+
+def kategori_units(units):
+    units = np.asarray(units)
+    codes = (units >= BATAS_LAKU).astype(np.int8) + (units > BATAS_SANGAT_LAKU)
+    kategori = pd.Categorical.from_codes(codes, categories=KATEGORI_LABELS, ordered=True)
+    return kategori
+
+
+def kategori_apply(units):
+    # Versi lama (row-wise), disimpan untuk benchmark pembanding
+    return pd.Series(units).apply(
+        lambda x: "Kurang Laku" if x < 50 else "Laku" if x <= 80 else "Sangat Laku"
+    )
+
+
+def hitung_idr(usd, kurs=KURS):
+    # float64: nilai rupiah melewati presisi float32
+    return np.asarray(usd, dtype="float64") * kurs
+
+
+def enrich(df, kurs=KURS, columns=None):
+    # Tambah kolom turunan ke df (in-place) sesuai kolom dasar yang tersedia.
+    # columns: hanya kolom turunan ini yang dihitung (default: semua).
+    # Dipakai untuk potongan yang ditampilkan (mis. satu halaman tabel), bukan
+    # untuk frame penuh yang di-cache.
+    def perlu(col, base):
+        return base in df.columns and (columns is None or col in columns)
+
+    if perlu("Total Sales IDR", "Total Sales"):
+        df["Total Sales IDR"] = hitung_idr(df["Total Sales"], kurs)
+    if perlu("price per unit IDR", "Price per Unit"):
+        df["price per unit IDR"] = hitung_idr(df["Price per Unit"], kurs)
+    if perlu("kategori", "Units Sold"):
+        df["kategori"] = kategori_units(df["Units Sold"])
+    return df
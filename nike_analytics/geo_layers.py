@@ -0,0 +1,178 @@
+# ==========================================
+# ENGINE LAYER GEO: CHOROPLETH STATE + MARKER CLUSTER
+# ==========================================
+# - Batas state diambil dari GeoJSON lokal (data/us_states.geojson), bukan
+#   polygon persegi yang digambar manual.
+# - Geometri disederhanakan (Douglas-Peucker) per level zoom dan di-cache,
+#   jadi payload peta tetap kecil walau granularitas data bertambah.
+# - Agregat per state di-join ke fitur GeoJSON lewat merge pandas, lalu
+#   dirender sebagai SATU layer choropleth.
+# - Data titik (state sekarang, nanti kota/ZIP) memakai FastMarkerCluster:
+#   titik dikirim sebagai array, marker & cluster dibuat di browser.
+import copy
+import json
+from functools import lru_cache
+from pathlib import Path
+
+import folium
+import numpy as np
+import pandas as pd
+from folium.plugins import FastMarkerCluster
+
+GEOJSON_PATH = Path(__file__).resolve().parent / "data" / "us_states.geojson"
+
+# (zoom maksimum, toleransi simplifikasi dalam derajat, digit desimal koordinat)
+ZOOM_LEVELS = [
+    (4, 0.05, 2),
+    (6, 0.01, 3),
+    (8, 0.002, 4),
+    (99, 0.0, 5),
+]
+
+# Palet YlOrRd 9 kelas untuk choropleth, abu-abu untuk state tanpa data
+PALETTE = ["#ffffcc", "#ffeda0", "#fed976", "#feb24c", "#fd8d3c",
+           "#fc4e2a", "#e31a1c", "#bd0026", "#800026"]
+NO_DATA_COLOR = "#d9d9d9"
+
+
+def level_for_zoom(zoom):
+    for level, (max_zoom, _, _) in enumerate(ZOOM_LEVELS):
+        if zoom <= max_zoom:
+            return level
+    return len(ZOOM_LEVELS) - 1
+
+
+def _douglas_peucker(points, tolerance):
+    # Versi iteratif (stack) supaya aman untuk ring dengan ribuan titik
+    keep = np.zeros(len(points), dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        a, b = points[start], points[end]
+        seg = points[start + 1:end]
+        ab = b - a
+        norm = np.hypot(*ab)
+        if norm == 0:
+            dist = np.hypot(*(seg - a).T)
+        else:
+            dist = np.abs(ab[0] * (seg[:, 1] - a[1]) - ab[1] * (seg[:, 0] - a[0])) / norm
+        idx = int(np.argmax(dist))
+        if dist[idx] > tolerance:
+            mid = start + 1 + idx
+            keep[mid] = True
+            stack.append((start, mid))
+            stack.append((mid, end))
+    return keep
+
+
+def simplify_ring(ring, tolerance, precision):
+    points = np.asarray(ring, dtype=float)
+    if tolerance > 0 and len(points) > 4:
+        simplified = points[_douglas_peucker(points, tolerance)]
+        # Ring tertutup minimal 4 titik; kalau terlalu kecil pakai aslinya
+        if len(simplified) >= 4:
+            points = simplified
+    return np.round(points, precision).tolist()
+
+
+def _simplify_geometry(geometry, tolerance, precision):
+    if geometry["type"] == "Polygon":
+        rings = [simplify_ring(r, tolerance, precision) for r in geometry["coordinates"]]
+        return {"type": "Polygon", "coordinates": rings}
+    polygons = [[simplify_ring(r, tolerance, precision) for r in poly]
+                for poly in geometry["coordinates"]]
+    return {"type": "MultiPolygon", "coordinates": polygons}
+
+
+@lru_cache(maxsize=1)
+def load_state_geojson():
+    with open(GEOJSON_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def state_geojson(level):
+    # GeoJSON state yang sudah disederhanakan untuk satu level zoom (cached)
+    _, tolerance, precision = ZOOM_LEVELS[level]
+    source = load_state_geojson()
+    features = [
+        {
+            "type": "Feature",
+            "id": feature["id"],
+            "properties": dict(feature["properties"]),
+            "geometry": _simplify_geometry(feature["geometry"], tolerance, precision),
+        }
+        for feature in source["features"]
+    ]
+    return {"type": "FeatureCollection", "features": features}
+
+
+def join_state_stats(state_stats, value="Total Sales"):
+    # Join agregat ke urutan fitur GeoJSON + hitung warna & teks tooltip
+    names = pd.DataFrame({"name": [f["properties"]["name"] for f in load_state_geojson()["features"]]})
+    stats = state_stats.assign(State=state_stats["State"].astype(str))
+    joined = names.merge(stats, how="left", left_on="name", right_on="State")
+
+    values = joined[value].to_numpy(dtype=float)
+    has_data = ~np.isnan(values)
+    fill = np.full(len(joined), NO_DATA_COLOR, dtype=object)
+    if has_data.any():
+        vmin, vmax = np.nanmin(values), np.nanmax(values)
+        span = (vmax - vmin) or 1.0
+        bins = np.clip(((values[has_data] - vmin) / span * len(PALETTE)).astype(int), 0, len(PALETTE) - 1)
+        fill[has_data] = np.asarray(PALETTE, dtype=object)[bins]
+    joined["fill"] = fill
+    joined["units_fmt"] = joined["Units Sold"].map(lambda v: f"{v:,.0f}", na_action="ignore").fillna("-")
+    joined["sales_fmt"] = joined["Total Sales"].map(lambda v: f"${v:,.0f}", na_action="ignore").fillna("-")
+    return joined
+
+
+def choropleth_layer(state_stats, zoom=4, value="Total Sales", name="Choropleth Penjualan"):
+    geojson = state_geojson(level_for_zoom(zoom))
+    joined = join_state_stats(state_stats, value)
+
+    features = []
+    props = joined[["fill", "units_fmt", "sales_fmt"]].to_dict("records")
+    for feature, extra in zip(geojson["features"], props):
+        feature = copy.copy(feature)  # geometri tetap dipakai bersama (cached)
+        feature["properties"] = {**feature["properties"], **extra}
+        features.append(feature)
+
+    layer = folium.FeatureGroup(name=name)
+    folium.GeoJson(
+        {"type": "FeatureCollection", "features": features},
+        style_function=lambda f: {
+            "fillColor": f["properties"]["fill"],
+            "color": "#ffffff",
+            "weight": 1,
+            "fillOpacity": 0.7,
+        },
+        highlight_function=lambda f: {"weight": 2, "color": "#555555"},
+        tooltip=folium.GeoJsonTooltip(
+            fields=["name", "units_fmt", "sales_fmt"],
+            aliases=["State", "Units Sold", "Revenue"],
+        ),
+    ).add_to(layer)
+    return layer
+
+
+_CLUSTER_CALLBACK = """
+function (row) {
+    var icon = L.AwesomeMarkers.icon({icon: 'shopping-cart', prefix: 'fa', markerColor: 'red'});
+    var marker = L.marker(new L.LatLng(row[0], row[1]), {icon: icon});
+    marker.bindPopup(row[2], {maxWidth: 250});
+    marker.bindTooltip(row[3]);
+    return marker;
+}
+"""
+
+
+def cluster_layer(points, name="Titik Penjualan"):
+    # points: DataFrame kolom lat, lon, popup (HTML), tooltip
+    data = points[["lat", "lon", "popup", "tooltip"]].to_numpy().tolist()
+    layer = folium.FeatureGroup(name=name)
+    FastMarkerCluster(data, callback=_CLUSTER_CALLBACK).add_to(layer)
+    return layer
@@ -0,0 +1,126 @@
+# ==========================================
+# PARSER KARTU PRODUK NIKE (BACKEND BISA DIGANTI)
+# ==========================================
+# Satu fungsi per backend, masing-masing mengambil nama, harga text, harga
+# angka, link dan gambar untuk semua div.product-card dalam satu lintasan:
+#   - "selectolax" : parser C (lexbor), paling cepat
+#   - "lxml"       : libxml2 + XPath
+#   - "bs4"        : BeautifulSoup html.parser (pure Python, fallback)
+# Backend default = yang tercepat yang ter-install.
+import re
+from urllib.parse import urljoin
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import lxml.html as lxml_html
+except ImportError:
+    lxml_html = None
+
+_NON_DIGIT = re.compile(r"\D")
+
+
+def clean_price(text):
+    num = _NON_DIGIT.sub("", text)
+    return int(num) if num else 0
+
+
+def _parse_selectolax(html, page_url):
+    products = []
+    for card in LexborHTMLParser(html).css("div.product-card"):
+        title = card.css_first(".product-card__title")
+        price = card.css_first(".product-price")
+        link = card.css_first("a")
+        href = link.attributes.get("href") if link is not None else None
+        if title is None or price is None or href is None:
+            continue
+        img = card.css_first("img")
+        price_text = price.text(deep=True, separator="", strip=True)
+        products.append([
+            title.text(deep=True, separator="", strip=True),
+            price_text,
+            clean_price(price_text),
+            urljoin(page_url, href),
+            (img.attributes.get("src") or "") if img is not None else "",
+        ])
+    return products
+
+
+def _has_class(name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+_XP_CARDS = f"//div[{_has_class('product-card')}]"
+_XP_TITLE = f".//*[{_has_class('product-card__title')}]"
+_XP_PRICE = f".//*[{_has_class('product-price')}]"
+
+
+def _lxml_text(el):
+    # sama dengan get_text(strip=True) di BeautifulSoup
+    return "".join(t.strip() for t in el.itertext())
+
+
+def _parse_lxml(html, page_url):
+    products = []
+    if not html.strip():
+        return products
+    tree = lxml_html.fromstring(html)
+    for card in tree.xpath(_XP_CARDS):
+        title = card.xpath(_XP_TITLE)
+        price = card.xpath(_XP_PRICE)
+        link = card.xpath(".//a")
+        if not title or not price or not link or link[0].get("href") is None:
+            continue
+        img = card.xpath(".//img")
+        price_text = _lxml_text(price[0])
+        products.append([
+            _lxml_text(title[0]),
+            price_text,
+            clean_price(price_text),
+            urljoin(page_url, link[0].get("href")),
+            (img[0].get("src") or "") if img else "",
+        ])
+    return products
+
+
+def _parse_bs4(html, page_url):
+    from bs4 import BeautifulSoup
+
+    products = []
+    for card in BeautifulSoup(html, "html.parser").select("div.product-card"):
+        title = card.select_one(".product-card__title")
+        price = card.select_one(".product-price")
+        link = card.select_one("a")
+        if title is None or price is None or link is None or not link.has_attr("href"):
+            continue
+        img = card.select_one("img")
+        price_text = price.get_text(strip=True)
+        products.append([
+            title.get_text(strip=True),
+            price_text,
+            clean_price(price_text),
+            urljoin(page_url, link["href"]),
+            img.get("src", "") if img else "",
+        ])
+    return products
+
+
+BACKENDS = {"bs4": _parse_bs4}
+if lxml_html is not None:
+    BACKENDS["lxml"] = _parse_lxml
+if LexborHTMLParser is not None:
+    BACKENDS["selectolax"] = _parse_selectolax
+
+DEFAULT_BACKEND = next(b for b in ("selectolax", "lxml", "bs4") if b in BACKENDS)
+
+
+def parse_cards(html, page_url="https://www.nike.com/", backend=None):
+    # Kartu tanpa judul/harga/link (mis. banner promo) dilewati
+    try:
+        parser = BACKENDS[backend or DEFAULT_BACKEND]
+    except KeyError:
+        raise ValueError(f"Backend parser tidak tersedia: {backend}") from None
+    return parser(html, page_url)
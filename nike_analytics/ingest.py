@@ -0,0 +1,159 @@
+# ==========================================
+# INGEST FILE INVOICE BARU KE STORE TERPARTISI
+# ==========================================
+# Ambil file CSV / Excel invoice baru, validasi + bersihkan (sama seperti
+# tampil_data.py: strip spasi, State jadi Title Case, baris duplikat dibuang),
+# lalu append ke store tahun/bulan (lihat store.py). Duplikat terhadap data
+# lama dicek lewat hash baris per partisi, jadi yang dibaca hanya file baru
+# + hash partisi yang tersentuh. Agregat (potongan cube & bucket harian)
+# dihitung ulang hanya untuk partisi yang tersentuh.
+#
+# Jalankan dari root repo:
+#   python -m nike_analytics.ingest "dataset keggle/data_hasil_scrapping.csv"
+#   python -m nike_analytics.ingest invoice_baru.xlsx --store nike_store
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from . import store
+from .cube import build_cube
+from .data_loader import BASE_COLUMNS, CATEGORY_COLUMNS, DATE_COLUMN, DATE_FORMAT, DTYPES, STORE_DIR
+from .timeseries import bucket_harian
+
+EXCEL_SUFFIXES = (".xlsx", ".xls")
+NUMERIC_COLUMNS = ["Price per Unit", "Total Sales", "Units Sold"]
+
+
+def baca_file(path):
+    # Semua kolom dibaca sebagai teks dulu; tipe diatur di validasi()
+    path = Path(path)
+    if path.suffix.lower() in EXCEL_SUFFIXES:
+        df = pd.read_excel(path, dtype=str)
+    else:
+        df = pd.read_csv(path, dtype=str, encoding="utf-8-sig")
+    df.columns = df.columns.str.strip()
+    return df
+
+
+def validasi(df):
+    # Return (baris valid dengan dtype loader, jumlah baris yang ditolak)
+    hilang = [col for col in BASE_COLUMNS if col not in df.columns]
+    if hilang:
+        raise ValueError(f"Kolom wajib tidak ada: {', '.join(hilang)}")
+
+    data = df[BASE_COLUMNS].copy()
+    for col in CATEGORY_COLUMNS:
+        data[col] = data[col].astype("string").str.strip()
+    data["State"] = data["State"].str.title()
+    # Tanggal %d-%m-%Y (format CSV); sel tanggal Excel terbaca sebagai ISO
+    raw = data[DATE_COLUMN].str.strip()
+    tanggal = pd.to_datetime(raw, format=DATE_FORMAT, errors="coerce")
+    iso = tanggal.isna() & raw.notna()
+    tanggal[iso] = pd.to_datetime(raw[iso], format="ISO8601", errors="coerce")
+    data[DATE_COLUMN] = tanggal
+    for col in NUMERIC_COLUMNS:
+        data[col] = pd.to_numeric(data[col].str.strip(), errors="coerce").astype("float64")
+
+    valid = data[DATE_COLUMN].notna()
+    for col in CATEGORY_COLUMNS:
+        valid &= data[col].notna() & (data[col] != "")
+    for col in NUMERIC_COLUMNS:
+        valid &= data[col].notna() & (data[col] >= 0)
+    valid &= data["Units Sold"] % 1 == 0
+    valid = valid.to_numpy(dtype=bool)
+
+    data = data[valid].astype({col: str for col in CATEGORY_COLUMNS}).astype(DTYPES)
+    return data.reset_index(drop=True), int((~valid).sum())
+
+
+def row_hashes(df):
+    # Hash per baris atas nilai (bukan kode category) -> stabil antar file
+    nilai = df[BASE_COLUMNS].astype({col: str for col in CATEGORY_COLUMNS})
+    return pd.util.hash_pandas_object(nilai, index=False).to_numpy()
+
+
+def hitung_agg(store_dir, key, manifest, versi):
+    # Potongan cube & bucket harian untuk satu partisi (dari semua file part-nya);
+    # return nama file agg per jenis (dicatat di manifest)
+    data = store.baca_sales(store_dir, keys=[key], manifest=manifest)
+    return {
+        "cube": store.tulis_agg(store_dir, key, "cube", build_cube(data), versi),
+        "harian": store.tulis_agg(store_dir, key, "harian", bucket_harian(data), versi),
+    }
+
+
+def ingest(files, store_dir=STORE_DIR):
+    # Return ringkasan: baris dibaca / ditolak / duplikat / ditambahkan + partisi tersentuh
+    if not store.tersedia():
+        raise RuntimeError("pyarrow belum terpasang; store terpartisi butuh pyarrow.")
+
+    ringkasan = {"dibaca": 0, "ditolak": 0, "duplikat": 0, "ditambahkan": 0, "partisi": []}
+    frames = []
+    for path in files:
+        df = baca_file(path)
+        data, ditolak = validasi(df)
+        ringkasan["dibaca"] += len(df)
+        ringkasan["ditolak"] += ditolak
+        frames.append(data)
+    if not frames:
+        return ringkasan
+
+    baru = pd.concat(frames, ignore_index=True)
+    hashes = row_hashes(baru)
+    # duplikat di dalam file baru sendiri (seperti drop_duplicates di tampil_data)
+    _, pertama = np.unique(hashes, return_index=True)
+    unik = np.zeros(len(baru), dtype=bool)
+    unik[pertama] = True
+
+    manifest = store.baca_manifest(store_dir)
+    versi = manifest["versi"] + 1
+    tanggal = baru[DATE_COLUMN].dt
+    periode = (tanggal.year * 100 + tanggal.month).to_numpy()
+
+    for p in np.unique(periode):
+        key = store.partisi_key(p // 100, p % 100)
+        info = manifest["partisi"].get(key, {"rows": 0, "files": []})
+        mask = (periode == p) & unik
+        lama = store.baca_hashes(store_dir, key, info["rows"])
+        mask &= ~np.isin(hashes, lama)
+        if not mask.any():
+            continue
+
+        name = store.append_partisi(store_dir, key, baru[mask], np.concatenate([lama, hashes[mask]]), versi)
+        info = {"rows": info["rows"] + int(mask.sum()), "files": info["files"] + [name]}
+        manifest["partisi"][key] = info
+        info["agg"] = hitung_agg(store_dir, key, manifest, versi)
+        ringkasan["ditambahkan"] += int(mask.sum())
+        ringkasan["partisi"].append(key)
+
+    ringkasan["duplikat"] = len(baru) - ringkasan["ditambahkan"]
+    if ringkasan["partisi"]:
+        manifest["versi"] = versi
+        store.tulis_manifest(store_dir, manifest)
+        store.hapus_agg_lama(store_dir, manifest, ringkasan["partisi"])
+    return ringkasan
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ingest file invoice (CSV / Excel) ke store terpartisi.")
+    parser.add_argument("files", nargs="+", help="file .csv / .xlsx invoice baru")
+    parser.add_argument("--store", default=str(STORE_DIR), help="folder store (default: nike_store/)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    store_dir = Path(args.store)
+    store_dir.mkdir(parents=True, exist_ok=True)
+    hasil = ingest(args.files, store_dir)
+    print(
+        f"dibaca {hasil['dibaca']:,} baris · ditolak {hasil['ditolak']:,} · "
+        f"duplikat {hasil['duplikat']:,} · ditambahkan {hasil['ditambahkan']:,}"
+    )
+    print(f"partisi tersentuh ({len(hasil['partisi'])}): {', '.join(hasil['partisi']) or '-'}")
+    print(f"total baris di store: {store.jumlah_baris(store_dir):,} ({time.perf_counter() - start:.2f} s)")
+
+
+if __name__ == "__main__":
+    main()
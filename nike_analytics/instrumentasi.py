@@ -0,0 +1,194 @@
+# ==========================================
+# INSTRUMENTASI PER TAHAP (WAKTU, BARIS, PUNCAK MEMORI) PER RERUN
+# ==========================================
+# Tiap tahap dashboard dibungkus:
+#     with tahap("query wilayah") as t:
+#         regional_stats = backend.regional(filter_produk)
+#         t.rows = len(regional_stats)
+# atau dengan decorator @instrumen("nama").
+#
+# - Selalu: durasi masuk profil startup (startup.PROFIL, pertama/terakhir).
+# - Kalau mode debug aktif (mulai_rerun(aktif=True)): tiap tahap dicatat
+#   lengkap untuk rerun ini: waktu mulai, durasi, jumlah baris, tahap induk,
+#   dan (opsional) puncak memori lewat tracemalloc. Hasilnya bisa ditampilkan
+#   sebagai tabel atau diekspor sebagai file trace (format Chrome trace
+#   event, bisa dibuka di chrome://tracing atau ui.perfetto.dev).
+#
+# Catatan saat debug mati: tahap() hanya memanggil perf_counter dua kali;
+# tracemalloc tidak dinyalakan. tracemalloc berlaku untuk seluruh proses,
+# jadi angka memori juga mencakup sesi lain yang sedang berjalan, dan
+# tracemalloc baru dimatikan setelah tidak ada sesi yang memintanya lagi.
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from functools import wraps
+
+from . import startup
+
+# state per thread: tiap sesi Streamlit menjalankan script di thread sendiri
+_lokal = threading.local()
+_tracemalloc_kita = False
+# sesi yang meminta pengukuran memori: id sesi -> waktu rerun terakhirnya.
+# Sesi yang tab browsernya ditutup tidak pernah "melepas" permintaannya,
+# jadi permintaan tanpa rerun selama PEMINTA_KADALUARSA detik dianggap selesai.
+_peminta_memori = {}
+_tracemalloc_lock = threading.Lock()
+PEMINTA_KADALUARSA = 600
+
+
+class _Tahap:
+
+    __slots__ = ("nama", "rows", "mulai", "durasi", "induk", "puncak", "_awal_mem", "_puncak_luar")
+
+    def __init__(self, nama, rows=None, induk=None):
+        self.nama = nama
+        self.rows = rows
+        self.induk = induk
+        self.mulai = 0.0
+        self.durasi = 0.0
+        self.puncak = None
+        self._awal_mem = 0
+        self._puncak_luar = 0
+
+
+class _Mati:
+    # Dipakai saat debug mati; atribut yang di-set (mis. rows) diabaikan
+    rows = None
+
+    def __setattr__(self, name, value):
+        pass
+
+
+_MATI = _Mati()
+
+
+def aktif():
+    return getattr(_lokal, "run", None) is not None
+
+
+def _atur_tracemalloc(sesi, perlu):
+    # tracemalloc menyala selama masih ada sesi yang meminta; hanya
+    # tracemalloc yang dinyalakan modul ini yang dimatikan lagi
+    global _tracemalloc_kita
+    with _tracemalloc_lock:
+        now = time.monotonic()
+        if perlu:
+            _peminta_memori[sesi] = now
+        else:
+            _peminta_memori.pop(sesi, None)
+        for lama in [k for k, t in _peminta_memori.items() if now - t > PEMINTA_KADALUARSA]:
+            del _peminta_memori[lama]
+        if _peminta_memori and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracemalloc_kita = True
+        elif not _peminta_memori and _tracemalloc_kita and tracemalloc.is_tracing():
+            tracemalloc.stop()
+            _tracemalloc_kita = False
+
+
+def mulai_rerun(aktif=False, memori=False, sesi=None):
+    # Panggil di awal script; return list tahap rerun ini (diisi selama
+    # rerun berjalan), atau None kalau debug mati.
+    # sesi: id sesi pemanggil (default: thread ini)
+    _lokal.run = [] if aktif else None
+    _lokal.stack = []
+    _lokal.memori = aktif and memori
+    _atur_tracemalloc(threading.get_ident() if sesi is None else sesi, _lokal.memori)
+    return _lokal.run
+
+
+@contextmanager
+def tahap(nama, rows=None):
+    run = getattr(_lokal, "run", None)
+    if run is None:
+        with startup.tahap(nama):
+            yield _MATI
+        return
+
+    stack = _lokal.stack
+    t = _Tahap(nama, rows, stack[-1].nama if stack else None)
+    memori = _lokal.memori and tracemalloc.is_tracing()
+    if memori:
+        # puncak tahap induk sejauh ini disimpan dulu sebelum reset_peak
+        current, peak = tracemalloc.get_traced_memory()
+        if stack:
+            induk = stack[-1]
+            induk._puncak_luar = max(induk._puncak_luar, peak)
+        t._awal_mem = current
+        tracemalloc.reset_peak()
+
+    stack.append(t)
+    with startup.tahap(nama):
+        t.mulai = time.perf_counter()
+        try:
+            yield t
+        finally:
+            t.durasi = time.perf_counter() - t.mulai
+            stack.pop()
+            if memori:
+                peak = max(tracemalloc.get_traced_memory()[1], t._puncak_luar)
+                t.puncak = max(0, peak - t._awal_mem)
+                if stack:
+                    # peak tracemalloc tidak di-reset -> tetap terlihat oleh induk
+                    stack[-1]._puncak_luar = max(stack[-1]._puncak_luar, peak)
+            run.append(t)
+
+
+def instrumen(nama=None, rows=None):
+    # Decorator: seluruh pemanggilan fungsi = satu tahap.
+    # rows(hasil) -> jumlah baris yang diproses (opsional)
+    def deco(fn):
+        label = nama or fn.__name__
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with tahap(label) as t:
+                hasil = fn(*args, **kwargs)
+                if rows is not None:
+                    t.rows = rows(hasil)
+                return hasil
+        return wrapper
+    return deco
+
+
+def tabel(run):
+    # DataFrame tahap satu rerun, urut waktu mulai
+    import pandas as pd
+
+    t0 = min((t.mulai for t in run), default=0.0)
+    rows = [
+        {
+            "Tahap": t.nama,
+            "Induk": t.induk or "",
+            "Mulai (ms)": (t.mulai - t0) * 1000,
+            "Durasi (ms)": t.durasi * 1000,
+            "Baris": t.rows,
+            "Puncak memori (MB)": None if t.puncak is None else t.puncak / 1e6,
+        }
+        for t in sorted(run, key=lambda t: t.mulai)
+    ]
+    return pd.DataFrame(rows, columns=["Tahap", "Induk", "Mulai (ms)", "Durasi (ms)", "Baris", "Puncak memori (MB)"])
+
+
+def trace_events(runs):
+    # Chrome trace event ("X" = complete event); satu rerun = satu baris (tid)
+    events = []
+    for i, run in enumerate(runs, start=1):
+        events.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": i, "args": {"name": f"rerun {i}"}})
+        for t in run:
+            args = {}
+            if t.rows is not None:
+                args["rows"] = int(t.rows)
+            if t.puncak is not None:
+                args["puncak_mb"] = round(t.puncak / 1e6, 3)
+            events.append({
+                "name": t.nama, "cat": "dashboard", "ph": "X", "pid": 1, "tid": i,
+                "ts": round(t.mulai * 1e6, 1), "dur": round(t.durasi * 1e6, 1), "args": args,
+            })
+    return events
+
+
+def trace_json(runs):
+    return json.dumps({"traceEvents": trace_events(runs), "displayTimeUnit": "ms"})
@@ -0,0 +1,308 @@
+# ==========================================
+# LAPORAN BATCH HEADLESS (HTML + PNG STATIS) PER REGION / STATE
+# ==========================================
+# Laporan malam untuk semua region dan state, tanpa Streamlit. Tiap laporan
+# berisi isi yang sama dengan dashboard 3_tugas:
+#   - grafik bar (visual_bar_chart.py, gaya "visual"): per Region untuk
+#     laporan nasional, per State untuk laporan region, per Retailer untuk
+#     laporan state
+#   - Top Produk (Units Sold, dibagi Sangat Laku / Laku / Kurang Laku)
+#   - peta state (gis.py, gaya "gis") yang di-zoom ke wilayah laporan
+#   - metrik ringkasan (Total Sales USD / IDR, Units Sold, Transaksi, ...)
+#
+# Alur:
+#   1. proses utama membangun rollup cube (cube.py) sekali, lalu menulisnya
+#      sebagai file Arrow IPC tanpa kompresi di .cache/laporan/
+#   2. laporan dibagi ke process pool; initializer tiap worker memetakan file
+#      itu dengan memory map (pa.memory_map) -> data dimuat sekali per worker,
+#      halaman file dibagi lewat page cache OS, kolom angka dipakai tanpa
+#      salinan (to_pandas(split_blocks=True))
+#   3. tiap worker menulis <out>/<level>/<nama>/index.html + bar.png + peta.html;
+#      proses utama menulis <out>/index.html berisi tautan semua laporan
+#
+# Grafik dan peta (matplotlib / folium) yang paling berat, jadi waktu total
+# turun sebanding jumlah core sampai --workers = jumlah core.
+#
+# Jalankan dari root repo:
+#   python -m nike_analytics.laporan
+#   python -m nike_analytics.laporan --level state --workers 8 --out laporan/malam_ini
+import argparse
+import hashlib
+import html
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import pandas as pd
+
+from . import columnar
+from .charts import regional_bar_png
+from .cube import BULAN, CUBE_MEASURES, load_cube, query_cube
+from .data_loader import ROOT_DIR, _signature, cari_file_data
+from .enrichment import KATEGORI_LABELS, KURS, hitung_idr
+
+LAPORAN_DIR = ROOT_DIR / "laporan"
+SHARED_DIR = ROOT_DIR / ".cache" / "laporan"
+LEVELS = ("nasional", "region", "state")
+TOP_N = 10
+
+# Padding (derajat) di sekitar state saat peta di-zoom ke wilayah laporan
+PAD_LAT = 2.0
+PAD_LON = 3.0
+
+# data bersama milik worker (diisi initializer, sekali per proses)
+_WORKER = {}
+
+_CSS = """
+body { font-family: Arial, sans-serif; margin: 24px auto; max-width: 1100px; color: #222; }
+h1 { margin-bottom: 4px; }
+.sub { color: #666; margin-top: 0; }
+.metrik { display: flex; flex-wrap: wrap; gap: 12px; margin: 16px 0; }
+.metrik div { border: 1px solid #ddd; border-radius: 6px; padding: 10px 14px; min-width: 150px; }
+.metrik b { display: block; font-size: 20px; margin-top: 4px; }
+table { border-collapse: collapse; margin: 8px 0 16px; }
+th, td { border-bottom: 1px solid #eee; padding: 4px 10px; text-align: left; }
+img { max-width: 100%; }
+iframe { width: 100%; height: 520px; border: 1px solid #ddd; }
+"""
+
+
+def slug(nama):
+    return "".join(c if c.isalnum() else "-" for c in str(nama).lower()).strip("-")
+
+
+def shared_path(path):
+    # File Arrow bersama per versi file data (sama seperti sidecar / cache lain)
+    tag = hashlib.sha1(repr(_signature(path)).encode("utf-8")).hexdigest()[:12]
+    return SHARED_DIR / f"cube-{Path(path).stem}-{tag}.arrow"
+
+
+def siapkan_data(path):
+    # Tulis cube ke file Arrow IPC (sekali per versi data); return path file,
+    # atau None kalau pyarrow tidak ada (worker lalu membangun cube sendiri)
+    if not columnar.tersedia():
+        return None
+    import pyarrow as pa
+
+    out = shared_path(path)
+    if out.is_file():
+        return out
+    out.parent.mkdir(parents=True, exist_ok=True)
+    table = pa.Table.from_pandas(load_cube(path), preserve_index=False)
+    tmp = out.with_name(out.name + ".tmp")
+    # tanpa kompresi supaya bisa dipetakan langsung (zero-copy)
+    with pa.OSFile(str(tmp), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    tmp.replace(out)
+    return out
+
+
+def baca_data(shared, path):
+    if shared is None:
+        return load_cube(path)
+    import pyarrow as pa
+
+    # Mapping tetap terbuka selama tabel / frame masih dipakai
+    source = pa.memory_map(str(shared), "r")
+    return pa.ipc.open_file(source).read_all().to_pandas(split_blocks=True)
+
+
+def _impor_berat():
+    # Di Linux (fork) worker mewarisi modul yang sudah diimpor proses utama,
+    # jadi matplotlib / seaborn / folium cukup diimpor sekali sebelum pool
+    import folium
+    import matplotlib.figure
+    import seaborn
+
+
+def _init_worker(shared, path, out_dir):
+    _WORKER["cube"] = baca_data(shared, path)
+    _WORKER["out"] = Path(out_dir)
+
+
+def daftar_tugas(cube, levels):
+    # [(level, nama, filter cube)] untuk semua laporan yang diminta
+    tugas = []
+    if "nasional" in levels:
+        tugas.append(("nasional", "Nasional", None))
+    for level, col in (("region", "Region"), ("state", "State")):
+        if level in levels:
+            for nama in sorted(cube[col].dropna().unique().astype(str)):
+                tugas.append((level, nama, {col: [nama]}))
+    return tugas
+
+
+def top_produk(cube, filters):
+    produk = query_cube(cube, "Product", filters, ["Units Sold", "Total Sales"])
+    produk = produk.sort_values("Units Sold", ascending=False).reset_index()
+    # Dibagi tiga seperti tab Top Produk dashboard (urutan sudah dari terlaris)
+    bagi = max(1, len(produk) // 3)
+    urutan = pd.Series(range(len(produk))) // bagi
+    produk["Kategori"] = urutan.clip(upper=2).map(dict(enumerate(reversed(KATEGORI_LABELS))))
+    return produk.head(TOP_N)
+
+
+def ringkasan(cube, filters, level, bar_perf):
+    per_bulan = query_cube(cube, BULAN, filters, CUBE_MEASURES)
+    total = float(per_bulan["Total Sales"].sum())
+    bulan = per_bulan.index.dropna()
+    periode = f"{bulan.min():%m/%Y} - {bulan.max():%m/%Y}" if len(bulan) else "-"
+    teratas = {"nasional": "Wilayah Penjualan Tertinggi", "region": "State Tertinggi",
+               "state": "Retailer Tertinggi"}[level]
+    return {
+        "Total Penjualan": f"${total:,.0f}",
+        "Total Penjualan (IDR)": f"Rp{hitung_idr(total, KURS):,.0f}",
+        "Units Sold": f"{int(per_bulan['Units Sold'].sum()):,}",
+        "Transaksi": f"{int(per_bulan['Transaksi'].sum()):,}",
+        teratas: str(bar_perf.idxmax()) if len(bar_perf) else "-",
+        "Periode": periode,
+    }, total
+
+
+def buat_peta(state_stats):
+    # Peta gis.py (base map + marker per state), dibangun baru per laporan
+    import folium
+
+    from .peta import buat_map, marker_layer, state_points
+
+    m = buat_map("gis")
+    marker_layer(state_stats, "gis").add_to(m)
+    points = state_points(state_stats, "gis")
+    if len(points):
+        m.fit_bounds([
+            [points["lat"].min() - PAD_LAT, points["lon"].min() - PAD_LON],
+            [points["lat"].max() + PAD_LAT, points["lon"].max() + PAD_LON],
+        ])
+    folium.LayerControl().add_to(m)
+    return m
+
+
+def _tabel_html(produk):
+    tabel = produk[["Product", "Units Sold", "Total Sales", "Kategori"]].copy()
+    tabel["Units Sold"] = tabel["Units Sold"].map("{:,.0f}".format)
+    tabel["Total Sales"] = tabel["Total Sales"].map("${:,.0f}".format)
+    return tabel.to_html(index=False, border=0)
+
+
+def _halaman(judul, sub, metrik, produk, kembali):
+    kotak = "".join(
+        f"<div>{html.escape(k)}<b>{html.escape(v)}</b></div>" for k, v in metrik.items()
+    )
+    return f"""<!DOCTYPE html>
+<html lang="id"><head><meta charset="utf-8"><title>{html.escape(judul)}</title>
+<style>{_CSS}</style></head><body>
+<p><a href="{kembali}">&larr; semua laporan</a></p>
+<h1>{html.escape(judul)}</h1>
+<p class="sub">{html.escape(sub)}</p>
+<div class="metrik">{kotak}</div>
+<h2>Performa Penjualan</h2>
+<img src="bar.png" alt="grafik bar total sales">
+<h2>Top Produk</h2>
+{_tabel_html(produk)}
+<h2>Peta Penjualan</h2>
+<iframe src="peta.html" title="peta penjualan per state"></iframe>
+</body></html>
+"""
+
+
+def buat_laporan(level, nama, filters, cube=None, out_dir=None):
+    # Satu laporan -> folder <out>/<level>/<slug>/; return info untuk index
+    start = time.perf_counter()
+    cube = _WORKER["cube"] if cube is None else cube
+    out_dir = _WORKER["out"] if out_dir is None else Path(out_dir)
+    folder = out_dir / level / slug(nama)
+    folder.mkdir(parents=True, exist_ok=True)
+
+    bar_by, style = {"nasional": ("Region", "visual"), "region": ("State", "laporan_region"),
+                     "state": ("Retailer", "laporan_state")}[level]
+    bar_perf = query_cube(cube, bar_by, filters, ["Total Sales"])["Total Sales"].sort_values(ascending=True)
+    (folder / "bar.png").write_bytes(regional_bar_png(bar_perf, style))
+
+    state_stats = query_cube(cube, "State", filters, ["Units Sold", "Total Sales"]).reset_index()
+    buat_peta(state_stats).save(str(folder / "peta.html"))
+
+    metrik, total = ringkasan(cube, filters, level, bar_perf)
+    judul = f"Laporan Penjualan Nike - {nama}"
+    sub = {"nasional": "Seluruh wilayah", "region": f"Region {nama}", "state": f"State {nama}"}[level]
+    halaman = _halaman(judul, sub, metrik, top_produk(cube, filters), "../../index.html")
+    (folder / "index.html").write_text(halaman, encoding="utf-8")
+    return {
+        "level": level, "nama": nama, "href": f"{level}/{slug(nama)}/index.html",
+        "total": total, "detik": time.perf_counter() - start, "pid": os.getpid(),
+    }
+
+
+def _tugas_worker(tugas):
+    return buat_laporan(*tugas)
+
+
+def tulis_index(out_dir, hasil, judul="Laporan Penjualan Nike"):
+    baris = []
+    for h in sorted(hasil, key=lambda h: (LEVELS.index(h["level"]), -h["total"])):
+        baris.append(
+            f"<tr><td>{h['level']}</td><td><a href=\"{h['href']}\">{html.escape(h['nama'])}</a></td>"
+            f"<td>${h['total']:,.0f}</td></tr>"
+        )
+    halaman = f"""<!DOCTYPE html>
+<html lang="id"><head><meta charset="utf-8"><title>{judul}</title>
+<style>{_CSS}</style></head><body>
+<h1>{judul}</h1>
+<p class="sub">Dibuat {time.strftime('%d-%m-%Y %H:%M')} &middot; {len(hasil)} laporan</p>
+<table><tr><th>Level</th><th>Nama</th><th>Total Sales</th></tr>
+{''.join(baris)}
+</table></body></html>
+"""
+    path = Path(out_dir) / "index.html"
+    path.write_text(halaman, encoding="utf-8")
+    return path
+
+
+def jalankan(path=None, out_dir=None, levels=LEVELS, workers=None):
+    # Return (hasil per laporan, detik). workers <= 1 -> di proses ini saja
+    path = Path(path) if path else cari_file_data()
+    out_dir = Path(out_dir) if out_dir else LAPORAN_DIR / time.strftime("%Y-%m-%d")
+    out_dir.mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    shared = siapkan_data(path)
+    cube = baca_data(shared, path)
+    tugas = daftar_tugas(cube, levels)
+
+    # tanpa tugas (mis. data kosong) -> tidak perlu pool; index tetap ditulis
+    if workers <= 1 or not tugas:
+        hasil = [buat_laporan(*t, cube=cube, out_dir=out_dir) for t in tugas]
+    else:
+        _impor_berat()
+        hasil = []
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(tugas)), initializer=_init_worker,
+            initargs=(shared, path, out_dir),
+        ) as pool:
+            futures = [pool.submit(_tugas_worker, t) for t in tugas]
+            for future in as_completed(futures):
+                hasil.append(future.result())
+    tulis_index(out_dir, hasil)
+    return hasil, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Buat laporan penjualan HTML/PNG statis per region dan state.")
+    parser.add_argument("--data", default=None, help="file CSV / Parquet / store (default: cari otomatis)")
+    parser.add_argument("--out", default=None, help="folder output (default: laporan/<tanggal>)")
+    parser.add_argument("--level", nargs="+", choices=LEVELS, default=list(LEVELS))
+    parser.add_argument("--workers", type=int, default=None, help="jumlah proses (default: jumlah core)")
+    args = parser.parse_args(argv)
+
+    out_dir = Path(args.out) if args.out else LAPORAN_DIR / time.strftime("%Y-%m-%d")
+    hasil, detik = jalankan(args.data, out_dir, args.level, args.workers)
+    per_level = pd.Series([h["level"] for h in hasil]).value_counts()
+    proses = len({h["pid"] for h in hasil})
+    print(", ".join(f"{n} {level}" for level, n in per_level.items()) + f" laporan -> {out_dir}")
+    print(f"selesai {detik:.2f} s dengan {proses} proses "
+          f"(rata-rata {sum(h['detik'] for h in hasil) / max(1, len(hasil)):.2f} s per laporan)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+# ==========================================
+# LAYER PETA GIS (BASE MAP CACHED + MARKER DINAMIS)
+# ==========================================
+# Bagian statis peta (tiles, 5 polygon region, posisi marker per state)
+# dibangun sekali lalu di-cache. Saat filter berubah, yang dibangun ulang
+# hanya FeatureGroup marker berisi angka agregat per state, dan dikirim ke
+# st_folium lewat `feature_group_to_add` sehingga base map tidak ikut
+# dibuat ulang / di-remount di browser.
+# st_folium menempelkan feature group itu ke peta yang diberikan, jadi tiap
+# pemanggil mendapat salinan (deepcopy, id elemen tetap sama) dari peta yang
+# di-cache, bukan objek cache-nya.
+import copy
+from functools import lru_cache
+from string import Formatter
+
+import folium
+import pandas as pd
+from folium.utilities import JsCode
+
+CENTER = (37.0902, -95.7129)
+ZOOM_START = 4
+
+# Koordinat titik tengah state (satu tabel untuk semua dashboard)
+STATE_COORDS = {
+    "California": [36.7783, -119.4179], "Texas": [31.9686, -99.9018],
+    "New York": [43.2994, -74.2179], "Illinois": [40.6331, -89.3985],
+    "Pennsylvania": [41.2033, -77.1945], "Nevada": [38.8026, -116.4194],
+    "Colorado": [39.5501, -105.7821], "Washington": [47.7511, -120.7401],
+    "Florida": [27.9944, -81.7603], "Minnesota": [46.7296, -94.6859],
+    "Montana": [46.8797, -110.3626], "Tennessee": [35.5175, -86.5804],
+    "Louisiana": [30.9843, -91.9623], "Virginia": [37.4316, -78.6569],
+    "Wyoming": [43.07597, -107.2903], "Oregon": [43.8041, -120.5542],
+    "Utah": [39.3200, -111.0937], "Iowa": [41.8780, -93.0977],
+    "Michigan": [44.1822, -84.5068], "Missouri": [38.5739, -92.6038],
+    "North Dakota": [47.5515, -101.0020], "Indiana": [40.2672, -86.1349],
+    "Wisconsin": [44.5000, -89.5000], "Massachusetts": [42.4072, -71.3824],
+    "New Hampshire": [43.1939, -71.5724], "Vermont": [44.0000, -72.6999],
+    "Connecticut": [41.6032, -73.0877], "Delaware": [38.9108, -75.5277],
+    "Maryland": [39.0458, -76.6413], "Rhode Island": [41.5801, -71.4774],
+    "West Virginia": [38.5976, -80.4549], "New Jersey": [40.0583, -74.4057],
+    "Maine": [45.2538, -69.4455], "Georgia": [32.1656, -82.9001],
+    "Arizona": [34.0489, -111.0937], "Idaho": [44.0682, -114.7420],
+    "New Mexico": [34.5199, -105.8701], "Ohio": [40.4173, -82.9071],
+    "Kansas": [39.0119, -98.4842], "Nebraska": [41.4925, -99.9018],
+    "South Dakota": [43.9695, -99.9018], "Alabama": [32.8067, -86.7911],
+    "Mississippi": [32.3547, -89.3985], "Kentucky": [37.8393, -84.2700],
+    "North Carolina": [35.7596, -79.0193], "South Carolina": [33.8361, -81.1637],
+    "Oklahoma": [35.0078, -97.0929], "Arkansas": [34.9697, -92.3731]
+}
+
+REGION_COORDS = {
+    "West": [[49.0, -125.0], [49.0, -111.0], [31.0, -111.0], [31.0, -125.0]],
+    "Southwest": [[42.0, -111.0], [42.0, -94.0], [25.5, -94.0], [31.0, -111.0]],
+    "Midwest": [[49.0, -111.0], [49.0, -82.0], [37.0, -82.0], [37.0, -111.0]],
+    "Northeast": [[47.5, -82.0], [47.5, -67.0], [38.0, -67.0], [38.0, -82.0]],
+    "Southeast": [[37.0, -94.0], [38.0, -75.0], [24.0, -80.0], [24.0, -94.0]],
+}
+
+# Gaya per dashboard: "dashboard" = tab GIS di analisis utama, "gis" = 3_tugas/GIS/gis.py
+STYLES = {
+    "dashboard": {
+        "tiles": "cartodbpositron",
+        "region_color": {"West": "#2ecc71", "Midwest": "#3498db", "Northeast": "#9b59b6",
+                         "Southwest": "#f39c12", "Southeast": "#e74c3c"},
+        "region_fill": None,
+        "weight": 3,
+        "fill_opacity": 0.15,
+        "region_tooltip": "Region: {name}",
+        "popup": """
+                    <div style="
+                        font-family: Arial;
+                        width: 190px;
+                        font-size: 13px;
+                    ">
+                        <h4 style="margin-bottom:6px;color:#e74c3c;">
+                            {state}
+                        </h4>
+                        <b>Units Sold:</b> {units:,.0f}<br>
+                        <b>Revenue:</b> ${sales:,.0f}
+                    </div>
+                    """,
+    },
+    "gis": {
+        "tiles": "OpenStreetMap",
+        "region_color": {"West": "#90D743", "Southwest": "#31688E", "Midwest": "#443983",
+                         "Northeast": "#35B779", "Southeast": "#21918C"},
+        "region_fill": {"West": "#a1c9ed", "Southwest": "#ffc08a", "Midwest": "#98df8a",
+                        "Northeast": "#c5b0d5", "Southeast": "#ff9896"},
+        "weight": 2,
+        "fill_opacity": 0.2,
+        "region_tooltip": "{name}",
+        "popup": """
+        <div style="font-family: Arial; width: 180px; font-size: 12px;">
+            <h4 style="margin: 0 0 5px 0; color: #d32f2f;">{state}</h4>
+            <hr style="margin: 5px 0;">
+            <b>Units Sold:</b> {units:,.0f}<br>
+            <b>Revenue:</b> ${sales:,.0f}
+        </div>
+        """,
+    },
+}
+
+
+def buat_map(style="dashboard", regions=True):
+    # Peta baru (tidak di-cache), mis. untuk laporan HTML statis yang layer-nya
+    # ditambahkan langsung ke peta.
+    # regions=False -> tanpa polygon region (mis. saat memakai choropleth state)
+    cfg = STYLES[style]
+    m = folium.Map(location=list(CENTER), zoom_start=ZOOM_START, tiles=cfg["tiles"])
+    if not regions:
+        return m
+
+    for name, coords in REGION_COORDS.items():
+        color = cfg["region_color"][name]
+        folium.Polygon(
+            locations=coords,
+            color=color,
+            weight=cfg["weight"],
+            fill=True,
+            fill_color=(cfg["region_fill"] or {}).get(name, color),
+            fill_opacity=cfg["fill_opacity"],
+            tooltip=cfg["region_tooltip"].format(name=name)
+        ).add_to(m)
+    return m
+
+
+@lru_cache(maxsize=None)
+def _base_map_cached(style, regions):
+    return buat_map(style, regions)
+
+
+def base_map(style="dashboard", regions=True):
+    # Dibangun sekali per gaya, tiap pemanggilan mendapat salinan sendiri
+    # (~1 ms): layer yang ditempel st_folium tidak bocor ke rerun / sesi lain
+    return copy.deepcopy(_base_map_cached(style, regions))
+
+
+@lru_cache(maxsize=1)
+def _coords_frame():
+    return pd.DataFrame(
+        [(name, lat, lon) for name, (lat, lon) in STATE_COORDS.items()],
+        columns=["State", "lat", "lon"],
+    )
+
+
+def format_columns(template, **columns):
+    # Isi template str.format secara kolom-per-kolom (bukan baris per baris):
+    # tiap field diformat sekali untuk satu Series, lalu potongan digabung
+    # dengan operasi string vektor pandas.
+    result = None
+    for literal, field, spec, _ in Formatter().parse(template):
+        parts = [literal] if literal else []
+        if field is not None:
+            parts.append(columns[field].map(("{:" + spec + "}").format).astype(str))
+        for part in parts:
+            result = part if result is None else result + part
+    return result
+
+
+def state_points(state_stats, style="dashboard"):
+    # Titik per state (lat, lon, popup, tooltip): merge dengan tabel koordinat,
+    # popup HTML dibuat sebagai operasi kolom (tanpa iterrows)
+    stats = state_stats.assign(State=state_stats["State"].astype(str))
+    points = stats.merge(_coords_frame(), on="State", how="inner")
+    points["popup"] = format_columns(
+        STYLES[style]["popup"],
+        state=points["State"],
+        units=points["Units Sold"],
+        sales=points["Total Sales"],
+    )
+    points["tooltip"] = points["State"]
+    return points
+
+
+def points_geojson(points):
+    # FeatureCollection titik dari kolom lat, lon, popup, tooltip
+    features = [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [lon, lat]},
+            "properties": {"popup": popup, "tooltip": tooltip},
+        }
+        for lat, lon, popup, tooltip in zip(
+            points["lat"].tolist(), points["lon"].tolist(),
+            points["popup"].tolist(), points["tooltip"].tolist(),
+        )
+    ]
+    return {"type": "FeatureCollection", "features": features}
+
+
+_BIND_POPUP = JsCode("""
+function (feature, layer) {
+    layer.bindPopup(feature.properties.popup, {maxWidth: 250});
+    layer.bindTooltip(feature.properties.tooltip);
+}
+""")
+
+
+def points_layer(points, name="Penjualan per State"):
+    # Semua marker masuk SATU layer GeoJSON, bukan N objek folium.Marker
+    layer = folium.FeatureGroup(name=name)
+    folium.GeoJson(
+        points_geojson(points),
+        marker=folium.Marker(icon=folium.Icon(color="red", icon="shopping-cart", prefix="fa")),
+        on_each_feature=_BIND_POPUP,
+    ).add_to(layer)
+    return layer
+
+
+def marker_layer(state_stats, style="dashboard"):
+    # state_stats: kolom State, Units Sold, Total Sales (hasil agregasi per state)
+    return points_layer(state_points(state_stats, style))
@@ -0,0 +1,113 @@
+# ==========================================
+# CACHE LOKAL HASIL SCRAPING (INCREMENTAL MODE)
+# ==========================================
+# Disimpan di SQLite (.cache/scrape_cache.sqlite):
+#   - pages    : URL offset -> ETag / Last-Modified terakhir
+#   - products : produk unik per Link + hash isi kartu
+# Saat scraping ulang, request dikirim dengan If-None-Match /
+# If-Modified-Since. Halaman 304 langsung memakai produk dari cache,
+# halaman 200 hanya menulis kartu yang baru atau berubah.
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+
+from .data_loader import ROOT_DIR
+
+CACHE_PATH = ROOT_DIR / ".cache" / "scrape_cache.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL
+);
+CREATE TABLE IF NOT EXISTS products (
+    link TEXT PRIMARY KEY,
+    page_url TEXT,
+    posisi INTEGER,
+    nama TEXT,
+    harga_text TEXT,
+    harga_angka INTEGER,
+    gambar TEXT,
+    hash TEXT,
+    first_seen REAL,
+    last_seen REAL
+);
+CREATE INDEX IF NOT EXISTS products_page ON products (page_url, posisi);
+"""
+
+
+def _hash_row(row):
+    return hashlib.sha1("\x1f".join(map(str, row)).encode("utf-8")).hexdigest()
+
+
+class ScrapeCache:
+    # Dipakai dari satu thread saja (thread pemanggil scrape_pages)
+
+    def __init__(self, path=CACHE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.executescript(_SCHEMA)
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.stats = {"halaman_304": 0, "halaman_200": 0, "produk_baru": 0, "produk_berubah": 0}
+
+    def validators(self, url):
+        # Header conditional request untuk url ini (kosong kalau belum pernah)
+        row = self.conn.execute(
+            "SELECT etag, last_modified FROM pages WHERE url = ?", (url,)
+        ).fetchone()
+        headers = {}
+        if row and row[0]:
+            headers["If-None-Match"] = row[0]
+        if row and row[1]:
+            headers["If-Modified-Since"] = row[1]
+        return headers
+
+    def page_products(self, url):
+        self.stats["halaman_304"] += 1
+        rows = self.conn.execute(
+            "SELECT nama, harga_text, harga_angka, link, gambar FROM products "
+            "WHERE page_url = ? AND last_seen >= (SELECT fetched_at FROM pages WHERE url = ?) "
+            "ORDER BY posisi", (url, url)
+        ).fetchall()
+        return [list(row) for row in rows]
+
+    def store_page(self, url, rows, etag=None, last_modified=None):
+        self.stats["halaman_200"] += 1
+        now = time.time()
+        known = dict(self.conn.execute(
+            "SELECT link, hash FROM products WHERE link IN (%s)" % ",".join("?" * len(rows)),
+            [row[3] for row in rows],
+        ).fetchall()) if rows else {}
+
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO pages (url, etag, last_modified, fetched_at) VALUES (?, ?, ?, ?)",
+                (url, etag, last_modified, now),
+            )
+            for posisi, (nama, harga_text, harga_angka, link, gambar) in enumerate(rows):
+                digest = _hash_row((url, posisi, nama, harga_text, harga_angka, gambar))
+                lama = known.get(link)
+                if lama == digest:
+                    # Kartu tidak berubah: cukup perbarui last_seen
+                    self.conn.execute("UPDATE products SET last_seen = ? WHERE link = ?", (now, link))
+                    continue
+                self.stats["produk_baru" if lama is None else "produk_berubah"] += 1
+                self.conn.execute(
+                    "INSERT INTO products (link, page_url, posisi, nama, harga_text, harga_angka, "
+                    "gambar, hash, first_seen, last_seen) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(link) DO UPDATE SET page_url = excluded.page_url, "
+                    "posisi = excluded.posisi, nama = excluded.nama, harga_text = excluded.harga_text, "
+                    "harga_angka = excluded.harga_angka, gambar = excluded.gambar, "
+                    "hash = excluded.hash, last_seen = excluded.last_seen",
+                    (link, url, posisi, nama, harga_text, harga_angka, gambar, digest, now, now),
+                )
+        return rows
+
+    def close(self):
+        self.conn.close()
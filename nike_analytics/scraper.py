@@ -0,0 +1,205 @@
+# ==========================================
+# ENGINE SCRAPING NIKE.COM (CONCURRENT + POOLED)
+# ==========================================
+# Halaman offset diambil paralel lewat thread pool di atas satu
+# requests.Session (keep-alive, connection pool). Jumlah request dibatasi
+# oleh concurrency cap + token bucket, dan kegagalan jaringan di-retry
+# dengan backoff (urllib3 Retry) alih-alih di-`pass` diam-diam.
+#
+# base_url bisa diarahkan ke server HTTP lokal untuk pengujian
+# (lihat benchmarks/bench_scraper.py).
+# Parsing HTML ada di html_parser.py (backend selectolax / lxml / bs4).
+# Dengan cache=ScrapeCache(), request dikirim sebagai conditional request
+# dan halaman 304 memakai produk dari cache lokal (lihat scrape_cache.py).
+#
+# iter_scrape_batches() mengalirkan satu batch per halaman begitu halaman
+# itu selesai; JsonlSink menulis tiap batch ke file append-only.
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .html_parser import parse_cards
+
+BASE_URL = "https://www.nike.com/w/mens-shoes-nik1zy7ok"
+PAGE_SIZE = 24
+HEADERS = {"User-Agent": "Mozilla/5.0"}
+COLUMNS = ["Nama", "Harga Text", "Harga Angka", "Link", "Gambar"]
+
+CONCURRENCY = 8
+RATE_PER_SEC = 8.0
+RETRIES = 3
+BACKOFF = 0.5
+TIMEOUT = 10
+
+
+class TokenBucket:
+    # Rate limiter sederhana: `rate` token per detik, maksimal `burst` token
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.capacity = float(burst or max(1.0, rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def page_url(page, base_url=BASE_URL):
+    return f"{base_url}?offset={page * PAGE_SIZE}"
+
+
+def buat_session(pool_size=CONCURRENCY, retries=RETRIES, backoff=BACKOFF):
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def fetch_page(session, url, bucket=None, timeout=TIMEOUT, headers=None):
+    if bucket is not None:
+        bucket.acquire()
+    res = session.get(url, timeout=timeout, headers=headers)
+    res.raise_for_status()
+    return res
+
+
+def fetch_and_parse(session, url, bucket=None, backend=None, headers=None):
+    # Parsing ikut dikerjakan di worker thread, tidak menumpuk di thread utama.
+    # Return None kalau server menjawab 304 Not Modified atas conditional
+    # request (headers dari ScrapeCache.validators). 304 tanpa validator
+    # tidak punya isi cache untuk dipakai -> error halaman biasa.
+    res = fetch_page(session, url, bucket, headers=headers)
+    if res.status_code == 304:
+        if not headers:
+            raise requests.HTTPError(f"304 Not Modified tanpa conditional request (tidak ada cache): {url}",
+                                     response=res)
+        return None
+    rows = parse_cards(res.text, url, backend)
+    return rows, res.headers.get("ETag"), res.headers.get("Last-Modified")
+
+
+def iter_scrape_batches(max_pages, base_url=BASE_URL, concurrency=CONCURRENCY,
+                        rate=RATE_PER_SEC, session=None, backend=None, cache=None):
+    # Generator: yield (nomor halaman, DataFrame batch, pesan error / None)
+    # segera setelah satu halaman selesai (urutan selesai, bukan urutan
+    # halaman). Link yang sudah muncul di batch sebelumnya tidak diulang.
+    own_session = session is None
+    session = session or buat_session(concurrency)
+    bucket = TokenBucket(rate, burst=concurrency) if rate else None
+    if cache is not None:
+        cache.reset_stats()
+
+    seen = set()
+    pool = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        futures = {}
+        for page in range(max_pages):
+            url = page_url(page, base_url)
+            headers = cache.validators(url) if cache is not None else None
+            future = pool.submit(fetch_and_parse, session, url, bucket, backend, headers)
+            futures[future] = (page, url)
+
+        for future in as_completed(futures):
+            page, url = futures[future]
+            try:
+                result = future.result()
+            except requests.RequestException as exc:
+                yield page, pd.DataFrame(columns=COLUMNS), str(exc)
+                continue
+
+            if result is None:
+                # hanya terjadi kalau validator dari cache ikut dikirim
+                rows = cache.page_products(url)
+            elif cache is not None:
+                rows = cache.store_page(url, *result)
+            else:
+                rows = result[0]
+
+            batch = pd.DataFrame(rows, columns=COLUMNS).drop_duplicates("Link")
+            batch = batch[~batch["Link"].isin(seen)].reset_index(drop=True)
+            seen.update(batch["Link"])
+            yield page, batch, None
+    finally:
+        # Generator ditutup lebih awal -> batalkan halaman yang belum jalan
+        pool.shutdown(wait=True, cancel_futures=True)
+        if own_session:
+            session.close()
+
+
+def scrape_pages(max_pages, on_progress=None, **kwargs):
+    # Versi non-streaming: return (DataFrame produk, {nomor halaman: pesan error}).
+    # on_progress(selesai, total) dipanggil dari thread pemanggil, jadi aman
+    # untuk update widget Streamlit (progress bar, caption).
+    hasil = {}
+    errors = {}
+    for done, (page, batch, error) in enumerate(iter_scrape_batches(max_pages, **kwargs), start=1):
+        if error:
+            errors[page] = error
+        else:
+            hasil[page] = batch
+        if on_progress:
+            on_progress(done, max_pages)
+
+    # Urutan produk tetap mengikuti urutan halaman
+    batches = [hasil[page] for page in sorted(hasil)]
+    if not batches:
+        return pd.DataFrame(columns=COLUMNS), errors
+    df = pd.concat(batches, ignore_index=True).drop_duplicates("Link", ignore_index=True)
+    return df, errors
+
+
+class JsonlSink:
+    # File append-only: satu baris JSON per produk, ditulis per batch
+    # supaya hasil scraping besar tidak perlu ditampung di memori.
+    # Yang disimpan di memori hanya (nomor halaman, jumlah baris) per batch.
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.rows = 0
+        self.segmen = []
+
+    def write(self, batch, page=None):
+        if batch.empty:
+            return
+        text = batch.to_json(orient="records", lines=True, force_ascii=False)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(text if text.endswith("\n") else text + "\n")
+        self.rows += len(batch)
+        self.segmen.append((self.rows if page is None else page, len(batch)))
+
+    def baca(self):
+        # Semua produk yang ditulis sink ini, urut nomor halaman (bukan urutan selesai)
+        if not self.rows:
+            return pd.DataFrame(columns=COLUMNS)
+        df = pd.read_json(self.path, lines=True, dtype=False, convert_dates=False)
+        pages = np.repeat([page for page, _ in self.segmen], [n for _, n in self.segmen])
+        urut = np.argsort(pages, kind="stable")
+        return df.take(urut).reset_index(drop=True)[COLUMNS]
@@ -0,0 +1,103 @@
+# ==========================================
+# INDEX PENCARIAN NAMA PRODUK ("Cari Nama Produk")
+# ==========================================
+# Kolom Product hanya punya sedikit nilai unik tapi jutaan baris. Index ini
+# dibangun sekali per versi file:
+#   - nama produk unik (lowercase) per kode kategori
+#   - map trigram -> kode produk, untuk mempersempit kandidat substring
+#   - posisi baris per kode produk (array numpy, urut)
+# Pencarian cukup mencocokkan beberapa nama unik lalu menggabungkan array
+# posisi yang sudah jadi, tanpa scan kolom string dan tanpa df.copy().
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from .data_loader import _signature, cari_file_data, load_sales_data
+
+NGRAM = 3
+# Jumlah hasil pencarian (per kata kunci) yang disimpan per index
+SEARCH_CACHE_SIZE = 128
+
+
+def _ngrams(text, n=NGRAM):
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class ProductIndex:
+
+    def __init__(self, product):
+        product = product.astype("category")
+        codes = product.cat.codes.to_numpy()
+        self.names = [str(name) for name in product.cat.categories]
+        self.lower = [name.lower() for name in self.names]
+        self.n_rows = len(codes)
+
+        # Posisi baris per kode: argsort stabil -> tiap potongan tetap urut
+        order = np.argsort(codes, kind="stable")
+        counts = np.bincount(codes[codes >= 0], minlength=len(self.names))
+        start = int((codes < 0).sum())  # NaN (kode -1) ada di depan
+        self.positions = []
+        for count in counts:
+            self.positions.append(order[start:start + count])
+            start += count
+
+        self.ngram_map = {}
+        for code, name in enumerate(self.lower):
+            for gram in _ngrams(name):
+                self.ngram_map.setdefault(gram, set()).add(code)
+
+        # Cache hasil search milik index ini (LRU kecil, ikut dilepas bersama index)
+        self._hasil = OrderedDict()
+        self._hasil_lock = threading.Lock()
+
+    def match_codes(self, query):
+        # Semantik sama dengan str.contains(query.lower()) pada kolom Product
+        query = query.lower()
+        if len(query) >= NGRAM:
+            kandidat = None
+            for gram in _ngrams(query):
+                codes = self.ngram_map.get(gram, set())
+                kandidat = codes if kandidat is None else kandidat & codes
+                if not kandidat:
+                    return []
+        else:
+            kandidat = range(len(self.lower))
+        return sorted(code for code in kandidat if query in self.lower[code])
+
+    def match_names(self, query):
+        return [self.names[code] for code in self.match_codes(query)]
+
+    def search(self, query):
+        # Posisi baris (urut) yang cocok; dipakai dengan df.iloc / df.take
+        query = query.lower()
+        with self._hasil_lock:
+            if query in self._hasil:
+                self._hasil.move_to_end(query)
+                return self._hasil[query]
+        hasil = self._search(query)
+        with self._hasil_lock:
+            self._hasil[query] = hasil
+            while len(self._hasil) > SEARCH_CACHE_SIZE:
+                self._hasil.popitem(last=False)
+        return hasil
+
+    def _search(self, query):
+        codes = self.match_codes(query)
+        if not codes:
+            return np.empty(0, dtype=np.intp)
+        if len(codes) == 1:
+            return self.positions[codes[0]]
+        return np.sort(np.concatenate([self.positions[code] for code in codes]))
+
+
+@lru_cache(maxsize=4)
+def _index_cached(path, mtime_ns, size):
+    return ProductIndex(load_sales_data(path, columns=["Product"])["Product"])
+
+
+def load_product_index(path=None):
+    path = Path(path) if path else cari_file_data()
+    return _index_cached(*_signature(path.resolve()))
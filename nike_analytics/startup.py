@@ -0,0 +1,117 @@
+# ==========================================
+# PROFIL STARTUP DASHBOARD (WAKTU IMPOR + TAHAP INISIALISASI)
+# ==========================================
+# Dashboard memuat subsistem berat (scraper, grafik, GIS, data historis)
+# baru saat pertama dipakai. Tiap tahap dibungkus tahap("nama") sehingga
+# durasinya tercatat per proses:
+#   - pertama : durasi saat pertama dijalankan (cold start, termasuk impor)
+#   - terakhir: durasi pada rerun terakhir (modul & data sudah di-cache)
+# Tabelnya ditampilkan di sidebar dashboard (expander "Profil startup").
+# Dashboard memanggilnya lewat instrumentasi.tahap (detail per rerun).
+#
+# Waktu impor tiap subsistem di interpreter baru (python -X importtime):
+#   python -m nike_analytics.startup
+import argparse
+import re
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+# Subsistem dashboard -> modul yang diimpor saat subsistem itu dipakai
+SUBSISTEM = {
+    "shell (streamlit + pandas)": ["streamlit", "pandas"],
+    "data historis": ["nike_analytics.backends"],
+    "duckdb": ["duckdb"],
+    "scraper": ["nike_analytics.scraper", "nike_analytics.scrape_cache"],
+    "grafik": ["nike_analytics.charts", "matplotlib.figure"],
+    "tren waktu": ["nike_analytics.timeseries"],
+    "GIS": ["nike_analytics.peta", "nike_analytics.geo_layers", "streamlit_folium"],
+}
+
+# nama tahap -> {"pertama": detik, "terakhir": detik, "n": jumlah}
+# (dibagi semua sesi / thread script Streamlit -> akses lewat _PROFIL_LOCK)
+PROFIL = {}
+_PROFIL_LOCK = threading.Lock()
+
+
+@contextmanager
+def tahap(nama):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        durasi = time.perf_counter() - start
+        with _PROFIL_LOCK:
+            info = PROFIL.setdefault(nama, {"pertama": durasi, "terakhir": durasi, "n": 0})
+            info["terakhir"] = durasi
+            info["n"] += 1
+
+
+def tabel_profil():
+    import pandas as pd
+
+    # salinan snapshot: thread lain boleh menambah tahap selama tabel dibuat
+    with _PROFIL_LOCK:
+        profil = {nama: dict(info) for nama, info in PROFIL.items()}
+    rows = [
+        {"Tahap": nama, "Pertama (ms)": info["pertama"] * 1000, "Terakhir (ms)": info["terakhir"] * 1000,
+         "Dijalankan": info["n"]}
+        for nama, info in profil.items()
+    ]
+    return pd.DataFrame(rows, columns=["Tahap", "Pertama (ms)", "Terakhir (ms)", "Dijalankan"])
+
+
+# =========================
+# WAKTU IMPOR (SUBPROCESS)
+# =========================
+_IMPORTTIME = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def waktu_impor(modules, sudah=()):
+    # Return detik kumulatif impor `modules` di interpreter baru; modul di
+    # `sudah` diimpor lebih dulu (tidak ikut dihitung), misal pandas/streamlit
+    # yang selalu sudah dimuat oleh server Streamlit.
+    kode = "; ".join(f"import {m}" for m in sudah)
+    kode += "; import sys as _sys, time as _t; _sys.stderr.write('MULAI\\n'); _s = _t.perf_counter(); "
+    kode += "; ".join(f"import {m}" for m in modules)
+    kode += "; print('TOTAL', _t.perf_counter() - _s)"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", kode.lstrip("; ")],
+        cwd=ROOT_DIR, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        return None, []
+    total = float(proc.stdout.split("TOTAL")[-1])
+    # modul level atas (indentasi 1 spasi) + waktu kumulatif (µs)
+    top = []
+    for line in proc.stderr.split("MULAI\n")[-1].splitlines():
+        m = _IMPORTTIME.match(line)
+        if m and len(m.group(3)) == 1:
+            top.append((m.group(4), int(m.group(2)) / 1e6))
+    return total, top
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ukur waktu impor subsistem dashboard di interpreter baru.")
+    parser.add_argument("--detail", type=int, default=3, help="jumlah modul terberat per subsistem")
+    args = parser.parse_args(argv)
+
+    dasar = SUBSISTEM["shell (streamlit + pandas)"]
+    for nama, modules in SUBSISTEM.items():
+        sudah = () if modules is dasar else dasar
+        total, top = waktu_impor(modules, sudah)
+        if total is None:
+            print(f"{nama:<28}: tidak terpasang")
+            continue
+        print(f"{nama:<28}: {total * 1000:8.1f} ms")
+        for module, detik in sorted(top, key=lambda t: -t[1])[:args.detail]:
+            print(f"{'':<30}{module:<36} {detik * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
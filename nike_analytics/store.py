@@ -0,0 +1,160 @@
+# ==========================================
+# STORAGE INVOICE TERPARTISI (TAHUN / BULAN, APPEND-ONLY)
+# ==========================================
+# Struktur folder store (default nike_store/ di root repo):
+#   _manifest.json                           versi + daftar file per partisi
+#   sales/tahun=2020/bulan=01/part-000001.parquet
+#   sales/tahun=2020/bulan=01/_hashes.npy    hash baris (untuk dedup ingest)
+#   agg/cube/tahun=2020/bulan=01/data-000001.parquet    potongan rollup cube
+#   agg/harian/tahun=2020/bulan=01/data-000001.parquet  potongan bucket harian
+# File data tidak pernah ditimpa: ingest menambah file part baru ke partisi
+# yang tersentuh lalu menghitung ulang agregat partisi itu saja ke file agg
+# versi baru. Nama file part & agg dicatat di manifest, dan manifest ditulis
+# paling akhir, jadi pembaca selalu melihat sales + agregat dari versi yang
+# sama. File agg versi lama baru dihapus setelah manifest baru tertulis.
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow wajib untuk store; dicek di tersedia()
+    pa = None
+    pq = None
+
+MANIFEST = "_manifest.json"
+HASHES = "_hashes.npy"
+SALES = "sales"
+AGG_KINDS = ("cube", "harian")
+
+
+def tersedia():
+    return pq is not None
+
+
+def is_store(path):
+    return Path(path).is_dir() and (Path(path) / MANIFEST).is_file()
+
+
+def manifest_path(store):
+    return Path(store) / MANIFEST
+
+
+def baca_manifest(store):
+    path = manifest_path(store)
+    if not path.is_file():
+        return {"versi": 0, "partisi": {}}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def tulis_manifest(store, manifest):
+    path = manifest_path(store)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, indent=1, sort_keys=True), encoding="utf-8")
+    tmp.replace(path)
+
+
+def partisi_key(tahun, bulan):
+    return f"tahun={int(tahun)}/bulan={int(bulan):02d}"
+
+
+def partisi_dir(store, key, kind=SALES):
+    if kind == SALES:
+        return Path(store) / SALES / key
+    return Path(store) / "agg" / kind / key
+
+
+def _read(files, columns=None):
+    if not files:
+        return pd.DataFrame(columns=list(columns or []))
+    # ParquetDataset menyatukan dictionary kolom category antar file;
+    # urutan kategori hasil gabungan dirapikan lagi (alfabetis)
+    table = pq.ParquetDataset([str(f) for f in files], partitioning=None).read(columns=list(columns) if columns else None)
+    df = table.to_pandas()
+    for col in df.select_dtypes("category"):
+        if not df[col].cat.ordered:
+            df[col] = df[col].cat.reorder_categories(sorted(df[col].cat.categories))
+    return df
+
+
+def sales_files(store, keys=None, manifest=None):
+    # manifest: isi manifest yang sedang ditulis ingest (default: dari disk)
+    manifest = manifest or baca_manifest(store)
+    keys = sorted(manifest["partisi"]) if keys is None else keys
+    return [partisi_dir(store, key) / name for key in keys for name in manifest["partisi"][key]["files"]]
+
+
+def baca_sales(store, columns=None, keys=None, manifest=None):
+    # Semua invoice (atau partisi tertentu) urut per partisi lalu per file part
+    return _read(sales_files(store, keys, manifest), columns)
+
+
+def jumlah_baris(store):
+    return sum(info["rows"] for info in baca_manifest(store)["partisi"].values())
+
+
+def agg_files(store, kind, manifest=None):
+    # File agregat per partisi sesuai manifest; store lama (sebelum nama file
+    # agg dicatat di manifest) memakai data.parquet
+    manifest = manifest or baca_manifest(store)
+    return [
+        partisi_dir(store, key, kind) / info.get("agg", {}).get(kind, "data.parquet")
+        for key, info in sorted(manifest["partisi"].items())
+    ]
+
+
+def baca_agg(store, kind):
+    # Gabungan agregat semua partisi (tiap partisi = satu bulan, jadi tidak overlap)
+    return _read([f for f in agg_files(store, kind) if f.is_file()])
+
+
+def tulis_agg(store, key, kind, df, versi):
+    # File agg baru per versi (tidak menimpa yang dibaca manifest aktif); return nama file
+    folder = partisi_dir(store, key, kind)
+    folder.mkdir(parents=True, exist_ok=True)
+    name = f"data-{versi:06d}.parquet"
+    tmp = folder / (name + ".tmp")
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), tmp, compression="zstd")
+    tmp.replace(folder / name)
+    return name
+
+
+def hapus_agg_lama(store, manifest, keys):
+    # Setelah manifest baru tertulis: buang file agg partisi `keys` yang tidak dipakai lagi
+    for key in keys:
+        for kind in AGG_KINDS:
+            aktif = manifest["partisi"][key].get("agg", {}).get(kind)
+            for path in partisi_dir(store, key, kind).glob("data*.parquet"):
+                if path.name != aktif:
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+
+
+def baca_hashes(store, key, rows):
+    # Hash baris partisi; dipotong ke jumlah baris di manifest supaya ingest
+    # yang gagal di tengah jalan (file part belum masuk manifest) tidak ikut
+    path = partisi_dir(store, key) / HASHES
+    if not path.is_file():
+        return np.empty(0, dtype=np.uint64)
+    return np.load(path)[:rows]
+
+
+def append_partisi(store, key, df, hashes, versi):
+    # Tulis satu file part baru + hash semua baris partisi; return nama file part
+    folder = partisi_dir(store, key)
+    folder.mkdir(parents=True, exist_ok=True)
+    name = f"part-{versi:06d}.parquet"
+    tmp = folder / (name + ".tmp")
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), tmp, compression="zstd")
+    tmp.replace(folder / name)
+
+    tmp = folder / (HASHES + ".tmp")
+    with open(tmp, "wb") as f:
+        np.save(f, hashes)
+    tmp.replace(folder / HASHES)
+    return name
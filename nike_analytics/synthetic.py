@@ -0,0 +1,159 @@
+# ==========================================
+# GENERATOR DATA PENJUALAN SINTETIS (SKEMA SAMA DENGAN CSV ASLI)
+# ==========================================
+# Untuk benchmark di ukuran 100k / 1M / 10M / 100M baris. Tiap baris
+# sintetis berangkat dari satu baris "template" yang diambil acak dari data
+# asli, jadi kombinasi Product / Region / Retailer / Sales Method / State
+# dan frekuensinya sama dengan data asli. Nilainya lalu digeser supaya
+# baris baru tidak sekadar salinan:
+#   - Invoice Date  : tanggal template +- 15 hari (tetap di rentang data asli)
+#   - Price per Unit: harga template * N(1, 5%), dibulatkan ke dolar
+#   - Units Sold    : Poisson(units template)
+#   - Total Sales   : harga * units * rasio Total / (harga * units) template
+# Data ditulis per chunk, jadi 100M baris tidak pernah ada utuh di memori.
+#
+# Jalankan dari root repo:
+#   python -m nike_analytics.synthetic --rows 100000 1000000 10000000
+#   python -m nike_analytics.synthetic --rows 100000000 --format parquet
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from . import columnar
+from .data_loader import BASE_COLUMNS, DATE_COLUMN, DATE_FORMAT, DTYPES, ROOT_DIR, load_sales_data
+
+SYNTH_DIR = ROOT_DIR / ".cache" / "bench"
+CHUNK_ROWS = 1_000_000
+UKURAN = (100_000, 1_000_000, 10_000_000, 100_000_000)
+
+GESER_HARI = 15
+SIGMA_HARGA = 0.05
+
+
+def _template(sumber=None):
+    df = load_sales_data(columns=BASE_COLUMNS) if sumber is None else sumber
+    df = df.dropna(subset=[DATE_COLUMN]).reset_index(drop=True)
+    price = df["Price per Unit"].to_numpy(dtype="float64")
+    units = df["Units Sold"].to_numpy(dtype="float64")
+    total = df["Total Sales"].to_numpy(dtype="float64")
+    kotor = price * units
+    # Rasio Total Sales terhadap harga * units (data asli tidak selalu 1);
+    # baris dengan units 0 memakai rasio 1
+    rasio = np.divide(total, kotor, out=np.ones_like(total), where=kotor > 0)
+    return df, price, units, rasio
+
+
+def generate_chunks(n_rows, seed=0, chunk_rows=CHUNK_ROWS, sumber=None):
+    # Yield DataFrame per chunk (dtype sama dengan loader) sampai n_rows baris
+    df, price, units, rasio = _template(sumber)
+    tanggal = df[DATE_COLUMN].to_numpy().astype("datetime64[D]")
+    tgl_min, tgl_max = tanggal.min(), tanggal.max()
+    rng = np.random.default_rng(seed)
+
+    for start in range(0, n_rows, chunk_rows):
+        size = min(chunk_rows, n_rows - start)
+        idx = rng.integers(0, len(df), size)
+
+        geser = rng.integers(-GESER_HARI, GESER_HARI + 1, size).astype("timedelta64[D]")
+        tgl = np.clip(tanggal[idx] + geser, tgl_min, tgl_max)
+        harga = np.maximum(1.0, np.round(price[idx] * rng.normal(1.0, SIGMA_HARGA, size)))
+        jumlah = rng.poisson(units[idx])
+        total = np.round(harga * jumlah * rasio[idx])
+
+        chunk = df.take(idx).reset_index(drop=True)
+        chunk[DATE_COLUMN] = tgl.astype("datetime64[ns]")
+        chunk["Price per Unit"] = harga
+        chunk["Units Sold"] = jumlah
+        chunk["Total Sales"] = total
+        yield chunk[BASE_COLUMNS].astype(DTYPES)
+
+
+def _untuk_csv(chunk):
+    # to_csv dengan date_format memformat tiap baris; di sini cukup tanggal
+    # unik yang diformat (kode category) dan angka bulat ditulis sebagai int
+    unik, kode = np.unique(chunk[DATE_COLUMN].to_numpy(), return_inverse=True)
+    teks = pd.DatetimeIndex(unik).strftime(DATE_FORMAT)
+    return chunk.assign(**{
+        DATE_COLUMN: pd.Categorical.from_codes(kode, teks),
+        "Price per Unit": chunk["Price per Unit"].astype("int64"),
+        "Total Sales": chunk["Total Sales"].astype("int64"),
+    })
+
+
+def tulis_dataset(path, n_rows, seed=0, chunk_rows=CHUNK_ROWS, sumber=None):
+    # CSV (format sama dengan file asli) atau Parquet, sesuai suffix path
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    chunks = generate_chunks(n_rows, seed, chunk_rows, sumber)
+
+    if columnar.is_parquet(path):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        writer = None
+        try:
+            for chunk in chunks:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(tmp, table.schema, compression="zstd")
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+    else:
+        with open(tmp, "w", encoding="utf-8", newline="") as f:
+            for i, chunk in enumerate(chunks):
+                _untuk_csv(chunk).to_csv(f, index=False, header=i == 0)
+    tmp.replace(path)
+    return path
+
+
+def dataset_sintetis(n_rows, fmt="csv", seed=0):
+    # Path dataset N baris di .cache/bench/ (dibuat sekali, lalu dipakai ulang)
+    path = SYNTH_DIR / f"nike_synth_{n_rows}_s{seed}.{fmt}"
+    if not path.is_file():
+        tulis_dataset(path, n_rows, seed)
+    return path
+
+
+def ringkasan(df):
+    # Statistik pembanding data asli vs sintetis
+    return pd.Series({
+        "rows": len(df),
+        "price_mean": df["Price per Unit"].mean(),
+        "price_std": df["Price per Unit"].std(),
+        "units_mean": df["Units Sold"].mean(),
+        "units_std": df["Units Sold"].std(),
+        "sales_mean": df["Total Sales"].mean(),
+        "sales_std": df["Total Sales"].std(),
+        "online_share": (df["Sales Method"] == "Online").mean(),
+        "tanggal_unik": df[DATE_COLUMN].nunique(),
+    })
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Buat dataset penjualan Nike sintetis (skema sama dengan CSV asli).")
+    parser.add_argument("--rows", type=int, nargs="+", default=list(UKURAN[:2]))
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cek", action="store_true", help="bandingkan statistik chunk pertama dengan data asli")
+    args = parser.parse_args(argv)
+
+    for n_rows in args.rows:
+        start = time.perf_counter()
+        path = dataset_sintetis(n_rows, args.format, args.seed)
+        print(f"{n_rows:>12,} baris -> {path} ({path.stat().st_size / 1e6:,.0f} MB, "
+              f"{time.perf_counter() - start:.1f} s)")
+
+    if args.cek:
+        asli = load_sales_data(columns=BASE_COLUMNS)
+        sintetis = next(generate_chunks(min(args.rows), args.seed, sumber=asli))
+        print(pd.DataFrame({"asli": ringkasan(asli), "sintetis": ringkasan(sintetis)}).round(3).to_string())
+
+
+if __name__ == "__main__":
+    main()
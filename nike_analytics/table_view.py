@@ -0,0 +1,155 @@
+# ==========================================
+# TABEL BERHALAMAN (SERVER-SIDE PAGINATION)
+# ==========================================
+# st.dataframe(df) mengirim SEMUA baris ke browser di setiap rerun. Di sini
+# hanya potongan halaman yang aktif yang di-serialize. Filter (posisi baris
+# dari index pencarian) dan sorting dikerjakan di server atas frame yang
+# sudah dimuat; urutan sort per kolom di-cache per frame. Backend query lain
+# (lihat backends.py) cukup memberi fungsi fetch ke paged_table.
+import threading
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from .instrumentasi import tahap
+
+PAGE_SIZES = (50, 100, 500, 1000)
+
+# (id frame, kolom, ascending) -> (weakref frame, order). LRU kecil: satu
+# order = 8 B/baris, jadi hanya beberapa kolom terakhir yang disimpan.
+# Dipakai dari thread semua sesi Streamlit -> dijaga lock.
+_ORDER_CACHE = OrderedDict()
+_ORDER_CACHE_SIZE = 4
+_ORDER_LOCK = threading.Lock()
+
+
+def _sort_key(values):
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # urutkan berdasarkan nama kategori
+        cats = values.cat.categories
+        lookup = np.argsort(np.argsort(cats.astype(str), kind="stable"))
+        codes = values.cat.codes.to_numpy()
+        return np.where(codes >= 0, lookup[codes], len(cats))
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.to_numpy().view("int64")
+    if pd.api.types.is_numeric_dtype(values):
+        return values.to_numpy()
+    return values.astype(str).to_numpy()
+
+
+def _hitung_order(column_values, ascending):
+    # Sort stabil; nilai kosong (NaN / NaT) selalu di belakang, baik naik
+    # maupun turun -- sama dengan NULLS LAST di DuckDBBackend
+    values = _sort_key(column_values)
+    na = column_values.isna().to_numpy()
+    isi = np.flatnonzero(~na) if na.any() else None
+    if isi is not None:
+        values = values[isi]
+    if ascending:
+        order = np.argsort(values, kind="stable")
+    else:
+        # descending tapi tetap stabil (baris dengan nilai sama tetap urutan asli)
+        order = len(values) - 1 - np.argsort(values[::-1], kind="stable")[::-1]
+    if isi is None:
+        return order
+    return np.concatenate([isi[order], np.flatnonzero(na)])
+
+
+def sort_order(df, column, ascending=True):
+    key = (id(df), column, ascending)
+    with _ORDER_LOCK:
+        cached = _ORDER_CACHE.get(key)
+        if cached is not None and cached[0]() is df:
+            _ORDER_CACHE.move_to_end(key)
+            return cached[1]
+
+    order = _hitung_order(df[column], ascending)
+
+    with _ORDER_LOCK:
+        # buang entri untuk frame yang sudah tidak ada, lalu batasi ukuran
+        for k in [k for k, v in _ORDER_CACHE.items() if v[0]() is None]:
+            del _ORDER_CACHE[k]
+        _ORDER_CACHE[key] = (weakref.ref(df), order)
+        while len(_ORDER_CACHE) > _ORDER_CACHE_SIZE:
+            _ORDER_CACHE.popitem(last=False)
+    return order
+
+
+def paginate(df, positions=None, sort_by=None, ascending=True, offset=0, limit=100):
+    # Return (potongan frame [offset, offset+limit), jumlah total baris terpilih)
+    total = len(df) if positions is None else len(positions)
+    selection = positions
+    if sort_by:
+        order = sort_order(df, sort_by, ascending)
+        if positions is None:
+            selection = order
+        else:
+            # baris terpilih dalam urutan sort: mask 1 B/baris, bukan array rank
+            terpilih = np.zeros(len(df), dtype=bool)
+            terpilih[positions] = True
+            selection = order[terpilih[order]]
+
+    start = max(0, offset)
+    stop = min(total, start + limit)
+    if selection is None:
+        idx = np.arange(start, stop)
+    else:
+        idx = selection[start:stop]
+    return df.take(idx), total
+
+
+def paged_table(fetch, total, columns, key="tabel", column_config=None, total_rows=None):
+    # Widget Streamlit: kontrol sort + ukuran/nomor halaman, lalu tampilkan
+    # hanya potongan halaman aktif. fetch(sort_by, ascending, offset, limit)
+    # mengembalikan frame halaman itu (dari pandas atau backend query lain).
+    # total_rows = jumlah baris dari metadata file.
+    import streamlit as st
+
+    c_sort, c_arah, c_size, c_page = st.columns([2, 1, 1, 1])
+    with c_sort:
+        sort_by = st.selectbox("Urutkan berdasarkan", ["(urutan asli)"] + list(columns), key=f"{key}_sort")
+    with c_arah:
+        arah = st.selectbox("Arah", ["Naik", "Turun"], key=f"{key}_arah")
+    with c_size:
+        page_size = st.selectbox("Baris per halaman", PAGE_SIZES, index=1, key=f"{key}_size")
+
+    n_pages = max(1, -(-total // page_size))
+    with c_page:
+        page = st.number_input("Halaman", min_value=1, max_value=n_pages, value=1, key=f"{key}_page")
+
+    start = (page - 1) * page_size
+    with tahap(f"query halaman {key}") as t:
+        halaman = fetch(
+            None if sort_by == "(urutan asli)" else sort_by,
+            arah == "Naik",
+            start,
+            page_size,
+        )
+        t.rows = len(halaman)
+    # st.dataframe men-serialize halaman ke Arrow saat dipanggil
+    with tahap(f"render tabel {key}", rows=len(halaman)):
+        st.dataframe(halaman, use_container_width=True, column_config=column_config)
+
+    info = f"Baris {min(start + 1, total):,}–{start + len(halaman):,} dari {total:,} (halaman {page} / {n_pages})"
+    if total_rows is not None:
+        info += f" · total baris di file: {total_rows:,}"
+    st.caption(info)
+
+
+def paged_dataframe(df, positions=None, key="tabel", column_config=None, total_rows=None,
+                    derive=None, derived_columns=None):
+    # paged_table untuk frame pandas yang sudah dimuat (filter = posisi baris).
+    # derive(halaman) menambah kolom turunan hanya pada halaman yang tampil;
+    # derived_columns = {kolom turunan: kolom dasar yang dipakai untuk sort}.
+    total = len(df) if positions is None else len(positions)
+    derived_columns = derived_columns or {}
+
+    def fetch(sort_by, ascending, offset, limit):
+        sort_by = derived_columns.get(sort_by, sort_by)
+        halaman = paginate(df, positions, sort_by, ascending, offset, limit)[0]
+        return derive(halaman) if derive else halaman
+
+    columns = list(df.columns) + list(derived_columns)
+    paged_table(fetch, total, columns, key=key, column_config=column_config, total_rows=total_rows)
@@ -0,0 +1,149 @@
+# ==========================================
+# CACHE THUMBNAIL GAMBAR PRODUK (PREFETCH PARALEL + LRU DI DISK)
+# ==========================================
+# Tab Preview sebelumnya memberi URL gambar ukuran penuh ("Gambar") langsung
+# ke st.image, jadi tiap rerun gambar asli diambil ulang. Di sini:
+#   - setelah scraping, gambar diunduh paralel (thread pool + session
+#     pooled dari scraper.py, dibatasi token bucket) lalu langsung
+#     diperkecil ke thumbnail (maks THUMB_SIZE, WebP / JPEG)
+#   - thumbnail disimpan di .cache/thumbnails/<hash URL>.<ext>; ukuran total
+#     folder dibatasi MAX_BYTES, file yang paling lama tidak dipakai dibuang
+#     duluan (mtime file = waktu terakhir dipakai)
+#   - Preview cukup menampilkan file thumbnail lokal
+# URL gambar boleh diarahkan ke server HTTP lokal untuk pengujian
+# (lihat benchmarks/bench_thumbnails.py).
+import hashlib
+import io
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+from PIL import Image, features
+
+from .data_loader import ROOT_DIR
+from .scraper import CONCURRENCY, TIMEOUT, TokenBucket, buat_session
+
+THUMB_DIR = ROOT_DIR / ".cache" / "thumbnails"
+THUMB_SIZE = (320, 320)
+MAX_BYTES = 64 * 1024 * 1024
+QUALITY = 80
+FORMAT = "WEBP" if features.check("webp") else "JPEG"
+EXT = ".webp" if FORMAT == "WEBP" else ".jpg"
+
+# Gambar dilayani CDN (bukan server halaman), batas request bisa lebih longgar
+IMAGE_RATE_PER_SEC = 32.0
+
+
+def buat_thumbnail(data, size=THUMB_SIZE):
+    # bytes gambar asli -> bytes thumbnail (rasio dipertahankan)
+    img = Image.open(io.BytesIO(data))
+    # JPEG: decode langsung di resolusi kecil (jauh lebih cepat dari decode penuh)
+    img.draft("RGB", size)
+    img.thumbnail(size)
+    if img.mode not in ("RGB", "L"):
+        # transparansi (PNG produk) diratakan ke latar putih
+        rgba = img.convert("RGBA")
+        img = Image.new("RGB", rgba.size, "white")
+        img.paste(rgba, mask=rgba.getchannel("A"))
+    buf = io.BytesIO()
+    img.save(buf, FORMAT, quality=QUALITY)
+    return buf.getvalue()
+
+
+class ThumbnailCache:
+    # Aman dipakai dari banyak thread (prefetch menulis dari worker)
+
+    def __init__(self, path=THUMB_DIR, max_bytes=MAX_BYTES, size=THUMB_SIZE):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.size = tuple(size)
+        self.lock = threading.Lock()
+        self.total = sum(f.stat().st_size for f in self.path.glob(f"*{EXT}"))
+
+    def path_for(self, url):
+        key = hashlib.sha1(f"{url}|{self.size[0]}x{self.size[1]}".encode("utf-8")).hexdigest()
+        return self.path / f"{key}{EXT}"
+
+    def get(self, url):
+        # Path thumbnail kalau sudah ada di cache (dan tandai baru dipakai), else None
+        if not url:
+            return None
+        path = self.path_for(url)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, url, data):
+        # Simpan thumbnail dari bytes gambar asli; return path thumbnail
+        thumb = buat_thumbnail(data, self.size)
+        path = self.path_for(url)
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(thumb)
+        with self.lock:
+            lama = path.stat().st_size if path.exists() else 0
+            tmp.replace(path)
+            self.total += len(thumb) - lama
+            if self.total > self.max_bytes:
+                self._evict()
+        return path
+
+    def _evict(self):
+        # Buang file yang paling lama tidak dipakai sampai total <= 90% batas
+        files = []
+        for f in self.path.glob(f"*{EXT}"):
+            try:
+                st = f.stat()
+            except FileNotFoundError:
+                continue
+            files.append((st.st_mtime, st.st_size, f))
+        files.sort()
+        self.total = sum(size for _, size, _ in files)
+        target = self.max_bytes * 0.9
+        for _, size, f in files:
+            if self.total <= target:
+                break
+            f.unlink(missing_ok=True)
+            self.total -= size
+
+    def prefetch(self, urls, concurrency=CONCURRENCY, rate=IMAGE_RATE_PER_SEC, session=None):
+        # Unduh paralel gambar yang belum ada di cache lalu buat thumbnail-nya.
+        # Return statistik: hit / unduh / gagal, byte asli & byte thumbnail, detik.
+        start = time.perf_counter()
+        unik = list(dict.fromkeys(url for url in urls if url))
+        belum = [url for url in unik if self.get(url) is None]
+        stats = {"hit": len(unik) - len(belum), "unduh": 0, "gagal": 0, "byte_asli": 0, "byte_thumb": 0}
+        if belum:
+            own_session = session is None
+            session = session or buat_session(concurrency)
+            bucket = TokenBucket(rate, burst=concurrency) if rate else None
+
+            def ambil(url):
+                if bucket is not None:
+                    bucket.acquire()
+                res = session.get(url, timeout=TIMEOUT)
+                res.raise_for_status()
+                return len(res.content), self.put(url, res.content).stat().st_size
+
+            try:
+                with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                    for future in [pool.submit(ambil, url) for url in belum]:
+                        try:
+                            asli, thumb = future.result()
+                        except (requests.RequestException, OSError, Image.DecompressionBombError):
+                            # OSError termasuk PIL.UnidentifiedImageError (bukan gambar)
+                            stats["gagal"] += 1
+                            continue
+                        stats["unduh"] += 1
+                        stats["byte_asli"] += asli
+                        stats["byte_thumb"] += thumb
+            finally:
+                if own_session:
+                    session.close()
+        stats["detik"] = time.perf_counter() - start
+        return stats
@@ -0,0 +1,190 @@
+# ==========================================
+# TIME SERIES: BUCKET HARIAN + TREN / ROLLING / YOY
+# ==========================================
+# Invoice dirangkum sekali menjadi tabel bucket harian
+# (Tanggal x Product x Region -> Units Sold, Total Sales, Transaksi) yang
+# disimpan di .cache/timeseries/. Tabel ini kecil (ratusan hari x puluhan
+# kombinasi), jadi filter rentang tanggal, tren mingguan/bulanan, rolling
+# average dan perbandingan YoY cukup dihitung dari bucket, bukan dari
+# frame invoice mentah di setiap perubahan widget.
+#
+# Kalau CSV hanya ditambah baris baru di akhir file (append), bucket
+# diperbarui dari byte yang baru saja: hari yang tersentuh digabung ulang,
+# sisanya dipakai apa adanya.
+import hashlib
+import io
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from . import columnar, store
+from .data_loader import DATE_COLUMN, ROOT_DIR, _parse_csv, _signature, cari_file_data, load_sales_data
+
+BUCKET_DIR = ROOT_DIR / ".cache" / "timeseries"
+
+TANGGAL = "Tanggal"
+BUCKET_DIMENSIONS = ["Product", "Region"]
+BUCKET_MEASURES = ["Units Sold", "Total Sales", "Transaksi"]
+BUCKET_KEYS = [TANGGAL] + BUCKET_DIMENSIONS
+
+# Label widget -> frekuensi pandas
+FREKUENSI = {"Harian": "D", "Mingguan": "W", "Bulanan": "MS"}
+
+# Potongan byte terakhir CSV lama yang dicek untuk memastikan file hanya di-append
+_TAIL_BYTES = 64 * 1024
+
+
+def bucket_harian(df):
+    # Rangkum invoice (kolom Invoice Date, Product, Region, Units Sold, Total Sales)
+    data = pd.DataFrame({
+        TANGGAL: df[DATE_COLUMN].dt.normalize(),
+        "Product": df["Product"].astype("category"),
+        "Region": df["Region"].astype("category"),
+        "Units Sold": df["Units Sold"].astype("int64"),
+        "Total Sales": df["Total Sales"].astype("float64"),
+        "Transaksi": np.ones(len(df), dtype="int64"),
+    })
+    # Invoice tanpa tanggal valid tidak punya bucket
+    data = data[data[TANGGAL].notna()]
+    return _rapikan(data)
+
+
+def _rapikan(data):
+    # Regroup per kunci bucket, urut berdasarkan tanggal, dimensi jadi category
+    # (kategori diurutkan alfabetis supaya urutan baris sama dari sumber mana pun)
+    hasil = data.groupby(BUCKET_KEYS, sort=False, observed=True)[BUCKET_MEASURES].sum().reset_index()
+    for col in BUCKET_DIMENSIONS:
+        hasil[col] = hasil[col].astype(str).astype("category")
+    return hasil.sort_values(BUCKET_KEYS, kind="stable", ignore_index=True)
+
+
+def gabung_bucket(buckets, baru):
+    # Tambahkan bucket dari invoice baru; hanya hari yang tersentuh yang di-regroup
+    if baru.empty:
+        return buckets
+    as_str = {col: str for col in BUCKET_DIMENSIONS}
+    lama = buckets.astype(as_str)
+    tersentuh = lama[TANGGAL].isin(baru[TANGGAL].unique()).to_numpy()
+    merged = pd.concat([lama[tersentuh], baru.astype(as_str)], ignore_index=True)
+    merged = merged.groupby(BUCKET_KEYS)[BUCKET_MEASURES].sum().reset_index()
+    hasil = pd.concat([lama[~tersentuh], merged], ignore_index=True)
+    hasil = hasil.sort_values(BUCKET_KEYS, kind="stable", ignore_index=True)
+    for col in BUCKET_DIMENSIONS:
+        hasil[col] = hasil[col].astype("category")
+    return hasil
+
+
+def produk_cocok(buckets, query):
+    # Nama produk yang mengandung kata kunci (semantik sama dengan ProductIndex.search)
+    query = query.lower()
+    return [name for name in buckets["Product"].cat.categories if query in name.lower()]
+
+
+# =========================
+# PENYIMPANAN + UPDATE INCREMENTAL
+# =========================
+def _bucket_path(path):
+    tag = hashlib.blake2b(str(path).encode(), digest_size=8).hexdigest()
+    return BUCKET_DIR / f"{Path(path).stem}-{tag}.parquet"
+
+
+def _tail_hash(path, size):
+    # Hash potongan terakhir [size - _TAIL_BYTES, size) dari file
+    with open(path, "rb") as f:
+        f.seek(max(0, size - _TAIL_BYTES))
+        return hashlib.blake2b(f.read(min(size, _TAIL_BYTES))).hexdigest()
+
+
+def _baca_tambahan(path, old_size):
+    # Parse hanya baris yang ditambahkan setelah old_size (header diambil dari baris pertama)
+    with open(path, "rb") as f:
+        header = f.readline()
+        f.seek(old_size)
+        tambahan = f.read()
+    columns = [DATE_COLUMN, "Product", "Region", "Units Sold", "Total Sales"]
+    return _parse_csv(io.BytesIO(header + tambahan), columns)
+
+
+def _bisa_append(path, meta):
+    # True kalau file sekarang = file lama + baris tambahan
+    if columnar.is_parquet(path) or not meta:
+        return False
+    old_size = meta.get("size", 0)
+    if not 0 < old_size < Path(path).stat().st_size:
+        return False
+    with open(path, "rb") as f:
+        f.seek(old_size - 1)
+        if f.read(1) != b"\n":
+            return False
+    return _tail_hash(path, old_size) == meta.get("tail")
+
+
+@lru_cache(maxsize=4)
+def _buckets_cached(path, mtime_ns, size):
+    if store.is_store(path):
+        # Bucket per partisi bulan sudah dihitung saat ingest (urut per partisi)
+        return store.baca_agg(path, "harian")
+
+    bucket_file = _bucket_path(path)
+    meta = columnar.baca_meta(bucket_file)
+    sumber = {"mtime_ns": mtime_ns, "size": size}
+
+    if meta and {k: meta.get(k) for k in sumber} == sumber:
+        return columnar.baca_sidecar(bucket_file)
+
+    if _bisa_append(path, meta):
+        buckets = gabung_bucket(columnar.baca_sidecar(bucket_file), bucket_harian(_baca_tambahan(path, meta["size"])))
+    else:
+        columns = [DATE_COLUMN, "Product", "Region", "Units Sold", "Total Sales"]
+        buckets = bucket_harian(load_sales_data(path, columns=columns))
+
+    if columnar.tersedia():
+        columnar.tulis_parquet(buckets, bucket_file, dict(sumber, tail=_tail_hash(path, size)))
+    return buckets
+
+
+def load_time_buckets(path=None):
+    # Bucket harian untuk file data (cache per versi file; read-only)
+    path = Path(path) if path else cari_file_data()
+    return _buckets_cached(*_signature(path.resolve()))
+
+
+# =========================
+# QUERY DI ATAS BUCKET
+# =========================
+def filter_buckets(buckets, start=None, end=None, products=None):
+    # Rentang tanggal (inklusif) lewat searchsorted karena bucket urut per tanggal
+    tanggal = buckets[TANGGAL].to_numpy()
+    lo = 0 if start is None else np.searchsorted(tanggal, np.datetime64(pd.Timestamp(start)), "left")
+    hi = len(tanggal) if end is None else np.searchsorted(tanggal, np.datetime64(pd.Timestamp(end)), "right")
+    data = buckets.iloc[lo:hi]
+    if products is not None:
+        data = data[data["Product"].isin(products).to_numpy()]
+    return data
+
+
+def tren(buckets, freq="D", by=None, measure="Total Sales"):
+    # Total per periode (kolom = nilai `by`, atau satu kolom measure); periode kosong = 0
+    if buckets.empty:
+        return pd.DataFrame()
+    keys = [pd.Grouper(key=TANGGAL, freq=freq)] + ([by] if by else [])
+    hasil = buckets.groupby(keys, observed=True)[measure].sum()
+    hasil = hasil.unstack(by, fill_value=0) if by else hasil.to_frame()
+    return hasil.asfreq(freq, fill_value=0)
+
+
+def rolling_mean(tren_df, window):
+    # Rolling average per kolom (per produk / wilayah kalau tren dipecah `by`)
+    return tren_df.rolling(window, min_periods=1).mean()
+
+
+def yoy(buckets, tahun=(2020, 2021), measure="Total Sales"):
+    # Total bulanan per tahun + pertumbuhan (%) tahun terakhir vs tahun pertama
+    tanggal = buckets[TANGGAL].dt
+    bulanan = buckets.groupby([tanggal.month.rename("Bulan"), tanggal.year.rename("Tahun")])[measure].sum()
+    bulanan = bulanan.unstack("Tahun").reindex(index=range(1, 13), columns=list(tahun)).fillna(0)
+    awal, akhir = bulanan[tahun[0]], bulanan[tahun[-1]]
+    bulanan["YoY %"] = (akhir / awal.where(awal != 0) - 1) * 100
+    return bulanan
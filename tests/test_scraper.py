@@ -0,0 +1,121 @@
+# ==========================================
+# TEST: ENGINE SCRAPING (nike_analytics/scraper.py) VS SERVER LOKAL
+# ==========================================
+# Memakai server pengganti nike.com yang sama dengan benchmarks/bench_scraper.py
+# (fixture HTML tersimpan, tanpa jaringan). Jalankan dari root repo:
+#   python -m pytest -q tests
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+import requests
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from benchmarks.bench_scraper import StandIn, serve
+from nike_analytics.scrape_cache import ScrapeCache
+from nike_analytics.scraper import COLUMNS, iter_scrape_batches
+
+PAGES = 3
+PRODUK_PER_HALAMAN = 24  # jumlah kartu produk di fixture
+
+
+@pytest.fixture
+def standin():
+    return StandIn(PAGES, delay=0, slow_pages=[], slow=0, fail_pages=[], fail_times=0)
+
+
+@pytest.fixture
+def base_url(standin):
+    server = serve(standin)
+    yield f"http://127.0.0.1:{server.server_address[1]}/w/mens-shoes"
+    server.shutdown()
+
+
+def scrape(base_url, **kwargs):
+    # Return (frame semua batch, {halaman: error})
+    batches, errors = [], {}
+    for page, batch, error in iter_scrape_batches(PAGES, base_url, rate=None, **kwargs):
+        batches.append(batch)
+        if error:
+            errors[page] = error
+    return pd.concat(batches, ignore_index=True), errors
+
+
+def status_per_halaman(standin, page):
+    return [status for mulai, _, p, status in sorted(standin.log) if p == page]
+
+
+def test_produk_semua_halaman(standin, base_url):
+    df, errors = scrape(base_url)
+    assert errors == {}
+    assert list(df.columns) == COLUMNS
+    assert len(df) == PAGES * PRODUK_PER_HALAMAN
+    assert df["Link"].is_unique
+    assert df["Nama"].notna().all()
+    # tiap halaman diminta tepat sekali
+    assert sorted(page for _, _, page, _ in standin.log) == list(range(PAGES))
+
+
+def test_link_duplikat_antar_halaman_dibuang(standin, base_url):
+    # semua halaman berisi link yang sama -> hanya batch pertama yang tersisa
+    standin.link_unik = False
+    df, errors = scrape(base_url)
+    assert errors == {}
+    assert len(df) == PRODUK_PER_HALAMAN
+    assert df["Link"].is_unique
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_retry_status_sementara(standin, base_url, status):
+    standin.fail_pages, standin.fail_times, standin.fail_status = {1}, 2, status
+    standin.reset()
+    df, errors = scrape(base_url)
+    assert errors == {}
+    assert len(df) == PAGES * PRODUK_PER_HALAMAN
+    assert status_per_halaman(standin, 1) == [status, status, 200]
+
+
+def test_retry_habis_jadi_error_halaman(standin, base_url):
+    standin.fail_pages, standin.fail_times = {1}, 100
+    standin.reset()
+    df, errors = scrape(base_url)
+    assert set(errors) == {1}
+    assert len(df) == (PAGES - 1) * PRODUK_PER_HALAMAN
+
+
+def test_cache_304_memakai_produk_tersimpan(standin, base_url, tmp_path):
+    hasil = []
+    for _ in range(2):
+        cache = ScrapeCache(tmp_path / "cache.sqlite")
+        standin.reset()
+        try:
+            df, errors = scrape(base_url, cache=cache)
+            stats = dict(cache.stats)
+        finally:
+            cache.close()
+        assert errors == {}
+        hasil.append((df, stats, [status for _, _, _, status in standin.log]))
+
+    (pertama, stats_1, status_1), (kedua, stats_2, status_2) = hasil
+    assert status_1 == [200] * PAGES and stats_1["halaman_200"] == PAGES
+    assert stats_1["produk_baru"] == PAGES * PRODUK_PER_HALAMAN
+    # run kedua: semua halaman 304, produk dibaca dari cache lokal
+    assert status_2 == [304] * PAGES and stats_2["halaman_304"] == PAGES
+    assert stats_2["produk_baru"] == 0
+    kunci = ["Link", "Nama"]
+    assert (kedua.sort_values("Link")[kunci].reset_index(drop=True)
+            .equals(pertama.sort_values("Link")[kunci].reset_index(drop=True)))
+
+
+def test_304_tanpa_cache_jadi_error(standin, base_url):
+    # server menjawab 304 walau scraper tidak mengirim validator dari cache
+    session = requests.Session()
+    session.headers["If-None-Match"] = '"halaman-1-v1"'
+    try:
+        df, errors = scrape(base_url, session=session)
+    finally:
+        session.close()
+    assert set(errors) == {1}
+    assert "304" in errors[1]
+    assert len(df) == (PAGES - 1) * PRODUK_PER_HALAMAN